@@ -1,4 +1,6 @@
 import os
+import sys
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import timedelta
 
@@ -44,11 +46,15 @@ CUSTOM_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + CUSTOM_APPS
 
 MIDDLEWARE = [
+    'core.middleware.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -76,17 +82,147 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# DATABASE_POOL=1 이면 프로세스 단위 커넥션 풀(core.db.pool)을 쓰고, 아니면 CONN_MAX_AGE 동안 스레드별로 커넥션을 재사용한다.
+# 스레드가 계속 바뀌는 ASGI나 스레드 서버에서는 풀을 권장한다.
+DATABASE_POOL = os.environ.get('DATABASE_POOL', '').lower() in ('1', 'true', 'yes')
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': 'core.db.backends.mysql' if DATABASE_POOL else 'django.db.backends.mysql',
         'NAME': os.environ.get('DATABASE_NAME'),
         'USER': os.environ.get('DATABASE_USER'),
         'PASSWORD': os.environ.get('DATABASE_PASSWORD'),
         'HOST': os.environ.get('DATABASE_HOST'),
         'PORT': os.environ.get('DATABASE_PORT'),
+        'CONN_MAX_AGE': 0 if DATABASE_POOL else int(os.environ.get('DATABASE_CONN_MAX_AGE', 60)),
+        # 재사용하기 전에 커넥션이 살아있는지 확인한다. (MySQL wait_timeout, 장애 조치 후 끊긴 커넥션)
+        'CONN_HEALTH_CHECKS': True,
+        'POOL': {
+            'MIN_SIZE': int(os.environ.get('DATABASE_POOL_MIN_SIZE', 2)),
+            'MAX_SIZE': int(os.environ.get('DATABASE_POOL_MAX_SIZE', 10)),
+            'TIMEOUT': float(os.environ.get('DATABASE_POOL_TIMEOUT', 10)),
+            'RECYCLE': int(os.environ.get('DATABASE_POOL_RECYCLE', 3600)),
+        },
     }
 }
 
+# 읽기 전용 레플리카. DATABASE_REPLICA_HOSTS=host1,host2 처럼 주면 default와 같은 설정에 HOST만 바꿔서 추가한다.
+# 테스트에서는 레플리카가 default를 그대로 쓴다. (MIRROR) 레플리카에는 마이그레이션하지 않으므로,
+# 로컬에서 SQLite 두 개로 확인할 때는 마이그레이션한 프라이머리 파일을 복사해서 레플리카로 쓴다.
+DATABASE_REPLICAS = []
+for index, host in enumerate(filter(None, os.environ.get('DATABASE_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica{index}'] = {**DATABASES['default'], 'HOST': host.strip(), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+# 쓰기 요청 이후 이 시간(초) 동안은 같은 클라이언트의 읽기를 프라이머리로 보낸다. (복제 지연보다 길게)
+# 응답 캐시를 무효화한 뒤 이 시간 동안은 레플리카에서 읽은 응답을 캐시하지 않는다.
+REPLICA_STICKY_COOKIE = 'db_primary'
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# 기본은 로컬 메모리 캐시. 파일 캐시를 쓰려면 CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache,
+# CACHE_LOCATION=/var/tmp/django_cache 처럼 환경변수로 지정한다.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'board'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 10000)),
+        },
+    },
+    # 조회수 버퍼 전용 캐시. 응답 캐시처럼 항목을 밀어내면(cull) 쌓인 조회수를 잃으므로 따로 두고 밀어내지 않는다.
+    # 기본은 프로세스마다 버퍼를 갖고 각자 flush 한다. 여러 프로세스가 버퍼를 공유하려면 원자적 incr을 지원하는 백엔드를
+    # VIEW_COUNT_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache,
+    # VIEW_COUNT_CACHE_LOCATION=redis://127.0.0.1:6379/1 처럼 지정한다. (maxmemory-policy는 noeviction)
+    'view_counts': {
+        'BACKEND': os.environ.get('VIEW_COUNT_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('VIEW_COUNT_CACHE_LOCATION', 'view_counts'),
+        'TIMEOUT': None,
+    },
+}
+if CACHES['view_counts']['BACKEND'].endswith('.LocMemCache'):
+    CACHES['view_counts']['OPTIONS'] = {'MAX_ENTRIES': sys.maxsize}
+
+# 게시글 목록 한 페이지의 최대 게시글 수 (limit)
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 1000))
+
+# 게시글 목록 응답 캐시 유지 시간(초)
+POST_LIST_CACHE_TIMEOUT = int(os.environ.get('POST_LIST_CACHE_TIMEOUT', 60))
+
+# 게시글 상세 응답 캐시 유지 시간(초)
+POST_DETAIL_CACHE_TIMEOUT = int(os.environ.get('POST_DETAIL_CACHE_TIMEOUT', 300))
+
+# 조회수 버퍼(CACHES['view_counts'])에 쌓인 조회수를 DB에 반영하는 주기(초).
+# 0이면 서버 프로세스에서 flush 스레드를 띄우지 않는다. (공유 버퍼를 크론의 flush_view_counts로 비우는 경우)
+# flush 후 0이 된 증가분 키는 VIEW_COUNT_SETTLED_TIMEOUT초 뒤에 지워진다. (flush 주기보다 충분히 길게)
+VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get('VIEW_COUNT_FLUSH_INTERVAL', 10))
+VIEW_COUNT_SETTLED_TIMEOUT = int(os.environ.get('VIEW_COUNT_SETTLED_TIMEOUT', 3600))
+
+# 게시글 일괄 생성 API에서 한 번에 받을 수 있는 최대 게시글 수
+POST_BATCH_CREATE_MAX_SIZE = int(os.environ.get('POST_BATCH_CREATE_MAX_SIZE', 500))
+
+# 게시글 일괄 삭제/복구시 한 번의 UPDATE로 바꿀 최대 게시글 수
+POST_BULK_UPDATE_CHUNK_SIZE = int(os.environ.get('POST_BULK_UPDATE_CHUNK_SIZE', 1000))
+
+# 게시글 내보내기시 한 번에 읽을 게시글 수
+POST_EXPORT_CHUNK_SIZE = int(os.environ.get('POST_EXPORT_CHUNK_SIZE', 2000))
+
+# 이 크기(바이트)보다 작은 응답은 압축하지 않는다.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+# 이미 압축된 형식이라 다시 압축하지 않는 Content-Type (앞부분 일치)
+COMPRESSION_EXCLUDED_TYPES = (
+    'image/',
+    'video/',
+    'audio/',
+    'application/zip',
+    'application/gzip',
+    'application/x-gzip',
+    'application/zstd',
+)
+
+# 캐시되는 응답(ETag 있음)의 압축 결과를 캐시에 유지하는 시간(초)
+COMPRESSION_CACHE_TIMEOUT = int(os.environ.get('COMPRESSION_CACHE_TIMEOUT', 300))
+
+# 쿼리 수/DB 시간을 재서 Server-Timing 헤더와 로그로 남길 요청 비율 (DEBUG면 모든 요청)
+REQUEST_METRICS_SAMPLE_RATE = float(os.environ.get('REQUEST_METRICS_SAMPLE_RATE', 0.01))
+
+# 한 요청에서 같은 SQL이 이 횟수 이상 반복되면 N+1 의심 쿼리로 경고 로그를 남긴다.
+N_PLUS_ONE_THRESHOLD = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 3))
+
+# X-Profile 헤더로 요청한 프로파일(cProfile/tracemalloc)을 저장할 디렉터리
+PROFILING_DIR = os.environ.get('PROFILING_DIR', BASE_DIR / 'profiles')
+
+# `manage.py profiles sign <path>`로 만든 X-Profile 헤더 값의 유효 시간(초)
+PROFILING_SIGNATURE_MAX_AGE = int(os.environ.get('PROFILING_SIGNATURE_MAX_AGE', 600))
+
+# PROFILING_DIR에 남겨둘 프로파일 수. 넘으면 저장할 때 오래된 프로파일부터 지운다.
+PROFILING_MAX_FILES = int(os.environ.get('PROFILING_MAX_FILES', 200))
+
+# memory 모드에서 할당마다 기록할 스택 깊이
+PROFILING_TRACEMALLOC_FRAMES = int(os.environ.get('PROFILING_TRACEMALLOC_FRAMES', 10))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'core.metrics': {
+            'handlers': ['console'],
+            'level': os.environ.get('REQUEST_METRICS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -135,10 +271,28 @@ AUTH_USER_MODEL = 'core.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
+    ],
+    # orjson이 있으면 orjson으로 JSON을 읽고 쓴다. (없으면 DRF 기본 인코더)
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
+# msgpack이 설치되어 있으면 Accept/Content-Type: application/msgpack 을 지원한다.
+if find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('core.renderers.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('core.parsers.MessagePackParser')
+
+# JWT 인증시 토큰의 user_id로 찾은 유저를 캐시하는 시간(초). 유저 수정/탈퇴시에는 바로 지운다.
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', 60))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
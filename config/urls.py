@@ -6,4 +6,5 @@ urlpatterns = [
     path('admin', admin.site.urls),
     path('api/v1/users', include('users.urls')),
     path('api/v1/posts', include('posts.urls')),
+    path('api/v1/health', include('core.urls')),
 ]
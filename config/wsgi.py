@@ -14,3 +14,13 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# 요청을 받기 전에 DB 커넥션 풀을 미리 채운다. (DATABASE_POOL을 쓸 때만)
+from core.db.pool import warm_pools  # noqa: E402
+
+warm_pools()
+
+# 캐시에 쌓인 조회수를 주기적으로, 그리고 프로세스 종료시 DB에 반영한다.
+from posts.view_counts import start_flusher  # noqa: E402
+
+start_flusher()
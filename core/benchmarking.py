@@ -0,0 +1,63 @@
+"""
+벤치마크 커맨드(bench, bench_asgi, bench_list_serializer)가 같이 쓰는 시간 측정/백분위수 계산.
+"""
+import statistics
+import time
+
+
+def percentile(sorted_values, p):
+    """
+    정렬된 값들의 p 백분위수. (선형 보간)
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def timed(func, *args, **kwargs):
+    """
+    func를 한 번 실행하는 함수.
+
+    :return: (걸린 시간(초), 반환값)
+    """
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def run_timed(func, repeat, warmup=0):
+    """
+    func를 warmup번 실행해서 버린 뒤, repeat번 실행하면서 호출마다 걸린 시간을 재는 함수.
+
+    :return: (전체 걸린 시간(초), 호출별 걸린 시간(초) 목록, 호출별 반환값 목록)
+    """
+    for _ in range(warmup):
+        func()
+
+    timings, results = [], []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        elapsed, result = timed(func)
+        timings.append(elapsed)
+        results.append(result)
+    return time.perf_counter() - started, timings, results
+
+
+def summarize(timings, elapsed=None):
+    """
+    호출별 걸린 시간(초)으로 평균/p50/p95/p99/최대(ms)를 만드는 함수. elapsed(초)가 있으면 초당 처리량도 넣는다.
+    """
+    timings = sorted(timings)
+    summary = {
+        'mean_ms': round(statistics.fmean(timings) * 1000, 3),
+        'p50_ms': round(percentile(timings, 50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 95) * 1000, 3),
+        'p99_ms': round(percentile(timings, 99) * 1000, 3),
+        'max_ms': round(timings[-1] * 1000, 3),
+    }
+    if elapsed is not None:
+        summary['throughput'] = round(len(timings) / elapsed, 1)
+    return summary
@@ -0,0 +1,50 @@
+from django.db.backends.mysql import base
+
+from core.db.pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    커넥션을 매번 새로 열고 닫는 대신 프로세스 단위 커넥션 풀(core.db.pool)에서 빌리고 반납하는 MySQL 백엔드.
+
+    스레드가 계속 바뀌는 ASGI(sync_to_async)나 스레드 서버에서는 CONN_MAX_AGE로 유지한 커넥션이 스레드마다 따로 남으므로,
+    풀을 쓰고 CONN_MAX_AGE는 0으로 둔다. (요청이 끝나면 커넥션을 풀에 반납)
+
+    DATABASES[alias]['POOL']: MIN_SIZE, MAX_SIZE, TIMEOUT, RECYCLE, HEALTH_CHECK_AFTER
+    """
+    pooled = True
+
+    def get_new_connection(self, conn_params):
+        options = self.settings_dict.get('POOL', {})
+        pool = get_pool(
+            self.alias,
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            validate=self._ping,
+            min_size=options.get('MIN_SIZE', 0),
+            max_size=options.get('MAX_SIZE', 10),
+            timeout=options.get('TIMEOUT', 10),
+            recycle=options.get('RECYCLE', 3600),
+            health_check_after=options.get('HEALTH_CHECK_AFTER', 30),
+        )
+        return pool.acquire()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # 트랜잭션 도중이거나 에러가 났던 커넥션은 다음 요청에 넘기지 않는다.
+        discard = self.errors_occurred
+        if not discard and (self.in_atomic_block or not self.get_autocommit()):
+            try:
+                with self.wrap_database_errors:
+                    self.connection.rollback()
+            except base.Database.Error:
+                discard = True
+        get_pool(self.alias).release(self.connection, discard=discard)
+
+    @staticmethod
+    def _ping(connection):
+        try:
+            connection.ping()
+        except base.Database.Error:
+            return False
+        return True
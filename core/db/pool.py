@@ -0,0 +1,219 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import DatabaseError, connections
+
+
+logger = logging.getLogger(__name__)
+
+_pools = {}
+_pools_pid = os.getpid()
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    프로세스 안의 스레드/async 요청이 함께 쓰는 DB 커넥션 풀.
+
+    - 최대 max_size 개까지 열고, 모두 사용 중이면 timeout 초까지 반납을 기다린다.
+    - 가장 최근에 반납된 커넥션부터 다시 쓰고(LIFO), health_check_after 초 이상 쉬던 커넥션은 꺼내기 전에 확인한다.
+    - recycle 초보다 오래된 커넥션은 닫고 새로 연다. (MySQL wait_timeout 대비)
+    """
+
+    def __init__(self, connect, validate=None, close=None, min_size=0, max_size=10, timeout=10,
+                 recycle=3600, health_check_after=30):
+        self._connect = connect
+        self._validate = validate or (lambda conn: True)
+        self._close = close or (lambda conn: conn.close())
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.health_check_after = health_check_after
+
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._created = {}
+        self._open = 0
+        self._in_use = 0
+
+        self._waits = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._open >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(f'{self.timeout}초 동안 사용할 수 있는 DB 커넥션이 없습니다.')
+                    self._cond.wait(remaining)
+                entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    self._open += 1
+                self._in_use += 1
+
+            if entry is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    self._forget()
+                    raise
+                created = time.monotonic()
+            else:
+                conn, created, released = entry
+                now = time.monotonic()
+                if self._expired(created, now) or (
+                    now - released > self.health_check_after and not self._validate(conn)
+                ):
+                    self._discard(conn)
+                    continue
+
+            with self._cond:
+                self._created[id(conn)] = created
+                waited = time.monotonic() - started
+                if waited > 0.001:
+                    self._waits += 1
+                    self._wait_time_total += waited
+                    self._wait_time_max = max(self._wait_time_max, waited)
+            return conn
+
+    def release(self, conn, discard=False):
+        with self._cond:
+            created = self._created.pop(id(conn), None)
+            if created is None:
+                return
+            self._in_use -= 1
+            now = time.monotonic()
+            if not discard and not self._expired(created, now):
+                self._idle.append((conn, created, now))
+                self._cond.notify()
+                return
+        self._discard(conn, in_use=False)
+
+    def warm(self):
+        """
+        min_size 개까지 미리 열어두는 메서드.
+
+        :return: 새로 연 커넥션 수
+        """
+        with self._cond:
+            opened = self._open
+        conns = []
+        try:
+            while True:
+                with self._cond:
+                    if self._open >= min(self.min_size, self.max_size):
+                        break
+                conns.append(self.acquire())
+        finally:
+            for conn in conns:
+                self.release(conn)
+        with self._cond:
+            return self._open - opened
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'max_size': self.max_size,
+                'waits': self._waits,
+                'wait_time_total': round(self._wait_time_total, 6),
+                'wait_time_max': round(self._wait_time_max, 6),
+                'timeouts': self._timeouts,
+            }
+
+    def _expired(self, created, now):
+        return bool(self.recycle) and now - created > self.recycle
+
+    def _forget(self):
+        with self._cond:
+            self._open -= 1
+            self._in_use -= 1
+            self._cond.notify()
+
+    def _discard(self, conn, in_use=True):
+        with self._cond:
+            self._open -= 1
+            if in_use:
+                self._in_use -= 1
+            self._cond.notify()
+        self._close_quietly(conn)
+
+    def _close_quietly(self, conn):
+        try:
+            self._close(conn)
+        except Exception:
+            logger.warning('failed to close a pooled connection', exc_info=True)
+
+
+def get_pool(alias, **kwargs):
+    """
+    DB alias별 커넥션 풀을 가져오는 함수. 없으면 kwargs로 만든다.
+    fork된 워커 프로세스(gunicorn --preload 등)는 부모의 커넥션을 같이 쓰면 안 되므로 풀을 새로 만든다.
+    """
+    global _pools_pid
+    if _pools_pid != os.getpid():
+        with _pools_lock:
+            if _pools_pid != os.getpid():
+                _pools.clear()
+                _pools_pid = os.getpid()
+    pool = _pools.get(alias)
+    if pool is None and kwargs:
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None:
+                pool = _pools[alias] = ConnectionPool(**kwargs)
+    return pool
+
+
+def pool_stats():
+    """
+    이 프로세스의 DB alias별 커넥션 풀 통계.
+    """
+    return {alias: pool.stats() for alias, pool in _pools.items()}
+
+
+def warm_pools():
+    """
+    커넥션 풀을 쓰는 DB마다 min_size 개의 커넥션을 미리 열어두는 함수. (서버가 요청을 받기 전에 호출)
+    연결에 실패한 DB는 경고만 남기고 건너뛴다. (첫 요청에서 다시 연결을 시도한다)
+
+    :return: {alias: 열려 있는 커넥션 수}
+    """
+    warmed = {}
+    for alias in connections:
+        connection = connections[alias]
+        if not getattr(connection, 'pooled', False):
+            continue
+        try:
+            connection.ensure_connection()
+            connection.close()
+            pool = get_pool(alias)
+            pool.warm()
+        except (DatabaseError, PoolTimeout):
+            logger.warning('failed to warm the connection pool of %s', alias, exc_info=True)
+            continue
+        warmed[alias] = pool.stats()['open']
+    return warmed
@@ -0,0 +1,156 @@
+import json
+import platform
+import random
+import statistics
+import time
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.benchmarking import run_timed, summarize
+from core.metrics import collect_metrics
+from core.models import Post
+from core.seeding import SEED_PASSWORD, WORDS, seed_board
+
+
+# 조회수 버퍼는 캐시 종류와 상관없이 항상 따로 둔다. (DummyCache로는 조회수를 쌓을 수 없다)
+VIEW_COUNT_CACHE = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench-views'}
+CACHES = {
+    'locmem': {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench'},
+        'view_counts': VIEW_COUNT_CACHE,
+    },
+    'dummy': {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'view_counts': VIEW_COUNT_CACHE,
+    },
+}
+
+
+class Command(BaseCommand):
+    """
+    API 엔드포인트를 프로세스 안에서(Django test Client, 미들웨어 포함) 호출해서
+    시나리오별 p50/p95/p99 응답 시간, 요청당 쿼리 수/DB 시간, 처리량을 JSON으로 출력하는 커스텀 커맨드.
+
+    - 데이터(유저/게시글, 탈퇴 유저/삭제 글 비율)는 --seed로 재현 가능하게 만들고, 끝나면 트랜잭션을 롤백해서 남기지 않는다.
+    - 캐시는 설정과 상관없이 비어 있는 로컬 메모리 캐시(--cache=dummy면 캐시 없음)를 쓴다.
+    - 기존 데이터도 결과에 영향을 주므로, 두 결과를 비교할 때는 빈 DB에서 같은 옵션으로 실행한다.
+    """
+    help = 'Benchmark the API endpoints in-process and print latency percentiles as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--posts', type=int, default=5000)
+        parser.add_argument('--deleted-users', type=float, default=0.05, help='탈퇴한 유저 비율')
+        parser.add_argument('--deleted-posts', type=float, default=0.1, help='삭제된 게시글 비율')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--requests', type=int, default=200, help='시나리오별 요청 수')
+        parser.add_argument('--warmup', type=int, default=10, help='측정 전에 버리는 요청 수')
+        parser.add_argument('--cache', choices=sorted(CACHES), default='locmem')
+        parser.add_argument('--scenario', action='append', dest='scenarios', help='실행할 시나리오 (여러 번 지정 가능)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (없으면 표준 출력)')
+
+    def handle(self, *args, **options):
+        scenarios = self.get_scenarios()
+        names = options['scenarios'] or list(scenarios)
+        unknown = set(names) - set(scenarios)
+        if unknown:
+            raise CommandError(f'없는 시나리오입니다: {", ".join(sorted(unknown))} (가능: {", ".join(scenarios)})')
+        if options['requests'] < 1:
+            raise CommandError('--requests는 1 이상이어야 합니다.')
+
+        overrides = {
+            'CACHES': CACHES[options['cache']],
+            'DATABASE_REPLICAS': [],
+            'DEBUG': False,
+            'REQUEST_METRICS_SAMPLE_RATE': 0,
+            'ALLOWED_HOSTS': ['*'],
+        }
+        with override_settings(**overrides), transaction.atomic():
+            started = time.perf_counter()
+            users = seed_board(
+                users=options['users'], posts=options['posts'], deleted_users=options['deleted_users'],
+                deleted_posts=options['deleted_posts'], seed=options['seed'],
+            )
+            seed_time = time.perf_counter() - started
+            if not any(not is_deleted for _, _, is_deleted in users):
+                raise CommandError('탈퇴하지 않은 유저가 없습니다. --users/--deleted-users를 확인해주세요.')
+
+            self.rng = random.Random(options['seed'])
+            self.emails = [email for _, email, is_deleted in users if not is_deleted]
+            self.post_ids = list(Post.objects.filter(is_deleted=False, user_id__in=[user_id for user_id, _, _ in users])
+                                             .values_list('pk', flat=True))
+            self.live_posts = Post.objects.filter(is_deleted=False).count()
+            client = Client()
+            results = {
+                name: self.run_scenario(name, client, scenarios[name], options['requests'], options['warmup'])
+                for name in names
+            }
+            transaction.set_rollback(True)
+
+        report = {
+            'dataset': {
+                'users': options['users'],
+                'posts': options['posts'],
+                'deleted_users': options['deleted_users'],
+                'deleted_posts': options['deleted_posts'],
+                'seed': options['seed'],
+                'seed_seconds': round(seed_time, 3),
+            },
+            'environment': {
+                'database': connection.vendor,
+                'cache': options['cache'],
+                'python': platform.python_version(),
+                'django': django.get_version(),
+            },
+            'requests': options['requests'],
+            'scenarios': results,
+        }
+        output = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output + '\n')
+            self.stderr.write(f'결과를 {options["output"]}에 저장했습니다.')
+        else:
+            self.stdout.write(output)
+
+    def get_scenarios(self):
+        """
+        {시나리오 이름: 요청 하나를 보내고 응답을 돌려주는 함수}
+        """
+        list_path = reverse('posts:list_and_create')
+        return {
+            'posts_list': lambda client: client.get(list_path),
+            'posts_list_offset': lambda client: client.get(
+                list_path, {'limit': 10, 'offset': self.rng.randrange(max(self.live_posts - 10, 1))}
+            ),
+            'posts_list_by_views': lambda client: client.get(list_path, {'ordering': '-view_count'}),
+            'posts_search': lambda client: client.get(list_path, {'q': self.rng.choice(WORDS)}),
+            'post_detail': lambda client: client.get(
+                reverse('posts:detail', kwargs={'pk': self.rng.choice(self.post_ids)})
+            ),
+            'users_signin': lambda client: client.post(
+                reverse('users:signin'),
+                {'email': self.rng.choice(self.emails), 'password': SEED_PASSWORD},
+                content_type='application/json',
+            ),
+        }
+
+    def run_scenario(self, name, client, send, requests, warmup):
+        self.stderr.write(f'{name} 측정 중...')
+
+        def send_with_metrics():
+            with collect_metrics() as metrics:
+                return send(client), metrics
+
+        elapsed, timings, results = run_timed(send_with_metrics, requests, warmup)
+        return {
+            **summarize(timings, elapsed),
+            'errors': sum(response.status_code >= 400 for response, _ in results),
+            'queries_per_request': round(statistics.fmean(metrics.query_count for _, metrics in results), 2),
+            'db_ms_per_request': round(statistics.fmean(metrics.db_time for _, metrics in results) * 1000, 3),
+        }
@@ -0,0 +1,157 @@
+import asyncio
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.benchmarking import timed, summarize
+from core.models import Post
+
+
+HOST = 'localhost'
+
+
+def _slow_query(delay):
+    """
+    쿼리마다 delay초를 기다리게 하는 execute wrapper. (느린 MySQL 응답 흉내)
+    """
+    def wrapper(execute, sql, params, many, context):
+        time.sleep(delay)
+        return execute(sql, params, many, context)
+    return wrapper
+
+
+class Command(BaseCommand):
+    """
+    한 프로세스에서 같은 게시글 목록 요청을 WSGI(동기 뷰, 스레드 N개)와 ASGI(async 뷰, 이벤트 루프 하나)로
+    동시에 보냈을 때의 처리량과 응답 시간을 비교하는 커스텀 커맨드.
+
+    캐시는 끄고(DummyCache) 쿼리마다 --db-latency 만큼 지연을 넣어서, DB를 기다리는 동안 워커가 막히는 정도를 본다.
+    요청 측정 로그가 결과를 흔들지 않도록 bench 커맨드처럼 DEBUG와 요청 메트릭 샘플링은 끈다.
+    """
+    help = 'Compare per-process concurrency of the sync (WSGI) and async (ASGI) post list views'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--threads', type=int, default=4, help='WSGI 프로세스의 스레드 수 (gunicorn --threads)')
+        parser.add_argument('--concurrency', type=int, default=50, help='동시에 보내는 요청 수')
+        parser.add_argument('--db-latency', type=float, default=20, help='쿼리마다 넣을 지연(ms)')
+
+    def handle(self, *args, **options):
+        if not Post.objects.filter(is_deleted=False).exists():
+            raise CommandError('게시글이 없습니다. 먼저 데이터를 넣어주세요.')
+
+        slow_query = _slow_query(options['db_latency'] / 1000)
+
+        def add_latency(sender, connection, **kwargs):
+            # 같은 DatabaseWrapper로 다시 연결할 때 wrapper가 쌓이지 않도록 한 번만 넣는다.
+            if slow_query not in connection.execute_wrappers:
+                connection.execute_wrappers.append(slow_query)
+
+        caches = {
+            'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+            'view_counts': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'bench-views'},
+        }
+        connection_created.connect(add_latency)
+        try:
+            overrides = {
+                'CACHES': caches,
+                'DATABASE_REPLICAS': [],
+                'DEBUG': False,
+                'REQUEST_METRICS_SAMPLE_RATE': 0,
+                'ALLOWED_HOSTS': ['*'],
+                'VIEW_COUNT_FLUSH_INTERVAL': 0,
+            }
+            with override_settings(**overrides):
+                results = [
+                    ('WSGI (sync)', options['threads'], self.run_wsgi(options)),
+                    ('ASGI (async)', options['concurrency'], self.run_asgi(options)),
+                ]
+        finally:
+            connection_created.disconnect(add_latency)
+
+        self.stdout.write(f'{"mode":<14} {"workers":>7} {"req/s":>8} {"p50":>9} {"p95":>9}')
+        for name, workers, (elapsed, timings) in results:
+            summary = summarize(timings, elapsed)
+            self.stdout.write(
+                f'{name:<14} {workers:>7} {summary["throughput"]:>8.1f} '
+                f'{summary["p50_ms"]:>7.1f}ms {summary["p95_ms"]:>7.1f}ms'
+            )
+
+    def run_wsgi(self, options):
+        application = get_wsgi_application()
+        path = reverse('posts:list_and_create')
+
+        def request():
+            environ = {
+                'REQUEST_METHOD': 'GET',
+                'PATH_INFO': path,
+                'QUERY_STRING': '',
+                'SERVER_NAME': HOST,
+                'SERVER_PORT': '80',
+                'SERVER_PROTOCOL': 'HTTP/1.1',
+                'HTTP_HOST': HOST,
+                'wsgi.input': io.BytesIO(),
+                'wsgi.errors': sys.stderr,
+                'wsgi.url_scheme': 'http',
+            }
+            body = application(environ, lambda status, headers: None)
+            b''.join(body)
+            body.close()
+
+        def run():
+            with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+                return list(executor.map(lambda _: timed(request)[0], range(options['requests'])))
+
+        return timed(run)
+
+    def run_asgi(self, options):
+        application = get_asgi_application()
+        path = reverse('posts:async_list')
+
+        async def request():
+            scope = {
+                'type': 'http',
+                'asgi': {'version': '3.0'},
+                'http_version': '1.1',
+                'method': 'GET',
+                'scheme': 'http',
+                'path': path,
+                'raw_path': path.encode(),
+                'query_string': b'',
+                'root_path': '',
+                'headers': [(b'host', HOST.encode())],
+                'client': ('127.0.0.1', 0),
+                'server': (HOST, 80),
+            }
+            messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await asyncio.Event().wait()
+
+            async def send(message):
+                pass
+
+            started = time.perf_counter()
+            await application(scope, receive, send)
+            return time.perf_counter() - started
+
+        async def run():
+            semaphore = asyncio.Semaphore(options['concurrency'])
+
+            async def limited():
+                async with semaphore:
+                    return await request()
+
+            return await asyncio.gather(*[limited() for _ in range(options['requests'])])
+
+        return timed(asyncio.run, run())
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarking import run_timed, summarize
+from core.models import Post
+from posts.serializers import PostListSerializer, LIST_COLUMNS, serialize_post_list
+
+
+class Command(BaseCommand):
+    """
+    게시글 목록의 기존 방식(모델 인스턴스 + PostListSerializer)과
+    빠른 방식(values_list 튜플 + serialize_post_list)의 조회/직렬화 시간을 비교하는 커스텀 커맨드.
+    """
+    help = 'Compare PostListSerializer with the model-free list serialization path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100, help='한 페이지의 게시글 수')
+        parser.add_argument('--repeat', type=int, default=50)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        queryset = Post.objects.filter(is_deleted=False).order_by('-created_at', '-pk')
+        if not queryset.exists():
+            raise CommandError('게시글이 없습니다. 먼저 데이터를 넣어주세요.')
+
+        def serializer_path():
+            posts = queryset.select_related('user') \
+                            .only('title', 'user__name', 'user__is_deleted', 'view_count')[:rows]
+            return PostListSerializer(posts, many=True).data
+
+        def fast_path():
+            return serialize_post_list(queryset.values_list(*LIST_COLUMNS, named=True)[:rows])
+
+        if list(serializer_path()) != fast_path():
+            raise CommandError('두 방식의 결과가 다릅니다.')
+
+        results = {name: self.measure(func, repeat) for name, func in [
+            ('PostListSerializer', serializer_path),
+            ('serialize_post_list', fast_path),
+        ]}
+        for name, median_ms in results.items():
+            self.stdout.write(f'{name:<20} {median_ms:8.2f}ms / {rows}개')
+
+        speedup = results['PostListSerializer'] / results['serialize_post_list']
+        self.stdout.write(self.style.SUCCESS(f'{speedup:.1f}배 빠름'))
+
+    def measure(self, func, repeat):
+        """
+        :return: 중앙값(ms)
+        """
+        _, timings, _ = run_timed(func, repeat)
+        return summarize(timings)['p50_ms']
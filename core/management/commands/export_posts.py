@@ -0,0 +1,50 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import router
+from django.utils.dateparse import parse_datetime
+
+from core.models import Post
+from core.routers import use_replica
+from posts.exports import EXPORT_FORMATS, export_lines
+
+
+class Command(BaseCommand):
+    """
+    전체 게시글을 NDJSON/CSV로 내보내는 커스텀 커맨드. (분석용 야간 덤프)
+    레플리카가 있으면 레플리카에서 읽는다.
+    """
+    help = 'Stream all posts as NDJSON or CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', dest='export_format', choices=list(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--since', help='ISO 8601 datetime. 이후에 생성/수정/삭제된 게시글만 내보낸다.')
+        parser.add_argument('--output', help='파일 경로. 없으면 표준 출력.')
+        parser.add_argument('--chunk-size', type=int, default=settings.POST_EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        since = options['since']
+        if since:
+            since = parse_datetime(since)
+            if since is None:
+                raise CommandError('--since는 ISO 8601 형식이어야 합니다.')
+
+        with use_replica():
+            using = router.db_for_read(Post)
+        lines = export_lines(options['export_format'], since=since, chunk_size=options['chunk_size'], using=using)
+        started = time.monotonic()
+
+        written = 0
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                for line in lines:
+                    output.write(line)
+                    written += 1
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
+                written += 1
+
+        elapsed = time.monotonic() - started
+        self.stderr.write(self.style.SUCCESS(f'{written}줄 내보내기 완료! ({elapsed:.1f}초)'))
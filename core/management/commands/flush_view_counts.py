@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from posts.view_counts import flush_view_counts
+
+
+class Command(BaseCommand):
+    """
+    조회수 버퍼에 쌓인 게시글 조회수 증가분을 DB에 반영하는 커스텀 커맨드.
+    크론 등으로 주기적으로 실행하려면 CACHES['view_counts']가 서버 프로세스와 공유되는 백엔드(Redis 등)여야 한다.
+    """
+    help = 'Flush buffered post view counts to the database'
+
+    def handle(self, *args, **options):
+        flushed = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f'조회수 {flushed}건 반영 완료!'))
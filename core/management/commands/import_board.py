@@ -0,0 +1,265 @@
+import csv
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import timezone as dt_timezone
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import Post, ImportCheckpoint
+from posts.cache import bump_list_generation
+from posts.counters import sync_live_post_count
+
+
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y'}
+
+
+def read_records(path, file_format=None):
+    """
+    JSONL/CSV 파일을 한 줄씩 읽어서 (줄 번호, dict)로 돌려주는 제너레이터. 파일 전체를 메모리에 올리지 않는다.
+    """
+    file_format = file_format or ('csv' if path.endswith('.csv') else 'jsonl')
+    with open(path, encoding='utf-8', newline='') as file:
+        if file_format == 'csv':
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as exc:
+                    raise CommandError(f'{path}:{line_number} 줄을 가져올 수 없습니다. (JSON 형식 오류: {exc})')
+                if not isinstance(record, dict):
+                    raise CommandError(f'{path}:{line_number} 줄을 가져올 수 없습니다. (JSON 객체가 아닙니다)')
+                yield line_number, record
+
+
+def require(record, *fields):
+    """
+    필수 값이 비어 있으면 KeyError.
+    """
+    for field in fields:
+        if not record.get(field):
+            raise KeyError(field)
+
+
+@contextmanager
+def reading_line(path, line_number):
+    """
+    한 줄을 모델로 바꾸는 동안의 에러를 줄 번호가 붙은 CommandError로 바꾸는 컨텍스트 매니저.
+    """
+    try:
+        yield
+    except KeyError as exc:
+        raise CommandError(f'{path}:{line_number} 줄을 가져올 수 없습니다. ({exc.args[0]} 값이 없습니다)')
+    except (TypeError, ValueError) as exc:
+        raise CommandError(f'{path}:{line_number} 줄을 가져올 수 없습니다. ({exc})')
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def to_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or '').strip().lower() in TRUE_VALUES
+
+
+def to_datetime(value):
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+@contextmanager
+def preserve_timestamps(model):
+    """
+    auto_now/auto_now_add를 잠시 꺼서, 가져온 데이터의 작성/수정 시간을 그대로 넣을 수 있게 하는 컨텍스트 매니저.
+    """
+    fields = [field for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)
+              or getattr(field, 'auto_now_add', False)]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    """
+    기존 게시판의 유저/게시글을 대량으로 가져오는 커스텀 커맨드.
+
+    - 유저는 이메일 기준으로 이미 있으면 건너뛴다. (다시 실행해도 안전)
+    - 게시글은 배치마다 같은 트랜잭션에서 진행 위치(ImportCheckpoint)를 기록하고, 다시 실행하면 그 다음 줄부터 이어서 가져온다.
+      진행 위치는 파일 절대 경로별로 남고, 다 가져온 파일을 다시 가져오려면 --restart로 지운다.
+      작성자를 찾을 수 없어 건너뛴 게시글도 진행 위치에 포함되므로, 다시 실행해도 가져오지 않는다.
+    - 형식이 잘못된 줄(JSON 오류, 필수 값 누락)이 있으면 줄 번호와 함께 멈춘다. 고친 뒤 다시 실행하면 그 배치부터 이어서 가져온다.
+    - bulk_create는 시그널을 보내지 않으므로, 끝난 뒤 게시글 카운터를 한 번에 맞추고 필요하면 검색 색인을 다시 만든다.
+    """
+    help = (
+        'Bulk import users and posts from JSONL or CSV files. '
+        'Post import progress is checkpointed per absolute file path (core.ImportCheckpoint) '
+        'so an interrupted run resumes where it stopped; use --restart to import a file again from the top. '
+        'Posts skipped because their author does not exist count as done and are not retried.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', help='유저 파일 (email, name, password(해시), is_deleted, created_at)')
+        parser.add_argument('--posts', help='게시글 파일 (author_email, title, content, view_count, is_deleted, created_at, updated_at)')
+        parser.add_argument('--format', dest='file_format', choices=['jsonl', 'csv'], help='없으면 확장자로 판단')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--restart', action='store_true', help='진행 위치(ImportCheckpoint)를 지우고 게시글을 처음부터 가져온다.')
+        parser.add_argument('--reindex', action='store_true', help='가져온 뒤 검색 색인을 다시 만든다.')
+
+    def handle(self, *args, **options):
+        if not options['users'] and not options['posts']:
+            raise CommandError('--users 또는 --posts 중 하나는 필요합니다.')
+
+        self.batch_size = options['batch_size']
+        self.file_format = options['file_format']
+        self.emails = {}
+
+        if options['users']:
+            self.import_users(options['users'])
+        if options['posts']:
+            self.import_posts(options['posts'], restart=options['restart'])
+            sync_live_post_count()
+            bump_list_generation()
+            if options['reindex']:
+                call_command('rebuild_search_index', batch_size=self.batch_size, stdout=self.stdout)
+
+    def import_users(self, path):
+        User = get_user_model()
+        started = time.monotonic()
+        total = hashed = 0
+
+        for chunk in chunked(read_records(path, self.file_format), self.batch_size):
+            users = []
+            for line_number, record in chunk:
+                with reading_line(path, line_number):
+                    require(record, 'email')
+                    password = record.get('password') or None
+                    if password:
+                        try:
+                            identify_hasher(password)
+                        except ValueError:
+                            # 해시가 아닌 비밀번호는 어쩔 수 없이 여기서 해시한다. (느림)
+                            password = make_password(password)
+                            hashed += 1
+                    else:
+                        password = make_password(None)
+                    users.append(User(
+                        email=User.objects.normalize_email(record['email']),
+                        name=record.get('name') or record['email'].split('@')[0],
+                        password=password,
+                        is_deleted=to_bool(record.get('is_deleted')),
+                        created_at=to_datetime(record.get('created_at')) or timezone.now(),
+                        updated_at=to_datetime(record.get('updated_at')) or timezone.now(),
+                    ))
+
+            with preserve_timestamps(User), transaction.atomic():
+                User.objects.bulk_create(users, ignore_conflicts=True)
+
+            total += len(users)
+            self.report('유저', total, started)
+
+        if hashed:
+            self.stdout.write(self.style.WARNING(f'해시되지 않은 비밀번호 {hashed}개를 해시했습니다.'))
+        self.stdout.write(self.style.SUCCESS(f'유저 {total}명 가져오기 완료!'))
+
+    def import_posts(self, path, restart=False):
+        path = os.path.abspath(path)
+        key = hashlib.md5(path.encode()).hexdigest()
+        if restart:
+            ImportCheckpoint.objects.filter(key=key).delete()
+        checkpoint, _ = ImportCheckpoint.objects.get_or_create(key=key, defaults={'path': path})
+        done = checkpoint.position
+        if checkpoint.completed_at:
+            self.stdout.write(f'{checkpoint.completed_at:%Y-%m-%d %H:%M} 에 다 가져온 파일입니다. (--restart로 처음부터 다시 가져올 수 있습니다)')
+        elif done:
+            self.stdout.write(f'{done}번째 줄까지 가져왔던 기록이 있어 이어서 가져옵니다.')
+
+        started = time.monotonic()
+        total = done
+        skipped = []
+        records = islice(read_records(path, self.file_format), done, None)
+
+        for chunk in chunked(records, self.batch_size):
+            for line_number, record in chunk:
+                with reading_line(path, line_number):
+                    require(record, 'author_email', 'title', 'content')
+            self.resolve_authors({record['author_email'] for _, record in chunk})
+
+            posts = []
+            for line_number, record in chunk:
+                user_id = self.emails.get(get_user_model().objects.normalize_email(record['author_email']))
+                if user_id is None:
+                    skipped.append(line_number)
+                    continue
+                with reading_line(path, line_number):
+                    created_at = to_datetime(record.get('created_at')) or timezone.now()
+                    posts.append(Post(
+                        user_id=user_id,
+                        title=record['title'],
+                        content=record['content'],
+                        view_count=int(record.get('view_count') or 0),
+                        is_deleted=to_bool(record.get('is_deleted')),
+                        created_at=created_at,
+                        updated_at=to_datetime(record.get('updated_at')) or created_at,
+                    ))
+
+            with preserve_timestamps(Post), transaction.atomic():
+                Post.objects.bulk_create(posts)
+                ImportCheckpoint.objects.filter(key=key).update(position=F('position') + len(chunk))
+
+            total += len(chunk)
+            self.report('게시글', total - done, started)
+
+        ImportCheckpoint.objects.filter(key=key).update(completed_at=timezone.now())
+        if skipped:
+            lines = ', '.join(map(str, skipped[:20])) + (' ...' if len(skipped) > 20 else '')
+            self.stdout.write(self.style.WARNING(
+                f'작성자를 찾을 수 없는 게시글 {len(skipped)}개를 건너뛰었습니다. (줄: {lines})\n'
+                '건너뛴 줄도 진행 위치에 포함되어, 작성자를 가져온 뒤 다시 실행해도 가져오지 않습니다. '
+                '이 줄들만 따로 가져오거나 --restart로 처음부터 다시 가져와야 합니다. '
+                '(--restart는 이미 가져온 게시글도 다시 넣습니다)'
+            ))
+        self.stdout.write(self.style.SUCCESS(f'게시글 {total - done - len(skipped)}개 가져오기 완료!'))
+
+    def resolve_authors(self, emails):
+        """
+        아직 모르는 작성자 이메일만 한 번의 쿼리로 찾아서 email -> user_id 맵에 채우는 메서드.
+        """
+        User = get_user_model()
+        missing = {User.objects.normalize_email(email) for email in emails} - self.emails.keys()
+        if missing:
+            self.emails.update(User.objects.filter(email__in=missing).values_list('email', 'pk'))
+
+    def report(self, label, count, started):
+        elapsed = max(time.monotonic() - started, 1e-9)
+        self.stdout.write(f'{label} {count}개 처리 ({count / elapsed:,.0f}개/초)')
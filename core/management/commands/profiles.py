@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.profiling import MODES, PROFILE_HEADER, format_stats, list_profiles, load_profile, sign_mode
+
+
+class Command(BaseCommand):
+    """
+    ProfilingMiddleware가 저장한 요청 프로파일을 보는 커스텀 커맨드.
+
+    - list: 저장된 프로파일 목록 (최근 순)
+    - show <id>: cProfile 상위 항목과 (memory 모드면) 할당이 많은 코드 위치
+    - sign <path>: 운영자가 아닌 클라이언트가 path 요청 한 번에 쓸 수 있는 서명된 X-Profile 헤더 값
+    """
+    help = 'List and inspect stored request profiles'
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest='action', required=True)
+
+        list_parser = subparsers.add_parser('list')
+        list_parser.add_argument('--limit', type=int, default=20)
+
+        show_parser = subparsers.add_parser('show')
+        show_parser.add_argument('profile_id')
+        show_parser.add_argument('--limit', type=int, default=20, help='보여줄 함수/코드 위치 수')
+        show_parser.add_argument('--sort', default='cumulative', help='pstats 정렬 기준 (cumulative, tottime, calls...)')
+
+        sign_parser = subparsers.add_parser('sign')
+        sign_parser.add_argument('path', help='프로파일링할 요청 경로 (ex. /api/v1/posts)')
+        sign_parser.add_argument('--mode', choices=MODES, default='cpu')
+
+    def handle(self, *args, **options):
+        getattr(self, f'handle_{options["action"]}')(**options)
+
+    def handle_list(self, limit, **options):
+        profiles = list_profiles()[:limit]
+        if not profiles:
+            self.stdout.write('저장된 프로파일이 없습니다.')
+            return
+        self.stdout.write(f'{"id":<32} {"mode":<6} {"status":>6} {"total":>10}  path')
+        for summary in profiles:
+            self.stdout.write(
+                f'{summary["id"]:<32} {summary["mode"]:<6} {summary["status"]:>6} '
+                f'{summary["total_ms"]:>8.1f}ms  {summary["method"]} {summary["path"]}'
+            )
+
+    def handle_show(self, profile_id, limit, sort, **options):
+        try:
+            summary, stats_path, snapshot = load_profile(profile_id)
+        except FileNotFoundError:
+            raise CommandError(f'프로파일 {profile_id}이(가) 없습니다.')
+
+        self.stdout.write(
+            f'{summary["method"]} {summary["path"]} -> {summary["status"]} '
+            f'({summary["total_ms"]:.1f}ms, {summary["calls"]} calls, {summary["created_at"]})'
+        )
+        try:
+            self.stdout.write(format_stats(stats_path, sort=sort, limit=limit))
+        except KeyError:
+            raise CommandError(f'정렬 기준 {sort}을(를) 쓸 수 없습니다.')
+
+        if snapshot is not None:
+            if 'peak_bytes' in summary:
+                self.stdout.write(f'최대 메모리 사용량: {summary["peak_bytes"] / 1024:.1f} KiB')
+            self.stdout.write('할당이 많은 코드 위치:')
+            for stat in snapshot.statistics('lineno')[:limit]:
+                self.stdout.write(f'  {stat}')
+
+    def handle_sign(self, mode, path, **options):
+        self.stdout.write(f'{PROFILE_HEADER}: {sign_mode(mode, path)}')
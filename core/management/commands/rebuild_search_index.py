@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Post, PostTerm
+from posts.search import index_posts
+
+
+class Command(BaseCommand):
+    """
+    게시글 검색 색인(PostTerm)을 처음부터 다시 만드는 커스텀 커맨드.
+    삭제와 재구성을 한 트랜잭션에서 하므로, 끝날 때까지 검색은 이전 색인을 그대로 본다.
+    """
+    help = 'Rebuild the post search index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        started = time.monotonic()
+
+        with transaction.atomic():
+            self.stdout.write('검색 색인 삭제 중...')
+            PostTerm.objects.all().delete()
+
+            posts = Post.objects.filter(is_deleted=False) \
+                                .only('title', 'content', 'is_deleted') \
+                                .order_by('pk')
+            indexed = terms = 0
+            batch = []
+            for post in posts.iterator(chunk_size=batch_size):
+                batch.append(post)
+                if len(batch) >= batch_size:
+                    terms += index_posts(batch, batch_size=batch_size)
+                    indexed += len(batch)
+                    batch = []
+                    self.stdout.write(f'{indexed}개 게시글 색인 완료...')
+            if batch:
+                terms += index_posts(batch, batch_size=batch_size)
+                indexed += len(batch)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'검색 색인 완료! 게시글 {indexed}개, 토큰 {terms}개 ({elapsed:.1f}초)'
+        ))
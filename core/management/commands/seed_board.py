@@ -0,0 +1,72 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from core.seeding import SEED_PASSWORD, seed_posts, seed_users
+from posts.cache import bump_list_generation
+from posts.counters import sync_live_post_count
+
+
+class Command(BaseCommand):
+    """
+    로컬에서 운영 규모(유저 100만, 게시글 1000만 등)의 가짜 유저/게시글을 빠르게 만드는 커스텀 커맨드.
+
+    - 모델 인스턴스 없이 executemany로 배치마다 넣고, 비밀번호 해시는 한 번만 계산한다.
+    - 같은 --seed면 같은 데이터를 만든다. (이메일이 seed{seed}-user{i}@example.com 이라 같은 seed로 두 번 넣을 수는 없다)
+    - 유저별 게시글 수, 조회수 분포, 탈퇴/삭제 비율을 옵션으로 바꿀 수 있다.
+    """
+    help = 'Generate synthetic users and posts in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--posts', type=int, default=10000)
+        parser.add_argument('--deleted-users', type=float, default=0.02, help='탈퇴한 유저 비율')
+        parser.add_argument('--deleted-posts', type=float, default=0.05, help='삭제된 게시글 비율')
+        parser.add_argument('--author-skew', type=float, default=1.0,
+                            help='유저별 게시글 수의 쏠림 (Zipf 지수, 0이면 고르게)')
+        parser.add_argument('--view-alpha', type=float, default=1.2,
+                            help='조회수 Pareto 분포의 alpha (작을수록 인기글에 몰림)')
+        parser.add_argument('--days', type=float, default=365, help='작성 시간을 퍼뜨릴 기간(일)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=10000)
+        parser.add_argument('--reindex', action='store_true', help='넣은 뒤 검색 색인을 다시 만든다.')
+
+    def handle(self, *args, **options):
+        for name in ('deleted_users', 'deleted_posts'):
+            if not 0 <= options[name] <= 1:
+                raise CommandError(f'--{name.replace("_", "-")}는 0과 1 사이여야 합니다.')
+        if options['view_alpha'] <= 0:
+            raise CommandError('--view-alpha는 0보다 커야 합니다.')
+        if options['posts'] > 0 >= options['users']:
+            raise CommandError('게시글을 만들려면 유저가 필요합니다.')
+
+        seed = options['seed']
+        if get_user_model().objects.filter(email__startswith=f'seed{seed}-').exists():
+            raise CommandError(f'seed {seed}로 만든 데이터가 이미 있습니다. 다른 --seed를 지정해주세요.')
+
+        started = time.monotonic()
+        users = seed_users(options['users'], options['deleted_users'], seed=seed, days=options['days'],
+                           batch_size=options['batch_size'])
+        self.report('유저', len(users), started)
+
+        started = time.monotonic()
+        posts = seed_posts(
+            [user_id for user_id, _, _ in users], options['posts'], options['deleted_posts'],
+            author_skew=options['author_skew'], view_alpha=options['view_alpha'], seed=seed, days=options['days'],
+            batch_size=options['batch_size'],
+        )
+        self.report('게시글', posts, started)
+
+        sync_live_post_count()
+        bump_list_generation()
+        if options['reindex']:
+            call_command('rebuild_search_index', batch_size=options['batch_size'], stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(f'완료! 모든 유저의 비밀번호는 {SEED_PASSWORD} 입니다.'))
+
+    def report(self, name, count, started):
+        elapsed = time.monotonic() - started
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(f'{name} {count}개 생성 ({elapsed:.1f}초, {rate:,.0f}개/초)')
@@ -1,17 +1,25 @@
 import time
 
 from django.db.utils import OperationalError
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 
 class Command(BaseCommand):
     """
     Database가 연결 가능한 상태인지 확인하는 커스텀 커맨드.
+    재시도 간격은 1초부터 두 배씩 늘리고(최대 --max-delay), --timeout 초가 지나도 연결되지 않으면 실패한다.
+    (커넥션 풀은 이 커맨드가 끝나면 사라지므로 여기서 채우지 않고, 워커가 시작할 때 config/wsgi.py, asgi.py에서 채운다)
     """
     help = 'Check if database is available'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--timeout', type=float, default=60, help='최대 대기 시간(초)')
+        parser.add_argument('--max-delay', type=float, default=10, help='재시도 간격의 최대값(초)')
+
     def handle(self, *args, **options):
         self.stdout.write('데이터베이스 기다리는 중...')
+        deadline = time.monotonic() + options['timeout']
+        delay = 1
         db_up = False
 
         while db_up is False:
@@ -19,7 +27,10 @@ class Command(BaseCommand):
                 self.check(databases=['default'])
                 db_up = True
             except OperationalError:
-                self.stdout.write('데이터베이스가 아직 준비되지 않았습니다. 잠시만 기다려주세요...')
-                time.sleep(1)
+                if time.monotonic() + delay > deadline:
+                    raise CommandError(f'{options["timeout"]:g}초 안에 데이터베이스에 연결하지 못했습니다.')
+                self.stdout.write(f'데이터베이스가 아직 준비되지 않았습니다. {delay:g}초 후 다시 시도합니다...')
+                time.sleep(delay)
+                delay = min(delay * 2, options['max_delay'])
 
-        self.stdout.write(self.style.SUCCESS('데이터베이스 준비 완료!'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('데이터베이스 준비 완료!'))
@@ -0,0 +1,98 @@
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# 현재 요청의 RequestMetrics. 샘플링되지 않은 요청이면 None
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """
+    요청 하나의 쿼리 수/DB 시간과 구간별(serialize, render 등) 시간을 모으는 객체.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.timings = defaultdict(float)
+
+    def record_query(self, sql, duration):
+        self.queries.append((sql, duration))
+
+    @property
+    def query_count(self):
+        return len(self.queries)
+
+    @property
+    def db_time(self):
+        return sum(duration for _, duration in self.queries)
+
+    def repeated_queries(self, threshold):
+        """
+        파라미터만 다르고 같은 SQL이 threshold번 이상 실행된 쿼리. (N+1 패턴)
+
+        :return: [(sql, count)]
+        """
+        counts = Counter(sql for sql, _ in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+    def server_timing(self, total):
+        """
+        Server-Timing 헤더 값. (브라우저 개발자 도구의 Timing 탭에 보인다)
+        """
+        metrics = [f'db;dur={self.db_time * 1000:.1f};desc="{self.query_count} queries"']
+        metrics += [f'{name};dur={duration * 1000:.1f}' for name, duration in self.timings.items()]
+        metrics.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(metrics)
+
+
+@contextmanager
+def record_timing(name):
+    """
+    with 블록의 실행 시간을 현재 요청의 구간 시간에 더하는 컨텍스트 매니저. 샘플링되지 않은 요청이면 아무것도 하지 않는다.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - started
+
+
+@contextmanager
+def collect_metrics():
+    """
+    with 블록 안에서 실행된 쿼리와 구간 시간을 모으는 컨텍스트 매니저.
+    """
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    모든 DB 커넥션에 붙는 execute wrapper. 현재 요청이 샘플링된 경우에만 시간을 잰다.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, time.perf_counter() - started)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    connection_created 시그널 리시버. 같은 DatabaseWrapper로 다시 연결해도 wrapper는 한 번만 붙인다.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
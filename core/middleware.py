@@ -0,0 +1,349 @@
+import hashlib
+import json
+import logging
+import random
+import time
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from core.metrics import collect_metrics
+from core.profiling import PROFILE_HEADER, PROFILE_ID_HEADER, RequestProfiler, is_staff_request, parse_profile_header
+from core.routers import use_replica
+
+
+logger = logging.getLogger('core.metrics')
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class _GzipCompressor:
+    def __init__(self):
+        # wbits=31: gzip 헤더 (mtime 0이라 같은 본문이면 같은 결과가 나온다)
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=5)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def _zstd_compressor():
+    return zstandard.ZstdCompressor(level=3).compressobj()
+
+
+# 서버가 선호하는 순서. 설치되지 않은 코덱은 협상 대상에서 빠진다.
+CODECS = {}
+if brotli is not None:
+    CODECS['br'] = _BrotliCompressor
+if zstandard is not None:
+    CODECS['zstd'] = _zstd_compressor
+CODECS['gzip'] = _GzipCompressor
+
+
+def compress(data, encoding):
+    compressor = CODECS[encoding]()
+    return compressor.compress(data) + compressor.flush()
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더를 {코덱: q값}으로 파싱하는 함수.
+    ex) 'gzip, br;q=0.9, *;q=0' -> {'gzip': 1.0, 'br': 0.9, '*': 0.0}
+    """
+    qualities = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    return qualities
+
+
+def negotiate_encoding(header):
+    """
+    클라이언트가 받을 수 있는 코덱 중 q값이 가장 높은 코덱을 고르는 함수. 같으면 서버 선호 순서(CODECS)를 따른다.
+    """
+    qualities = parse_accept_encoding(header or '')
+    wildcard = qualities.get('*', 0.0)
+    best, best_q = None, 0.0
+    for encoding in CODECS:
+        q = qualities.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compress_sequence(sequence, encoding):
+    compressor = CODECS[encoding]()
+    for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def _acompress_sequence(sequence, encoding):
+    compressor = CODECS[encoding]()
+    async for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Accept-Encoding으로 코덱(br, zstd, gzip 중 설치된 것)을 협상해서 응답을 압축하는 미들웨어.
+
+    - COMPRESSION_MIN_SIZE보다 작은 응답, 이미 압축된 형식(이미지 등), Content-Encoding이 있는 응답은 압축하지 않는다.
+    - 스트리밍 응답(내보내기 등)은 청크를 이어서 압축한다.
+    - ETag가 있는 응답(캐시되는 게시글 목록/상세)은 같은 본문의 압축 결과를 캐시해서, 캐시 히트마다 다시 압축하지 않는다.
+    """
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type.startswith(settings.COMPRESSION_EXCLUDED_TYPES):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING'))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _acompress_sequence(response.streaming_content, encoding)
+            else:
+                response.streaming_content = _compress_sequence(response.streaming_content, encoding)
+            del response['Content-Length']
+        else:
+            compressed = self.compress_content(response, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # 압축된 본문은 원래 본문과 바이트가 다르므로 강한 ETag는 약한 ETag로 바꾼다.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+    def compress_content(self, response, encoding):
+        if not response.has_header('ETag'):
+            return compress(response.content, encoding)
+
+        key = f'compressed:{encoding}:{hashlib.md5(response.content).hexdigest()}'
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(response.content, encoding)
+            cache.set(key, compressed, timeout=settings.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 전용 요청(GET/HEAD/OPTIONS)의 읽기 쿼리를 레플리카로 보내는 미들웨어.
+
+    쓰기 요청이 성공한 클라이언트에게는 REPLICA_STICKY_SECONDS 동안 유지되는 쿠키를 주고,
+    쿠키가 있는 동안의 요청은 프라이머리에서 읽어서 방금 쓴 글을 복제 지연 없이 다시 읽을 수 있게 한다.
+    쿠키가 만료된 뒤에도 예전 데이터가 캐시에 남지 않도록, 무효화 직후에는 레플리카에서 읽은 응답을 캐시하지 않는다. (posts.cache)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with use_replica(self.can_use_replica(request)):
+            response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        with use_replica(self.can_use_replica(request)):
+            response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def can_use_replica(self, request):
+        return request.method in SAFE_METHODS and settings.REPLICA_STICKY_COOKIE not in request.COOKIES
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                settings.REPLICA_STICKY_COOKIE, '1',
+                max_age=settings.REPLICA_STICKY_SECONDS, httponly=True, samesite='Lax',
+            )
+        return response
+
+
+class QueryInstrumentationMiddleware:
+    """
+    요청마다 쿼리 수, DB 시간, 직렬화/렌더링 시간(core.metrics.record_timing)을 재서
+    Server-Timing 헤더와 JSON 로그(core.metrics 로거)로 남기는 미들웨어.
+
+    DEBUG면 모든 요청을, 아니면 REQUEST_METRICS_SAMPLE_RATE 비율만큼만 잰다.
+    같은 SQL이 N_PLUS_ONE_THRESHOLD번 이상 반복되면 N+1 의심 쿼리로 경고 로그를 남긴다.
+    스트리밍 응답은 응답 헤더를 보내기 전까지의 쿼리만 집계된다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.should_sample():
+            return self.get_response(request)
+        started = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        return self.report(request, response, metrics, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if not self.should_sample():
+            return await self.get_response(request)
+        started = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = await self.get_response(request)
+        return self.report(request, response, metrics, time.perf_counter() - started)
+
+    def should_sample(self):
+        return settings.DEBUG or random.random() < settings.REQUEST_METRICS_SAMPLE_RATE
+
+    def report(self, request, response, metrics, total):
+        response['Server-Timing'] = metrics.server_timing(total)
+
+        repeated = metrics.repeated_queries(settings.N_PLUS_ONE_THRESHOLD)
+        logger.info(json.dumps({
+            'event': 'request',
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': metrics.query_count,
+            'db_ms': round(metrics.db_time * 1000, 2),
+            **{f'{name}_ms': round(duration * 1000, 2) for name, duration in metrics.timings.items()},
+            'total_ms': round(total * 1000, 2),
+            'repeated_queries': len(repeated),
+        }, ensure_ascii=False))
+        for sql, count in repeated:
+            logger.warning(json.dumps({
+                'event': 'repeated_query',
+                'method': request.method,
+                'path': request.path,
+                'count': count,
+                'sql': sql,
+            }, ensure_ascii=False))
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    X-Profile 헤더가 있는 요청 하나를 cProfile로 감싸서 PROFILING_DIR에 저장하고, 프로파일 ID를 X-Profile-Id 헤더로 돌려주는 미들웨어.
+
+    - 운영자(세션 또는 JWT)는 X-Profile: cpu|memory 로, 그 밖의 클라이언트는 `manage.py profiles sign <path>`로 만든 서명된 값으로 요청한다.
+      (서명된 값은 그 경로의 요청 한 번에만 쓸 수 있다)
+    - PROFILING_MAX_FILES개가 넘으면 오래된 프로파일부터 지운다.
+    - memory면 tracemalloc으로 할당도 기록한다. (느려지므로 시간은 cpu 모드로 본다)
+    - 저장된 프로파일은 `manage.py profiles list/show`로 본다.
+    - ASGI에서는 같은 이벤트 루프에서 함께 처리된 다른 요청도 섞일 수 있고, sync_to_async로 넘긴 코드는 잡히지 않는다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        header = request.headers.get(PROFILE_HEADER)
+        if not header:
+            return self.get_response(request)
+        mode, signed = parse_profile_header(header, request.path)
+        if not signed and not is_staff_request(request):
+            return self.get_response(request)
+
+        profiler = RequestProfiler(mode)
+        if not profiler.start():
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.stop()
+        return self.process_response(request, response, profiler)
+
+    async def __acall__(self, request):
+        header = request.headers.get(PROFILE_HEADER)
+        if not header:
+            return await self.get_response(request)
+        mode, signed = await sync_to_async(parse_profile_header)(header, request.path)
+        if not signed and not await sync_to_async(is_staff_request)(request):
+            return await self.get_response(request)
+
+        profiler = RequestProfiler(mode)
+        if not profiler.start():
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.stop()
+        return self.process_response(request, response, profiler)
+
+    def process_response(self, request, response, profiler):
+        profiler.save(request, response)
+        response[PROFILE_ID_HEADER] = profiler.id
+        return response
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_post'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_deleted', 'created_at', 'id'], name='post_deleted_created_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:36
+
+from django.db import migrations, models
+
+
+def init_live_post_counter(apps, schema_editor):
+    Post = apps.get_model('core', 'Post')
+    Counter = apps.get_model('core', 'Counter')
+    Counter.objects.update_or_create(
+        name='live_posts',
+        defaults={'value': Post.objects.filter(is_deleted=False).count()},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_post_deleted_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(init_live_post_counter, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -43,6 +44,7 @@ class User(AbstractBaseUser, Shared):
     """
     name = models.CharField(max_length=50)
     email = models.EmailField(max_length=255, unique=True)
+    is_staff = models.BooleanField(default=False)  # 운영자(게시글 일괄 삭제/복구 등)
 
     USERNAME_FIELD = 'email'
 
@@ -57,3 +59,84 @@ class Post(Shared):
     content = models.TextField()  # 이모지 사용 가능
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     view_count = models.IntegerField(default=0)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        DB에서 불러온 시점의 삭제 여부를 기억해 두고, 저장할 때 카운터 증감 여부를 판단한다.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_is_deleted = instance.__dict__.get('is_deleted')
+        return instance
+
+    class Meta:
+        indexes = [
+            # 목록 조회의 키셋 페이지네이션용 인덱스 (WHERE is_deleted ORDER BY created_at, id)
+            models.Index(fields=['is_deleted', 'created_at', 'id'], name='post_deleted_created_idx'),
+            # ordering=view_count / -view_count 용 인덱스 (filesort 방지)
+            models.Index(fields=['is_deleted', 'view_count', 'id'], name='post_deleted_view_count_idx'),
+        ]
+
+
+class CounterManager(models.Manager):
+    """
+    카운터 매니저.
+    """
+    def increment(self, name, delta=1):
+        """
+        SELECT 없이 원자적 UPDATE 한 번으로 (UPDATE ... SET value = value + delta) 카운터를 증감하는 메서드.
+        """
+        if not delta:
+            return
+        updated = self.filter(name=name).update(value=F('value') + delta)
+        if not updated:
+            self.get_or_create(name=name)
+            self.filter(name=name).update(value=F('value') + delta)
+
+    def get_value(self, name):
+        """
+        카운터 값을 가져오는 메서드. 카운터가 없으면 0.
+        """
+        value = self.filter(name=name).values_list('value', flat=True).first()
+        return value or 0
+
+    async def aget_value(self, name):
+        value = await self.filter(name=name).values_list('value', flat=True).afirst()
+        return value or 0
+
+
+class Counter(models.Model):
+    """
+    COUNT(*) 대신 사용하는 집계 카운터 모델.
+    """
+    LIVE_POSTS = 'live_posts'
+
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    objects = CounterManager()
+
+
+class PostTerm(models.Model):
+    """
+    게시글 검색용 역색인(postings) 모델. 검색어 토큰별로 어떤 게시글에 얼마나 나오는지 저장한다.
+    """
+    term = models.CharField(max_length=50)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='terms')
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'post'], name='post_term_unique'),
+        ]
+
+
+class ImportCheckpoint(models.Model):
+    """
+    import_board 커맨드가 게시글 파일별로 몇 번째 줄까지 가져왔는지 기록하는 모델.
+    """
+    key = models.CharField(max_length=32, unique=True)  # 파일 절대 경로의 md5
+    path = models.TextField(blank=True)
+    position = models.BigIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
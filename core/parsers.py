@@ -0,0 +1,46 @@
+from collections.abc import Mapping
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from core.renderers import MessagePackRenderer, msgpack, orjson
+
+
+class FastJSONParser(JSONParser):
+    """
+    orjson이 설치되어 있으면 orjson으로, 없으면 DRF 기본 JSONParser로 요청 본문을 읽는 파서.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class MessagePackParser(BaseParser):
+    """
+    Content-Type: application/msgpack 요청 본문을 읽는 파서. (msgpack 패키지 필요)
+    """
+    media_type = MessagePackRenderer.media_type
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        # 잘린/남는 데이터, 허용하지 않는 맵 키는 ValueError. msgpack 버전/옵션에 따라 unhashable 키는 TypeError로 온다.
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (TypeError, ValueError) as exc:
+            raise ParseError('MessagePack parse error - %s' % str(exc))
+
+
+def object_data(request):
+    """
+    객체 하나를 받는 API에서 요청 본문(JSON 객체, MessagePack 맵, 폼)을 가져오는 함수.
+    배열이나 숫자처럼 객체가 아닌 본문은 파싱은 되지만 .get()을 쓸 수 없으므로 ParseError(400)로 막는다.
+    """
+    data = request.data
+    if not isinstance(data, Mapping):
+        raise ParseError('요청 본문은 객체여야 합니다.')
+    return data
@@ -0,0 +1,191 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import secrets
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from users.authentication import CachedJWTAuthentication
+
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+MODES = ('cpu', 'memory')
+
+_SIGNING_SALT = 'core.profiling'
+
+
+def sign_mode(mode, path):
+    """
+    운영자가 아닌 클라이언트도 PROFILING_SIGNATURE_MAX_AGE 동안 path 요청 한 번을 프로파일링할 수 있는 X-Profile 헤더 값을 만드는 함수.
+    서명에 경로와 일회용 nonce를 넣어서, 헤더가 새어 나가도 다른 경로나 두 번째 요청에는 쓸 수 없다.
+    """
+    payload = {'m': mode, 'p': path, 'n': secrets.token_hex(8)}
+    return signing.TimestampSigner(salt=_SIGNING_SALT).sign_object(payload)
+
+
+def parse_profile_header(value, path):
+    """
+    X-Profile 헤더를 (mode, signed)로 바꾸는 함수.
+    서명이 없거나, 만료됐거나, 다른 경로용이거나, 이미 쓴 값이면 운영자만 쓸 수 있는 일반 값으로 본다.
+    """
+    try:
+        payload = signing.TimestampSigner(salt=_SIGNING_SALT).unsign_object(
+            value, max_age=settings.PROFILING_SIGNATURE_MAX_AGE,
+        )
+        mode = payload['m']
+        signed = payload['p'] == path and cache.add(
+            f'profiling:nonce:{payload["n"]}', True, timeout=settings.PROFILING_SIGNATURE_MAX_AGE,
+        )
+    except (signing.BadSignature, ValueError, TypeError, KeyError):
+        mode, signed = value, False
+    mode = str(mode).strip().lower()
+    return (mode if mode in MODES else 'cpu'), signed
+
+
+def is_staff_request(request):
+    """
+    세션 또는 JWT 토큰의 유저가 운영자인지 확인하는 함수. (프로파일링을 요청한 경우에만 부른다)
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+    try:
+        result = CachedJWTAuthentication().authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return False
+    return result is not None and result[0].is_staff
+
+
+def profile_dir():
+    path = Path(settings.PROFILING_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def new_profile_id():
+    """
+    이름순이 저장 순서가 되도록 마이크로초까지 넣는다. (prune_profiles, list_profiles)
+    """
+    return f'{timezone.now():%Y%m%dT%H%M%S%f}-{secrets.token_hex(4)}'
+
+
+def prune_profiles(directory):
+    """
+    PROFILING_MAX_FILES개가 넘는 오래된 프로파일을 지우는 함수. (.json/.prof/.alloc을 함께 지운다)
+    """
+    profile_ids = sorted(path.stem for path in directory.glob('*.json'))
+    for profile_id in profile_ids[:max(len(profile_ids) - settings.PROFILING_MAX_FILES, 0)]:
+        for suffix in ('.json', '.prof', '.alloc'):
+            (directory / f'{profile_id}{suffix}').unlink(missing_ok=True)
+
+
+class RequestProfiler:
+    """
+    요청 하나를 cProfile(mode가 memory면 tracemalloc도)로 감싸고, 결과를 PROFILING_DIR에 저장하는 객체.
+
+    - {id}.prof: pstats 파일 (python -m pstats, snakeviz 등으로 열 수 있다)
+    - {id}.alloc: tracemalloc 스냅샷 (memory 모드)
+    - {id}.json: 요청 정보와 요약
+    """
+
+    def __init__(self, mode='cpu'):
+        self.mode = mode
+        self.id = new_profile_id()
+        self.profile = cProfile.Profile()
+        self._started_tracing = False
+
+    def start(self):
+        """
+        :return: 다른 프로파일러가 이미 돌고 있어서(같은 스레드의 다른 요청 등) 시작하지 못했으면 False
+        """
+        try:
+            self.profile.enable()
+        except ValueError:
+            return False
+        if self.mode == 'memory' and not tracemalloc.is_tracing():
+            tracemalloc.start(settings.PROFILING_TRACEMALLOC_FRAMES)
+            self._started_tracing = True
+        self.started_at = timezone.now()
+        self._started = time.perf_counter()
+        return True
+
+    def stop(self):
+        self.elapsed = time.perf_counter() - self._started
+        self.profile.disable()
+        self.snapshot = tracemalloc.take_snapshot() if self.mode == 'memory' else None
+        self.traced_memory = tracemalloc.get_traced_memory() if self._started_tracing else None
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    def save(self, request, response):
+        directory = profile_dir()
+        self.profile.dump_stats(directory / f'{self.id}.prof')
+
+        summary = {
+            'id': self.id,
+            'mode': self.mode,
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'created_at': self.started_at.isoformat(),
+            'pid': os.getpid(),
+            'total_ms': round(self.elapsed * 1000, 2),
+            'calls': pstats.Stats(self.profile).total_calls,
+        }
+        if self.snapshot is not None:
+            self.snapshot.dump(str(directory / f'{self.id}.alloc'))
+            summary['allocated_bytes'] = sum(stat.size for stat in self.snapshot.statistics('filename'))
+        if self.traced_memory is not None:
+            summary['peak_bytes'] = self.traced_memory[1]
+
+        with open(directory / f'{self.id}.json', 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False)
+        prune_profiles(directory)
+        return summary
+
+
+def list_profiles():
+    """
+    저장된 프로파일 요약 목록. (최근 순)
+    """
+    directory = Path(settings.PROFILING_DIR)
+    if not directory.is_dir():
+        return []
+    summaries = []
+    for path in directory.glob('*.json'):
+        with open(path, encoding='utf-8') as file:
+            summaries.append(json.load(file))
+    return sorted(summaries, key=lambda summary: summary['id'], reverse=True)
+
+
+def load_profile(profile_id):
+    """
+    :return: (요약, pstats 파일 경로, tracemalloc 스냅샷 또는 None)
+    """
+    directory = Path(settings.PROFILING_DIR)
+    path = directory / f'{profile_id}.json'
+    if profile_id != Path(profile_id).name or not path.is_file():
+        raise FileNotFoundError(profile_id)
+    with open(path, encoding='utf-8') as file:
+        summary = json.load(file)
+    alloc = directory / f'{profile_id}.alloc'
+    snapshot = tracemalloc.Snapshot.load(str(alloc)) if alloc.is_file() else None
+    return summary, directory / f'{profile_id}.prof', snapshot
+
+
+def format_stats(path, sort='cumulative', limit=20):
+    stream = io.StringIO()
+    pstats.Stats(str(path), stream=stream).strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
@@ -0,0 +1,62 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.metrics import record_timing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+_encoder = JSONEncoder()
+
+
+def default(obj):
+    """
+    orjson/msgpack이 직접 인코딩하지 못하는 값(datetime, Decimal, lazy 문자열 등)을 DRF JSONEncoder와 같은 규칙으로 바꾸는 함수.
+    """
+    return _encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson이 설치되어 있으면 orjson으로, 없으면 DRF 기본 JSONRenderer로 JSON을 만드는 렌더러.
+    출력(압축된 JSON, 유니코드 그대로, datetime 형식)은 기본 JSONRenderer와 같다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with record_timing('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        # 기본 JSONRenderer처럼 자바스크립트에서 문제가 되는 문자를 이스케이프한다.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Accept: application/msgpack 으로 요청하면 MessagePack으로 응답하는 렌더러. (msgpack 패키지 필요)
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=default, use_bin_type=True)
@@ -0,0 +1,69 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+PRIMARY = 'default'
+
+# 현재 요청(또는 with 블록)에서 읽기를 레플리카로 보내도 되는지. 기본값은 프라이머리.
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+@contextmanager
+def use_replica(enabled=True):
+    """
+    with 블록 안의 읽기 쿼리를 레플리카로 보내는 컨텍스트 매니저. (enabled=False면 프라이머리)
+    """
+    token = _read_from_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def pinned_to_primary():
+    """
+    레플리카가 있는데 지금은 프라이머리에서 읽어야 하는지. (쓰기 직후의 요청 등)
+    레플리카에서 읽어서 캐시된 응답은 복제 지연만큼 오래됐을 수 있으므로, 이때는 응답 캐시를 읽지 않는다.
+    """
+    return bool(settings.DATABASE_REPLICAS) and not _read_from_replica.get()
+
+
+def reading_from_replica():
+    """
+    지금 읽기 쿼리가 레플리카로 가는지. (레플리카에서 읽은 응답은 복제 지연만큼 오래됐을 수 있다)
+    """
+    return bool(settings.DATABASE_REPLICAS) and _read_from_replica.get()
+
+
+class PrimaryReplicaRouter:
+    """
+    쓰기는 항상 프라이머리(default)로, 읽기는 use_replica() 안에서만 레플리카 중 하나로 보내는 라우터.
+
+    요청에서는 ReplicaRoutingMiddleware가 안전한 메서드(GET/HEAD)이고 최근에 쓴 적이 없는 요청만 레플리카로 보낸다.
+    관리 커맨드/셸/시그널 등 요청 밖의 코드는 복제 지연을 신경 쓰지 않도록 기본적으로 프라이머리에서 읽는다.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _read_from_replica.get():
+            return PRIMARY
+        aliases = settings.DATABASE_REPLICAS
+        # 쓰기 트랜잭션 안에서는 방금 쓴 데이터를 읽을 수 있도록 프라이머리에서 읽는다.
+        if not aliases or connections[PRIMARY].in_atomic_block:
+            return PRIMARY
+        return random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 레플리카는 프라이머리의 복제본이라 같은 데이터다.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,208 @@
+import itertools
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import accumulate, islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from core.models import Post
+from posts.counters import sync_live_post_count
+from posts.search import index_posts
+
+
+WORDS = [
+    '장고', '게시판', '성능', '캐시', '인덱스', '쿼리', '페이지', '검색', '댓글', '조회수',
+    'django', 'mysql', 'redis', 'python', 'api', 'cursor', 'index', 'cache', 'board', 'post',
+]
+
+SEED_PASSWORD = 'Seed1234!'
+
+MAX_VIEW_COUNT = 2 ** 31 - 1
+
+TEXT_POOL_SIZE = 4096
+
+
+def seed_email(seed, i):
+    return f'seed{seed}-user{i}@example.com'
+
+
+def insert_rows(model, fields, rows, batch_size=10000):
+    """
+    모델 인스턴스를 만들지 않고 (컬럼 값 튜플)을 executemany로 넣는 함수. (bulk_create보다 몇 배 빠르다)
+    값은 DB에 넣을 수 있는 형태여야 하고, 배치마다 트랜잭션을 커밋한다.
+
+    :return: 넣은 행 수
+    """
+    using = router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    columns = [model._meta.get_field(name).column for name in fields]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table), ', '.join(map(quote, columns)), ', '.join(['%s'] * len(columns)),
+    )
+
+    inserted = 0
+    batch = []
+    with bulk_load(connection):
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                inserted += _insert_batch(connection, using, sql, batch)
+                batch = []
+        if batch:
+            inserted += _insert_batch(connection, using, sql, batch)
+    return inserted
+
+
+# 대량으로 넣는 동안만 바꾸는 세션 설정. 값은 seed_* 함수가 만들기 때문에 중복/참조 검사를 꺼도 안전하다.
+BULK_LOAD_SETTINGS = {
+    # 커밋마다 fsync하지 않고, 페이지 캐시를 256MB까지 쓴다. (인덱스 갱신이 디스크를 덜 읽는다)
+    'sqlite': {'synchronous': 'OFF', 'cache_size': -262144},
+    'mysql': {'unique_checks': 0, 'foreign_key_checks': 0},
+}
+
+
+@contextmanager
+def bulk_load(connection):
+    """
+    BULK_LOAD_SETTINGS의 세션 설정으로 바꿨다가 원래대로 되돌리는 컨텍스트 매니저.
+    """
+    settings = BULK_LOAD_SETTINGS.get(connection.vendor)
+    # SQLite는 트랜잭션 안에서 synchronous를 바꿀 수 없다. (bench처럼 바깥 트랜잭션 안에서 부른 경우)
+    if not settings or (connection.vendor == 'sqlite' and connection.in_atomic_block):
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        saved = {}
+        for name, value in settings.items():
+            if connection.vendor == 'sqlite':
+                saved[name] = cursor.execute(f'PRAGMA {name}').fetchone()[0]
+                cursor.execute(f'PRAGMA {name} = {value}')
+            else:
+                cursor.execute(f'SELECT @@SESSION.{name}')
+                saved[name] = cursor.fetchone()[0]
+                cursor.execute(f'SET SESSION {name} = %s', [value])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for name, value in saved.items():
+                if connection.vendor == 'sqlite':
+                    cursor.execute(f'PRAGMA {name} = {value}')
+                else:
+                    cursor.execute(f'SET SESSION {name} = %s', [value])
+
+
+def _insert_batch(connection, using, sql, batch):
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.executemany(sql, batch)
+    return len(batch)
+
+
+def _timestamps(connection, count, days):
+    """
+    지금부터 days일 전까지 고르게 퍼진 작성 시간을 오래된 순서로 만드는 제너레이터. (pk 순서 = 작성 순서)
+    """
+    end = timezone.now()
+    start = end - timedelta(days=days)
+    step = (end - start) / max(count, 1)
+    if connection.features.supports_timezones:
+        for i in range(count):
+            yield start + step * i
+        return
+    # 행마다 adapt_datetimefield_value를 부르면 느리므로, UTC naive로 한 번만 바꾸고 같은 형식의 문자열로 넣는다.
+    start = connection.ops.adapt_datetimefield_value(start)
+    start = datetime.fromisoformat(start) if isinstance(start, str) else start
+    for i in range(count):
+        yield str(start + step * i)
+
+
+def seed_users(count, deleted_ratio=0.0, seed=0, days=365, batch_size=10000):
+    """
+    탈퇴 비율 deleted_ratio로 유저 count명을 만드는 함수.
+    이메일은 seed{seed}-user{i}@example.com, 비밀번호는 모두 SEED_PASSWORD다. (해시는 한 번만 계산한다)
+
+    :return: 만든 유저의 (id, email, is_deleted) 목록 (pk 순)
+    """
+    User = get_user_model()
+    rng = random.Random(f'users:{seed}')
+    password = make_password(SEED_PASSWORD)
+    connection = connections[router.db_for_write(User)]
+
+    rows = (
+        (seed_email(seed, i), f'user{i}', password, rng.random() < deleted_ratio, False, created_at, created_at)
+        for i, created_at in enumerate(_timestamps(connection, count, days))
+    )
+    insert_rows(User, ['email', 'name', 'password', 'is_deleted', 'is_staff', 'created_at', 'updated_at'], rows,
+                batch_size=batch_size)
+    return list(
+        User.objects.filter(email__startswith=f'seed{seed}-').order_by('pk').values_list('id', 'email', 'is_deleted')
+    )
+
+
+def seed_posts(user_ids, count, deleted_ratio=0.0, author_skew=1.0, view_alpha=1.2, seed=0, days=365,
+               batch_size=10000):
+    """
+    user_ids의 유저들이 쓴 게시글 count개를 만드는 함수.
+
+    :param author_skew: 유저별 게시글 수의 쏠림 정도. 0이면 고르게, 클수록 소수의 유저가 많이 쓴다. (Zipf 분포의 지수)
+    :param view_alpha: 조회수 분포(Pareto)의 alpha. 작을수록 소수의 게시글에 조회수가 몰린다.
+    :param deleted_ratio: 삭제된 게시글 비율
+    :return: 만든 게시글 수
+    """
+    if not user_ids or count <= 0:
+        return 0
+
+    rng = random.Random(f'posts:{seed}')
+    authors = list(user_ids)
+    rng.shuffle(authors)
+    cum_weights = list(accumulate(1 / (rank + 1) ** author_skew for rank in range(len(authors))))
+    connection = connections[router.db_for_write(Post)]
+
+    # 글마다 단어를 고르면 느리므로, 미리 만든 제목/본문 중에서 고른다.
+    titles = [' '.join(rng.choices(WORDS, k=4)) for _ in range(TEXT_POOL_SIZE)]
+    contents = [' '.join(rng.choices(WORDS, k=30)) for _ in range(TEXT_POOL_SIZE)]
+
+    def rows():
+        timestamps = _timestamps(connection, count, days)
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            yield from zip(
+                rng.choices(titles, k=size),
+                rng.choices(contents, k=size),
+                rng.choices(authors, cum_weights=cum_weights, k=size),
+                [min(int(rng.paretovariate(view_alpha)) - 1, MAX_VIEW_COUNT) for _ in range(size)],
+                [rng.random() < deleted_ratio for _ in range(size)],
+                *itertools.tee(islice(timestamps, size)),
+            )
+
+    return insert_rows(
+        Post, ['title', 'content', 'user', 'view_count', 'is_deleted', 'created_at', 'updated_at'], rows(),
+        batch_size=batch_size,
+    )
+
+
+def seed_board(users=100, posts=1000, deleted_users=0.0, deleted_posts=0.0, seed=0, batch_size=10000, index=True,
+               **distributions):
+    """
+    유저와 게시글을 만들고 게시글 카운터(와 검색 색인)까지 맞추는 함수. (벤치마크/부하 테스트용)
+
+    :param distributions: seed_posts의 author_skew, view_alpha, days
+    :return: 만든 유저의 (id, email, is_deleted) 목록
+    """
+    seeded_users = seed_users(users, deleted_users, seed=seed, days=distributions.get('days', 365),
+                              batch_size=batch_size)
+    user_ids = [user_id for user_id, _, _ in seeded_users]
+    seed_posts(user_ids, posts, deleted_posts, seed=seed, batch_size=batch_size, **distributions)
+
+    sync_live_post_count()
+    if index:
+        seeded_posts = Post.objects.filter(user_id__in=user_ids, is_deleted=False) \
+                                   .only('title', 'content', 'is_deleted')
+        index_posts(seeded_posts.iterator(chunk_size=batch_size), batch_size=batch_size)
+    return seeded_users
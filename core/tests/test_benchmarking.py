@@ -0,0 +1,38 @@
+"""
+테스트 케이스:
+1. 선형 보간 백분위수를 계산하는 성공 테스트.
+2. warmup 호출은 버리고 repeat번의 시간/반환값만 돌려주는 성공 테스트.
+"""
+from django.test import SimpleTestCase
+
+from core.benchmarking import percentile, run_timed, summarize
+
+
+class BenchmarkingTests(SimpleTestCase):
+    def test_percentile_success(self):
+        """
+        선형 보간 백분위수를 계산하는 성공 테스트.
+        """
+        values = [1, 2, 3, 4]
+
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4)
+        self.assertEqual(percentile([7], 95), 7)
+
+    def test_run_timed_success(self):
+        """
+        warmup 호출은 버리고 repeat번의 시간/반환값만 돌려주는 성공 테스트.
+        """
+        calls = []
+
+        elapsed, timings, results = run_timed(lambda: calls.append(1) or len(calls), repeat=3, warmup=2)
+
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(results, [3, 4, 5])
+        self.assertEqual(len(timings), 3)
+        self.assertGreaterEqual(elapsed, sum(timings))
+        summary = summarize(timings, elapsed)
+        self.assertLessEqual(summary['p50_ms'], summary['p99_ms'])
+        self.assertLessEqual(summary['p99_ms'], summary['max_ms'])
+        self.assertIn('throughput', summary)
@@ -1,8 +1,18 @@
+import json
+import os
+import tempfile
+from io import StringIO
 from unittest.mock import patch
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
 from django.db.utils import OperationalError
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
+
+from core.models import Post, PostTerm, Counter, ImportCheckpoint
 
 
 @patch('core.management.commands.wait_for_db.Command.check')
@@ -27,4 +37,244 @@ class CommandTests(SimpleTestCase):
         call_command('wait_for_db')
 
         self.assertEqual(patched_check.call_count, 4)
-        patched_check.assert_called_with(databases=['default'])
\ No newline at end of file
+        patched_check.assert_called_with(databases=['default'])
+        self.assertEqual([call.args[0] for call in patched_sleep.call_args_list], [1, 2, 4])
+
+    @patch('time.sleep')
+    def test_wait_for_db_timeout(self, patched_sleep, patched_check):
+        """
+        --timeout 안에 연결되지 않으면 CommandError가 발생하는지 확인하는 테스트.
+        """
+        patched_check.side_effect = OperationalError
+
+        with self.assertRaises(CommandError):
+            call_command('wait_for_db', timeout=3, stdout=StringIO())
+
+        self.assertEqual([call.args[0] for call in patched_sleep.call_args_list], [1, 2])
+
+
+class FlushViewCountsCommandTests(SimpleTestCase):
+    @patch('core.management.commands.flush_view_counts.flush_view_counts')
+    def test_flush_view_counts(self, patched_flush):
+        """
+        캐시에 쌓인 조회수를 DB에 반영하는 커맨드 테스트.
+        """
+        patched_flush.return_value = 3
+
+        call_command('flush_view_counts')
+
+        patched_flush.assert_called_once_with()
+
+
+class RebuildSearchIndexCommandTests(TestCase):
+    def test_rebuild_search_index(self):
+        """
+        삭제되지 않은 게시글만으로 검색 색인을 다시 만드는 커맨드 테스트.
+        """
+        user = get_user_model().objects.create_user('test@example.com', 'Test1234!')
+        post = Post.objects.create(title='자유게시판', content='hello', user=user)
+        Post.objects.create(title='deleted', content='bye', user=user, is_deleted=True)
+        PostTerm.objects.all().delete()
+
+        call_command('rebuild_search_index', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            set(PostTerm.objects.values_list('term', 'post_id')),
+            {('자유', post.pk), ('유게', post.pk), ('게시', post.pk), ('시판', post.pk), ('hello', post.pk)},
+        )
+
+    def test_rebuild_search_index_rolls_back_on_error(self):
+        """
+        색인 재구성이 중간에 실패하면 이전 색인이 그대로 남는 테스트.
+        """
+        user = get_user_model().objects.create_user('test@example.com', 'Test1234!')
+        post = Post.objects.create(title='hello', content='world', user=user)
+        Post.objects.create(title='second', content='post', user=user)
+
+        with patch('core.management.commands.rebuild_search_index.index_posts', side_effect=[1, OperationalError]):
+            with self.assertRaises(OperationalError):
+                call_command('rebuild_search_index', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(set(PostTerm.objects.filter(post=post).values_list('term', flat=True)), {'hello', 'world'})
+
+
+class ExportPostsCommandTests(TestCase):
+    def test_export_posts_ndjson(self):
+        """
+        전체 게시글을 NDJSON으로 내보내는 커맨드 테스트.
+        """
+        user = get_user_model().objects.create_user('test@example.com', 'Test1234!', name='Test')
+        Post.objects.create(title='첫 글', content='hello', user=user)
+        Post.objects.create(title='둘째 글', content='bye', user=user, is_deleted=True)
+        stdout = StringIO()
+
+        call_command('export_posts', chunk_size=1, stdout=stdout, stderr=StringIO())
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([(row['title'], row['is_deleted']) for row in rows], [('첫 글', False), ('둘째 글', True)])
+
+
+class ImportBoardCommandTests(TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.tempdir.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_import_board(self):
+        """
+        유저/게시글을 가져오고, 다시 실행해도 중복으로 들어가지 않는 커맨드 테스트.
+        """
+        users = self.write('users.jsonl', '\n'.join([
+            json.dumps({'email': 'a@example.com', 'name': 'A', 'password': make_password('Test1234!')}),
+            json.dumps({'email': 'b@example.com', 'name': 'B', 'is_deleted': True}),
+        ]))
+        posts = self.write('posts.csv', '\n'.join([
+            'author_email,title,content,view_count,created_at',
+            'a@example.com,첫 글,hello,3,2020-01-01T00:00:00+00:00',
+            'b@example.com,둘째 글,bye,0,',
+            'nobody@example.com,주인 없는 글,bye,0,',
+        ]))
+
+        for _ in range(2):
+            call_command('import_board', users=users, posts=posts, batch_size=2, stdout=StringIO())
+
+        user = get_user_model().objects.get(email='a@example.com')
+        self.assertTrue(user.check_password('Test1234!'))
+        self.assertEqual(get_user_model().objects.count(), 2)
+        self.assertEqual(Post.objects.count(), 2)
+        post = Post.objects.get(title='첫 글')
+        self.assertEqual((post.user, post.view_count, post.created_at.year), (user, 3, 2020))
+        self.assertEqual(Counter.objects.get_value(Counter.LIVE_POSTS), 2)
+
+        checkpoint = ImportCheckpoint.objects.get()
+        self.assertEqual((checkpoint.path, checkpoint.position), (posts, 3))
+        self.assertIsNotNone(checkpoint.completed_at)
+        self.assertFalse(Counter.objects.filter(name__startswith='import:').exists())
+
+    def test_import_board_resume_and_restart(self):
+        """
+        중간에 멈춘 게시글 파일은 이어서 가져오고, --restart면 처음부터 다시 가져오는 커맨드 테스트.
+        """
+        get_user_model().objects.create_user('a@example.com', 'Test1234!')
+        posts = self.write('posts.jsonl', '\n'.join(
+            json.dumps({'author_email': 'a@example.com', 'title': f'글 {i}', 'content': 'hello'}) for i in range(3)
+        ))
+
+        # 첫 배치는 넣은 척하고, 두 번째 배치에서 실패한다.
+        with patch.object(Post.objects, 'bulk_create', side_effect=[None, OperationalError]):
+            with self.assertRaises(OperationalError):
+                call_command('import_board', posts=posts, batch_size=2, stdout=StringIO())
+        self.assertEqual(ImportCheckpoint.objects.get().position, 2)
+
+        call_command('import_board', posts=posts, batch_size=2, stdout=StringIO())
+        self.assertEqual(list(Post.objects.values_list('title', flat=True)), ['글 2'])
+
+        call_command('import_board', posts=posts, batch_size=2, restart=True, stdout=StringIO())
+        self.assertEqual(Post.objects.count(), 4)
+        self.assertEqual(ImportCheckpoint.objects.get().position, 3)
+
+    def test_import_board_invalid_line(self):
+        """
+        형식이 잘못된 줄이 있으면 줄 번호가 붙은 CommandError로 멈추는 커맨드 테스트.
+        """
+        get_user_model().objects.create_user('a@example.com', 'Test1234!')
+        cases = [
+            ('broken.jsonl', '{"author_email": "a@example.com", "title": "t", "content": "c"}\n\n{"title": ', ':3 '),
+            ('array.jsonl', '[1, 2]', ':1 '),
+            ('missing.jsonl', '{"author_email": "a@example.com", "content": "c"}', 'title'),
+            ('view_count.csv', 'author_email,title,content,view_count\na@example.com,t,c,many', ':2 '),
+        ]
+        for name, content, message in cases:
+            with self.subTest(name), self.assertRaisesMessage(CommandError, message):
+                call_command('import_board', posts=self.write(name, content), stdout=StringIO())
+
+        self.assertFalse(Post.objects.exists())
+
+    def test_import_board_reports_skipped_lines(self):
+        """
+        작성자를 찾을 수 없어 건너뛴 줄은 다시 실행해도 가져오지 않는다고 알려주는 커맨드 테스트.
+        """
+        posts = self.write('posts.jsonl', json.dumps({'author_email': 'nobody@example.com', 'title': 't', 'content': 'c'}))
+        stdout = StringIO()
+
+        call_command('import_board', posts=posts, stdout=stdout)
+
+        self.assertIn('(줄: 1)', stdout.getvalue())
+        self.assertIn('--restart', stdout.getvalue())
+
+
+class BenchCommandTests(TestCase):
+    def test_bench(self):
+        """
+        데이터를 만들어 시나리오별 응답 시간/쿼리 수를 JSON으로 출력하고, 만든 데이터는 남기지 않는 커맨드 테스트.
+        """
+        stdout = StringIO()
+
+        call_command(
+            'bench', users=5, posts=30, requests=3, warmup=1, scenarios=['posts_list_offset', 'post_detail'],
+            stdout=stdout, stderr=StringIO(),
+        )
+
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report['dataset']['posts'], 30)
+        self.assertEqual(set(report['scenarios']), {'posts_list_offset', 'post_detail'})
+        for result in report['scenarios'].values():
+            self.assertEqual(result['errors'], 0)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertLessEqual(result['p95_ms'], result['p99_ms'])
+            self.assertGreater(result['queries_per_request'], 0)
+        self.assertFalse(get_user_model().objects.exists())
+        self.assertFalse(Post.objects.exists())
+
+    def test_bench_unknown_scenario(self):
+        """
+        없는 시나리오를 지정하면 CommandError.
+        """
+        with self.assertRaises(CommandError):
+            call_command('bench', scenarios=['nope'], stdout=StringIO(), stderr=StringIO())
+
+
+class SeedBoardCommandTests(TestCase):
+    def test_seed_board(self):
+        """
+        옵션대로 유저/게시글을 만들고, 같은 seed면 같은 데이터를 만드는 커맨드 테스트.
+        """
+        options = {'users': 20, 'posts': 300, 'deleted_users': 0.5, 'deleted_posts': 0.5, 'batch_size': 64}
+
+        call_command('seed_board', seed=1, stdout=StringIO(), **options)
+
+        users = get_user_model().objects.filter(email__startswith='seed1-')
+        posts = Post.objects.filter(user__in=users)
+        self.assertEqual(users.count(), 20)
+        self.assertEqual(posts.count(), 300)
+        self.assertTrue(0 < users.filter(is_deleted=True).count() < 20)
+        self.assertTrue(0 < posts.filter(is_deleted=True).count() < 300)
+        self.assertEqual(Counter.objects.get_value(Counter.LIVE_POSTS), posts.filter(is_deleted=False).count())
+        self.assertTrue(users.first().check_password('Seed1234!'))
+
+        first_run = list(posts.order_by('pk').values_list('title', 'view_count', 'is_deleted'))
+        Post.objects.all().delete()
+        users.delete()
+        call_command('seed_board', seed=1, stdout=StringIO(), **options)
+        self.assertEqual(list(posts.order_by('pk').values_list('title', 'view_count', 'is_deleted')), first_run)
+
+        with self.assertRaises(CommandError):
+            call_command('seed_board', seed=1, stdout=StringIO(), **options)
+
+    def test_seed_board_author_skew(self):
+        """
+        --author-skew가 클수록 소수의 유저가 게시글을 많이 쓰는 커맨드 테스트.
+        """
+        call_command('seed_board', users=50, posts=1000, author_skew=0, seed=2, stdout=StringIO())
+        call_command('seed_board', users=50, posts=1000, author_skew=2, seed=3, stdout=StringIO())
+
+        def top_author_posts(seed):
+            posts = Post.objects.filter(user__email__startswith=f'seed{seed}-')
+            return max(posts.values('user').annotate(count=Count('pk')).values_list('count', flat=True))
+
+        self.assertLess(top_author_posts(2), top_author_posts(3))
@@ -0,0 +1,97 @@
+"""
+테스트 케이스:
+1. 반납된 커넥션을 다시 쓰고, 열린/쉬는/사용 중 커넥션 수를 집계하는 성공 테스트.
+2. 커넥션이 모두 사용 중이면 반납을 기다리고, timeout이 지나면 PoolTimeout 에러 테스트.
+3. 오래 쉬던 커넥션이 끊어졌으면 버리고 새로 여는 성공 테스트.
+4. warm()으로 min_size 개까지 미리 여는 성공 테스트.
+5. 운영자는 DB 연결 상태와 풀 통계를 조회할 수 있는 성공 테스트.
+"""
+import sqlite3
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.db.pool import ConnectionPool, PoolTimeout
+
+
+def connect():
+    return sqlite3.connect(':memory:', check_same_thread=False)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_reuse_connection_success(self):
+        """
+        반납된 커넥션을 다시 쓰고, 열린/쉬는/사용 중 커넥션 수를 집계하는 성공 테스트.
+        """
+        pool = ConnectionPool(connect, max_size=2)
+
+        conn = pool.acquire()
+        self.assertEqual(pool.stats()['in_use'], 1)
+        pool.release(conn)
+
+        self.assertIs(pool.acquire(), conn)
+        other = pool.acquire()
+        pool.release(other)
+        stats = pool.stats()
+        self.assertEqual((stats['open'], stats['idle'], stats['in_use']), (2, 1, 1))
+
+    def test_wait_and_timeout_error(self):
+        """
+        커넥션이 모두 사용 중이면 반납을 기다리고, timeout이 지나면 PoolTimeout 에러 테스트.
+        """
+        pool = ConnectionPool(connect, max_size=1, timeout=1)
+        conn = pool.acquire()
+        threading.Timer(0.05, pool.release, args=[conn]).start()
+
+        self.assertIs(pool.acquire(), conn)
+        self.assertEqual(pool.stats()['waits'], 1)
+        self.assertGreater(pool.stats()['wait_time_max'], 0)
+
+        pool.timeout = 0.01
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_discard_broken_connection_success(self):
+        """
+        오래 쉬던 커넥션이 끊어졌으면 버리고 새로 여는 성공 테스트.
+        """
+        pool = ConnectionPool(connect, validate=lambda conn: False, health_check_after=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        time.sleep(0.001)
+
+        self.assertIsNot(pool.acquire(), conn)
+        self.assertEqual(pool.stats()['open'], 1)
+
+    def test_warm_success(self):
+        """
+        warm()으로 min_size 개까지 미리 여는 성공 테스트.
+        """
+        pool = ConnectionPool(connect, min_size=3, max_size=5)
+
+        self.assertEqual(pool.warm(), 3)
+        self.assertEqual(pool.stats()['idle'], 3)
+        self.assertEqual(pool.warm(), 0)
+
+
+class DatabaseHealthApiTests(APITestCase):
+    def test_get_database_health_success(self):
+        """
+        운영자는 DB 연결 상태와 풀 통계를 조회할 수 있는 성공 테스트.
+        """
+        staff = get_user_model().objects.create_user('staff@example.com', 'Test1234!', is_staff=True)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + str(RefreshToken.for_user(staff).access_token))
+
+        res = self.client.get(reverse('core:db_health'))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.data['databases']['default']['ok'])
+        self.assertIsNone(res.data['databases']['default']['pool'])
@@ -0,0 +1,87 @@
+"""
+테스트 케이스:
+1. 샘플링된 요청은 Server-Timing 헤더와 쿼리 수/DB 시간/직렬화/렌더링 시간이 담긴 JSON 로그를 남기는 성공 테스트.
+2. 샘플링되지 않은 요청은 헤더와 로그를 남기지 않는 성공 테스트.
+3. 같은 SQL이 임계값 이상 반복되면 N+1 의심 쿼리로 경고 로그를 남기는 성공 테스트.
+"""
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from core.middleware import QueryInstrumentationMiddleware
+from core.models import Post
+
+
+class QueryInstrumentationMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            name="Test",
+            email="test@example.com",
+            password="Test1234!",
+        )
+        for i in range(3):
+            Post.objects.create(title=f'title {i}', content='content', user=self.user)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1)
+    def test_sampled_request_success(self):
+        """
+        샘플링된 요청은 Server-Timing 헤더와 쿼리 수/DB 시간/직렬화/렌더링 시간이 담긴 JSON 로그를 남기는 성공 테스트.
+        """
+        with self.assertLogs('core.metrics', level='INFO') as logs:
+            response = self.client.get('/api/v1/posts')
+
+        self.assertEqual(response.status_code, 200)
+        timing = response['Server-Timing']
+        for metric in ('db;dur=', 'serialize;dur=', 'render;dur=', 'total;dur='):
+            self.assertIn(metric, timing)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['event'], 'request')
+        self.assertEqual(record['path'], '/api/v1/posts')
+        self.assertEqual(record['status'], 200)
+        self.assertGreater(record['queries'], 0)
+        self.assertIn(f'desc="{record["queries"]} queries"', timing)
+        for key in ('db_ms', 'serialize_ms', 'render_ms', 'total_ms'):
+            self.assertIn(key, record)
+        self.assertEqual(record['repeated_queries'], 0)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+    def test_not_sampled_request_success(self):
+        """
+        샘플링되지 않은 요청은 헤더와 로그를 남기지 않는 성공 테스트.
+        """
+        with self.assertNoLogs('core.metrics'):
+            response = self.client.get('/api/v1/posts')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=1, N_PLUS_ONE_THRESHOLD=3)
+    def test_repeated_query_warning_success(self):
+        """
+        같은 SQL이 임계값 이상 반복되면 N+1 의심 쿼리로 경고 로그를 남기는 성공 테스트.
+        """
+        def get_response(request):
+            for post in Post.objects.all():
+                post.user.name
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(get_response)
+        with self.assertLogs('core.metrics', level='INFO') as logs:
+            middleware(RequestFactory().get('/api/v1/posts'))
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['queries'], 4)
+        self.assertEqual(record['repeated_queries'], 1)
+
+        warning = json.loads(logs.records[1].getMessage())
+        self.assertEqual(logs.records[1].levelname, 'WARNING')
+        self.assertEqual(warning['event'], 'repeated_query')
+        self.assertEqual(warning['count'], 3)
+        self.assertIn('core_user', warning['sql'])
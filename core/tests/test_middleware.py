@@ -0,0 +1,96 @@
+"""
+테스트 케이스:
+1. Accept-Encoding의 q값과 서버 선호 순서로 코덱을 고르는 성공 테스트.
+2. 임계값 이상의 응답은 gzip으로 압축하고 Vary: Accept-Encoding을 붙이는 성공 테스트.
+3. 작은 응답, 이미 압축된 형식, Accept-Encoding이 없는 요청은 압축하지 않는 성공 테스트.
+4. 스트리밍 응답을 이어서 압축하는 성공 테스트.
+5. ETag가 있는 응답은 압축 결과를 캐시해서 다시 압축하지 않는 성공 테스트.
+"""
+import gzip
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core import middleware
+from core.middleware import CompressionMiddleware, negotiate_encoding
+
+
+BODY = json.dumps({'results': [{'title': f'title {i}'} for i in range(200)]}).encode()
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def run_middleware(self, response, accept_encoding='gzip, deflate'):
+        request = self.factory.get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_negotiate_encoding_success(self):
+        """
+        Accept-Encoding의 q값과 서버 선호 순서로 코덱을 고르는 성공 테스트.
+        """
+        self.assertEqual(negotiate_encoding('gzip'), 'gzip')
+        self.assertEqual(negotiate_encoding('*'), next(iter(middleware.CODECS)))
+        self.assertIsNone(negotiate_encoding('gzip;q=0, deflate'))
+        self.assertIsNone(negotiate_encoding(''))
+        codecs = {'br': middleware._GzipCompressor, 'gzip': middleware._GzipCompressor}
+        with patch.object(middleware, 'CODECS', codecs):
+            self.assertEqual(negotiate_encoding('gzip;q=1.0, br;q=0.5'), 'gzip')
+            self.assertEqual(negotiate_encoding('gzip, br'), 'br')
+
+    def test_compress_large_response_success(self):
+        """
+        임계값 이상의 응답은 gzip으로 압축하고 Vary: Accept-Encoding을 붙이는 성공 테스트.
+        """
+        response = self.run_middleware(HttpResponse(BODY, content_type='application/json'))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), BODY)
+
+    def test_skip_compression_success(self):
+        """
+        작은 응답, 이미 압축된 형식, Accept-Encoding이 없는 요청은 압축하지 않는 성공 테스트.
+        """
+        small = self.run_middleware(HttpResponse(b'{}', content_type='application/json'))
+        image = self.run_middleware(HttpResponse(BODY, content_type='image/png'))
+        identity = self.run_middleware(HttpResponse(BODY, content_type='application/json'), accept_encoding='')
+
+        for response in (small, image, identity):
+            self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(identity.content, BODY)
+
+    def test_compress_streaming_response_success(self):
+        """
+        스트리밍 응답을 이어서 압축하는 성공 테스트.
+        """
+        lines = [json.dumps({'id': i}).encode() + b'\n' for i in range(1000)]
+        response = self.run_middleware(StreamingHttpResponse(iter(lines), content_type='application/x-ndjson'))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b''.join(lines))
+
+    def test_cache_compressed_variant_success(self):
+        """
+        ETag가 있는 응답은 압축 결과를 캐시해서 다시 압축하지 않는 성공 테스트.
+        """
+        def cached_response():
+            response = HttpResponse(BODY, content_type='application/json')
+            response['ETag'] = 'W/"posts-1"'
+            return response
+
+        first = self.run_middleware(cached_response())
+        with patch('core.middleware.compress') as compress:
+            second = self.run_middleware(cached_response())
+
+        compress.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], 'W/"posts-1"')
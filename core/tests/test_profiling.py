@@ -0,0 +1,146 @@
+"""
+테스트 케이스:
+1. 운영자의 X-Profile 요청은 프로파일을 저장하고 X-Profile-Id 헤더로 ID를 돌려주는 성공 테스트.
+2. 서명된 X-Profile 헤더면 운영자가 아니어도 프로파일링하고, memory 모드는 할당 스냅샷도 저장하는 성공 테스트.
+3. 운영자가 아니거나 서명이 틀리면 프로파일링하지 않는 성공 테스트.
+4. 서명된 값은 서명한 경로의 요청 한 번에만 쓸 수 있는 성공 테스트.
+5. PROFILING_MAX_FILES개가 넘으면 오래된 프로파일부터 지우는 성공 테스트.
+6. profiles list/show/sign 커맨드로 저장된 프로파일을 보고 서명된 값을 만드는 성공 테스트.
+"""
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.profiling import sign_mode
+
+
+POST_URL = '/api/v1/posts'
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        settings_override = override_settings(PROFILING_DIR=self.tempdir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            name="Test",
+            email="test@example.com",
+            password="Test1234!",
+        )
+        self.staff = get_user_model().objects.create_user(
+            name="Staff",
+            email="staff@example.com",
+            password="Test1234!",
+            is_staff=True,
+        )
+
+    def authenticate(self, user):
+        access_token = str(RefreshToken.for_user(user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access_token)
+
+    def stored_files(self):
+        return sorted(path.name for path in Path(self.tempdir.name).iterdir())
+
+    def test_staff_profile_success(self):
+        """
+        운영자의 X-Profile 요청은 프로파일을 저장하고 X-Profile-Id 헤더로 ID를 돌려주는 성공 테스트.
+        """
+        self.authenticate(self.staff)
+
+        response = self.client.get(POST_URL, HTTP_X_PROFILE='cpu')
+
+        self.assertEqual(response.status_code, 200)
+        profile_id = response['X-Profile-Id']
+        self.assertEqual(self.stored_files(), [f'{profile_id}.json', f'{profile_id}.prof'])
+
+    def test_signed_memory_profile_success(self):
+        """
+        서명된 X-Profile 헤더면 운영자가 아니어도 프로파일링하고, memory 모드는 할당 스냅샷도 저장하는 성공 테스트.
+        """
+        response = self.client.get(POST_URL, HTTP_X_PROFILE=sign_mode('memory', POST_URL))
+
+        profile_id = response['X-Profile-Id']
+        self.assertIn(f'{profile_id}.alloc', self.stored_files())
+
+    def test_not_allowed_success(self):
+        """
+        운영자가 아니거나 서명이 틀리면 프로파일링하지 않는 성공 테스트.
+        """
+        self.authenticate(self.user)
+        response = self.client.get(POST_URL, HTTP_X_PROFILE='cpu')
+        self.assertFalse(response.has_header('X-Profile-Id'))
+
+        self.client.credentials()
+        response = self.client.get(POST_URL, HTTP_X_PROFILE=sign_mode('cpu', POST_URL) + 'x')
+        self.assertFalse(response.has_header('X-Profile-Id'))
+
+        with self.settings(PROFILING_SIGNATURE_MAX_AGE=-1):
+            response = self.client.get(POST_URL, HTTP_X_PROFILE=sign_mode('cpu', POST_URL))
+        self.assertFalse(response.has_header('X-Profile-Id'))
+        self.assertEqual(self.stored_files(), [])
+
+    def test_signed_header_single_use_success(self):
+        """
+        서명된 값은 서명한 경로의 요청 한 번에만 쓸 수 있는 성공 테스트.
+        """
+        response = self.client.get(POST_URL, HTTP_X_PROFILE=sign_mode('cpu', '/api/v1/users/me'))
+        self.assertFalse(response.has_header('X-Profile-Id'))
+
+        header = sign_mode('cpu', POST_URL)
+        response = self.client.get(POST_URL, HTTP_X_PROFILE=header)
+        self.assertTrue(response.has_header('X-Profile-Id'))
+
+        response = self.client.get(POST_URL, HTTP_X_PROFILE=header)
+        self.assertFalse(response.has_header('X-Profile-Id'))
+        self.assertEqual(len(self.stored_files()), 2)
+
+    def test_prune_old_profiles_success(self):
+        """
+        PROFILING_MAX_FILES개가 넘으면 오래된 프로파일부터 지우는 성공 테스트.
+        """
+        self.authenticate(self.staff)
+
+        with self.settings(PROFILING_MAX_FILES=2):
+            profile_ids = [self.client.get(POST_URL, HTTP_X_PROFILE='memory')['X-Profile-Id'] for _ in range(3)]
+
+        self.assertEqual(
+            self.stored_files(),
+            sorted(f'{profile_id}{suffix}' for profile_id in profile_ids[1:] for suffix in ('.alloc', '.json', '.prof')),
+        )
+
+    def test_profiles_command_success(self):
+        """
+        profiles list/show/sign 커맨드로 저장된 프로파일을 보고 서명된 값을 만드는 성공 테스트.
+        """
+        profile_id = self.client.get(POST_URL, HTTP_X_PROFILE=sign_mode('memory', POST_URL))['X-Profile-Id']
+
+        stdout = StringIO()
+        call_command('profiles', 'list', stdout=stdout)
+        self.assertIn(profile_id, stdout.getvalue())
+        self.assertIn(f'GET {POST_URL}', stdout.getvalue())
+
+        stdout = StringIO()
+        call_command('profiles', 'show', profile_id, '--limit', '5', stdout=stdout)
+        self.assertIn('function calls', stdout.getvalue())
+        self.assertIn('할당이 많은 코드 위치', stdout.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command('profiles', 'show', '../nope', stdout=StringIO())
+
+        stdout = StringIO()
+        call_command('profiles', 'sign', POST_URL, '--mode', 'cpu', stdout=stdout)
+        header = stdout.getvalue().strip().split(': ', 1)[1]
+        self.assertTrue(self.client.get(POST_URL, HTTP_X_PROFILE=header).has_header('X-Profile-Id'))
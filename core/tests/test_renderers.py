@@ -0,0 +1,108 @@
+"""
+테스트 케이스:
+1. orjson 렌더러의 결과가 DRF 기본 JSONRenderer와 바이트 단위로 같은 성공 테스트.
+2. orjson이 없으면 기본 JSONRenderer/JSONParser로 동작하는 성공 테스트.
+3. 잘못된 JSON 본문이면 ParseError 에러 테스트.
+4. msgpack이 있으면 Accept/Content-Type: application/msgpack 으로 주고받는 성공 테스트.
+5. 잘못된 MessagePack 본문이면 400 에러 테스트.
+"""
+import io
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Post
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, msgpack
+
+
+DATA = {
+    'id': 1,
+    'title': '제목\u2028줄바꿈',
+    'created_at': datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc),
+    'score': Decimal('1.50'),
+    'results': [{'creator': '탈퇴한 유저', 'view_count': 0}],
+    'next': None,
+}
+
+
+class FastJSONRendererTests(APITestCase):
+    def test_render_matches_json_renderer_success(self):
+        """
+        orjson 렌더러의 결과가 DRF 기본 JSONRenderer와 바이트 단위로 같은 성공 테스트.
+        """
+        self.assertEqual(FastJSONRenderer().render(DATA), JSONRenderer().render(DATA))
+
+    def test_fallback_without_orjson_success(self):
+        """
+        orjson이 없으면 기본 JSONRenderer/JSONParser로 동작하는 성공 테스트.
+        """
+        with patch('core.renderers.orjson', None), patch('core.parsers.orjson', None):
+            rendered = FastJSONRenderer().render(DATA)
+            parsed = FastJSONParser().parse(io.BytesIO(rendered))
+
+        self.assertEqual(rendered, JSONRenderer().render(DATA))
+        self.assertEqual(parsed['title'], DATA['title'])
+
+    def test_parse_invalid_json_error(self):
+        """
+        잘못된 JSON 본문이면 ParseError 에러 테스트.
+        """
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"title": '))
+
+
+@unittest.skipIf(msgpack is None, 'msgpack is not installed')
+class MessagePackApiTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            name="Test",
+            email="test@example.com",
+            password="Test1234!",
+        )
+        Post.objects.create(title='title', content='content', user=self.user)
+        self.access_token = str(RefreshToken.for_user(self.user).access_token)
+
+    def test_post_list_and_batch_create_with_msgpack_success(self):
+        """
+        msgpack이 있으면 Accept/Content-Type: application/msgpack 으로 주고받는 성공 테스트.
+        """
+        res = self.client.get(reverse('posts:list_and_create'), HTTP_ACCEPT='application/msgpack')
+
+        self.assertEqual(res['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(res.content)['results'][0]['title'], 'title')
+
+        body = msgpack.packb([{'title': 'a', 'content': 'b'}, {'title': 'c', 'content': 'd'}])
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        res = self.client.post(reverse('posts:batch_create'), body, content_type='application/msgpack')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Post.objects.count(), 3)
+
+    def test_invalid_msgpack_body_error(self):
+        """
+        잘못된 MessagePack 본문이면 400 에러 테스트.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+
+        # 잘린 본문, 뒤에 남는 데이터, 배열을 맵의 키로 쓴 본문
+        for body in [msgpack.packb([{'title': 'a'}])[:-1], msgpack.packb([]) + b'\x01', b'\x81\x90\x01']:
+            res = self.client.post(reverse('posts:batch_create'), body, content_type='application/msgpack')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, body)
+
+        # 맵이 아닌 본문
+        for body in [msgpack.packb(1), msgpack.packb([{'title': 'a', 'content': 'b'}])]:
+            res = self.client.post(reverse('posts:list_and_create'), body, content_type='application/msgpack')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, body)
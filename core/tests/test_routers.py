@@ -0,0 +1,126 @@
+"""
+테스트 케이스:
+1. 요청 밖의 읽기와 모든 쓰기는 프라이머리로 가는 성공 테스트.
+2. use_replica() 안의 읽기는 레플리카로 가고, 레플리카가 없으면 프라이머리로 가는 성공 테스트.
+3. GET 요청은 레플리카에서 읽고, 쓰기 요청은 프라이머리에서 읽고 쿠키를 남기는 성공 테스트.
+4. 쓰기 직후(쿠키가 있는 동안)의 GET 요청은 프라이머리에서 읽는 성공 테스트.
+5. 레플리카에는 마이그레이션하지 않는 성공 테스트.
+6. 프라이머리에서 읽어야 하는 요청은 응답 캐시를 건너뛰는 성공 테스트.
+7. 실패한 쓰기 요청에는 쿠키를 남기지 않는 성공 테스트.
+8. 캐시를 무효화한 직후에는 레플리카에서 읽은 응답을 캐시하지 않는 성공 테스트.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.middleware import ReplicaRoutingMiddleware
+from core.models import Post
+from core.routers import use_replica
+from posts.cache import (
+    bump_list_generation, evict_detail, get_cached_detail, get_cached_list, set_cached_detail, set_cached_list,
+)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.read_from = None
+
+        def get_response(request):
+            self.read_from = router.db_for_read(Post)
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(get_response)
+
+    def test_default_to_primary_success(self):
+        """
+        요청 밖의 읽기와 모든 쓰기는 프라이머리로 가는 성공 테스트.
+        """
+        self.assertEqual(router.db_for_read(Post), 'default')
+        with use_replica():
+            self.assertEqual(router.db_for_write(Post), 'default')
+
+    def test_use_replica_success(self):
+        """
+        use_replica() 안의 읽기는 레플리카로 가고, 레플리카가 없으면 프라이머리로 가는 성공 테스트.
+        """
+        with use_replica():
+            self.assertEqual(router.db_for_read(Post), 'replica')
+            with self.settings(DATABASE_REPLICAS=[]):
+                self.assertEqual(router.db_for_read(Post), 'default')
+        self.assertEqual(router.db_for_read(Post), 'default')
+
+    def test_request_routing_success(self):
+        """
+        GET 요청은 레플리카에서 읽고, 쓰기 요청은 프라이머리에서 읽고 쿠키를 남기는 성공 테스트.
+        """
+        response = self.middleware(self.factory.get('/api/v1/posts'))
+        self.assertEqual(self.read_from, 'replica')
+        self.assertNotIn(settings.REPLICA_STICKY_COOKIE, response.cookies)
+
+        response = self.middleware(self.factory.post('/api/v1/posts'))
+        self.assertEqual(self.read_from, 'default')
+        self.assertEqual(response.cookies[settings.REPLICA_STICKY_COOKIE]['max-age'], settings.REPLICA_STICKY_SECONDS)
+
+    def test_sticky_after_write_success(self):
+        """
+        쓰기 직후(쿠키가 있는 동안)의 GET 요청은 프라이머리에서 읽는 성공 테스트.
+        """
+        request = self.factory.get('/api/v1/posts')
+        request.COOKIES[settings.REPLICA_STICKY_COOKIE] = '1'
+
+        self.middleware(request)
+
+        self.assertEqual(self.read_from, 'default')
+
+    def test_no_migrations_on_replica_success(self):
+        """
+        레플리카에는 마이그레이션하지 않는 성공 테스트.
+        """
+        self.assertFalse(router.allow_migrate('replica', 'core'))
+        self.assertTrue(router.allow_migrate('default', 'core'))
+
+    def test_skip_response_cache_when_pinned_success(self):
+        """
+        프라이머리에서 읽어야 하는 요청은 응답 캐시를 건너뛰는 성공 테스트.
+        """
+        set_cached_list('posts:list:test', {'results': []}, ('W/"posts-empty-0"', None))
+
+        with use_replica():
+            self.assertEqual(get_cached_list('posts:list:test')[0], {'results': []})
+        self.assertEqual(get_cached_list('posts:list:test'), (None, None))
+
+    def test_no_sticky_cookie_on_failed_write_success(self):
+        """
+        실패한 쓰기 요청에는 쿠키를 남기지 않는 성공 테스트.
+        """
+        middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse(status=400))
+
+        response = middleware(self.factory.post('/api/v1/posts'))
+
+        self.assertNotIn(settings.REPLICA_STICKY_COOKIE, response.cookies)
+
+    def test_skip_caching_replica_reads_after_invalidation_success(self):
+        """
+        캐시를 무효화한 직후에는 레플리카에서 읽은 응답을 캐시하지 않는 성공 테스트.
+        """
+        cache.clear()
+        validators = ('W/"posts-empty-0"', None)
+        bump_list_generation()
+        evict_detail(1)
+
+        with use_replica():
+            set_cached_list('posts:list:test', {'results': []}, validators)
+            set_cached_detail(1, {'id': 1, 'view_count': 0}, validators)
+            self.assertEqual(get_cached_list('posts:list:test'), (None, None))
+            self.assertEqual(get_cached_detail(1), (None, None))
+
+        # 프라이머리에서 읽은 응답은 바로 캐시한다.
+        set_cached_list('posts:list:test', {'results': []}, validators)
+        set_cached_detail(1, {'id': 1, 'view_count': 0}, validators)
+        with use_replica():
+            self.assertEqual(get_cached_list('posts:list:test')[0], {'results': []})
+            self.assertEqual(get_cached_detail(1)[0], {'id': 1, 'view_count': 1})
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from core import views
+
+
+app_name = 'core'
+
+urlpatterns = [
+    path('/db', views.DatabaseHealthView.as_view(), name='db_health'),
+]
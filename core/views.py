@@ -0,0 +1,42 @@
+from django.db import DatabaseError, connections
+from rest_framework import generics
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from core.db.pool import PoolTimeout, pool_stats
+from users.authentication import CachedJWTAuthentication
+
+
+class DatabaseHealthView(generics.GenericAPIView):
+    """
+    DB 연결 상태와 커넥션 풀 통계 조회 컨트롤러.
+    """
+
+    permission_classes = [IsAdminUser]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get(self, request, *args, **kwargs):
+        """
+        운영자 토큰으로 DB alias별 연결 여부와 이 프로세스의 커넥션 풀 통계를 가져오는 API
+
+        pool: open(열린 커넥션), idle(쉬는 커넥션), in_use(사용 중), waits/wait_time_total/wait_time_max(반납을 기다린 횟수/시간), timeouts
+        풀을 쓰지 않는 DB는 pool이 null이다.
+        """
+        databases = {}
+        for alias in connections:
+            connection = connections[alias]
+            try:
+                connection.ensure_connection()
+                ok = connection.is_usable()
+            except (DatabaseError, PoolTimeout):
+                ok = False
+            databases[alias] = {
+                'ok': ok,
+                'vendor': connection.vendor,
+                'conn_max_age': connection.settings_dict['CONN_MAX_AGE'],
+            }
+
+        stats = pool_stats()
+        for alias, database in databases.items():
+            database['pool'] = stats.get(alias)
+        return Response({'databases': databases})
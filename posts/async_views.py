@@ -0,0 +1,106 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from core.models import Post
+from posts.conditional import has_conditional_headers
+from posts.counters import aget_live_post_count, estimate_post_count
+from posts.exceptions import PostNotFoundException
+from posts.pagination import apaginate_by_cursor, apaginate_by_offset
+from posts.reads import (
+    ListRequest,
+    search_response,
+    cached_list_response,
+    page_response,
+    parse_detail_fields,
+    detail_queryset,
+    cached_detail_response,
+    detail_validators_queryset,
+    not_modified_detail_response,
+    detail_response,
+)
+
+
+class AsyncAPIView(APIView):
+    """
+    async 핸들러(async def get)를 쓰는 APIView.
+    DRF의 dispatch는 동기라서 dispatch만 async로 바꾸고, 요청 파싱/콘텐츠 협상/예외 처리/렌더링은 APIView를 그대로 쓴다.
+    인증이 필요 없는 조회 전용이라 인증(DB 조회)은 하지 않는다.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            # APIView가 만들어 둔 options 같은 동기 핸들러는 그대로 부른다.
+            response = handler(request, *args, **kwargs)
+            if iscoroutinefunction(handler):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncPostListView(AsyncAPIView):
+    """
+    게시글 목록 조회 async 컨트롤러. (PostListCreateView.get과 같은 응답)
+    DB 응답을 기다리는 동안 워커가 다른 요청을 처리할 수 있도록 비동기 ORM(async for)으로 읽는다.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        params = ListRequest(request.query_params)
+        if params.query:
+            return await sync_to_async(search_response)(params)
+
+        response = await sync_to_async(cached_list_response)(request, params)
+        if response is not None:
+            return response
+
+        if params.uses_cursor:
+            page = await apaginate_by_cursor(params.get_queryset(), params.cursor, params.limit, params.ordering)
+        else:
+            page = await apaginate_by_offset(params.get_queryset(), params.offset, params.limit, params.ordering)
+        if params.estimated_count:
+            count = await sync_to_async(estimate_post_count)()
+        else:
+            count = await aget_live_post_count()
+        return await sync_to_async(page_response)(request, params, page, count)
+
+
+class AsyncPostDetailView(AsyncAPIView):
+    """
+    게시글 상세 조회 async 컨트롤러. (PostRetrieveUpdateDestroyView.get과 같은 응답)
+    """
+
+    async def get(self, request, *args, **kwargs):
+        pk = kwargs['pk']
+        fields = parse_detail_fields(request)
+        response = await sync_to_async(cached_detail_response)(request, pk, fields)
+        if response is not None:
+            return response
+
+        if has_conditional_headers(request):
+            row = await detail_validators_queryset(pk).afirst()
+            response = await sync_to_async(not_modified_detail_response)(request, pk, row)
+            if response is not None:
+                return response
+
+        try:
+            post = await detail_queryset(fields).aget(pk=pk, is_deleted=False)
+        except Post.DoesNotExist:
+            raise PostNotFoundException
+
+        return await sync_to_async(detail_response)(post, fields)
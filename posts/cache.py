@@ -0,0 +1,138 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.routers import pinned_to_primary, reading_from_replica
+
+
+LIST_GENERATION_KEY = 'posts:list:generation'
+DETAIL_KEY = 'posts:detail:{}'
+DETAIL_VIEWS_KEY = 'posts:detail:{}:views'
+# 캐시를 무효화한 뒤 REPLICA_STICKY_SECONDS 동안 남는 표시. 이 동안은 레플리카에서 읽은 응답을 캐시하지 않는다.
+LIST_RECENT_WRITE_KEY = 'posts:list:recent_write'
+DETAIL_RECENT_WRITE_KEY = 'posts:detail:{}:recent_write'
+
+
+def _seed_list_generation():
+    """
+    세대 번호 키가 없으면(재시작, 캐시에서 밀려남 등) 현재 시각(ns)으로 다시 시작한다.
+    1부터 다시 세면 예전에 같은 번호로 캐시된 목록이 다시 유효해진다.
+    """
+    generation = time.time_ns()
+    cache.add(LIST_GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def get_list_generation():
+    """
+    게시글 목록 캐시의 현재 세대 번호를 가져오는 함수.
+    """
+    generation = cache.get(LIST_GENERATION_KEY)
+    if generation is None:
+        generation = cache.get(LIST_GENERATION_KEY, _seed_list_generation())
+    return generation
+
+
+def _mark_recent_write(*keys):
+    if settings.DATABASE_REPLICAS:
+        cache.set_many(dict.fromkeys(keys, 1), timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def _replica_may_lag(key):
+    """
+    레플리카에서 읽은 응답인데 최근에 무효화된 적이 있어서, 아직 복제되지 않은 예전 데이터일 수 있는지.
+    (그대로 캐시하면 쿠키가 만료된 뒤 쓴 사람도 캐시 유지 시간 동안 예전 데이터를 보게 된다)
+    """
+    return reading_from_replica() and cache.get(key) is not None
+
+
+def bump_list_generation():
+    """
+    게시글 목록 캐시의 세대 번호를 올려서, 이전 세대의 캐시를 한번에 무효화하는 함수.
+    키를 스캔해서 지우지 않고, 이전 세대 키들은 만료되도록 둔다.
+    """
+    try:
+        cache.incr(LIST_GENERATION_KEY)
+    except ValueError:
+        _seed_list_generation()
+        cache.incr(LIST_GENERATION_KEY)
+    _mark_recent_write(LIST_RECENT_WRITE_KEY)
+
+
+def list_cache_key(**params):
+    """
+    (ordering, limit, offset/cursor 등) 쿼리 파라미터로 목록 캐시 키를 만드는 함수.
+    """
+    raw = '&'.join(f'{key}={params[key]}' for key in sorted(params))
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'posts:list:{get_list_generation()}:{digest}'
+
+
+def get_cached_list(key):
+    """
+    캐시된 게시글 목록 응답을 (data, validators)로 가져오는 함수.
+    쓰기 직후라 프라이머리에서 읽어야 하는 요청이면 캐시를 건너뛴다. (core.routers.pinned_to_primary)
+    """
+    if pinned_to_primary():
+        return None, None
+    entry = cache.get(key)
+    if entry is None:
+        return None, None
+    return entry['data'], entry['validators']
+
+
+def set_cached_list(key, data, validators):
+    if _replica_may_lag(LIST_RECENT_WRITE_KEY):
+        return
+    entry = {'data': data, 'validators': validators}
+    cache.set(key, entry, timeout=settings.POST_LIST_CACHE_TIMEOUT)
+
+
+def get_cached_detail(pk):
+    """
+    캐시된 게시글 상세 응답을 (data, validators)로 가져오면서 캐시의 조회수를 1 올리는 함수.
+    조회수는 응답과 따로 저장해서, 캐시된 응답에 최신 조회수를 합쳐서 돌려준다.
+    """
+    if pinned_to_primary():
+        return None, None
+    entry = cache.get(DETAIL_KEY.format(pk))
+    if entry is None:
+        return None, None
+    try:
+        view_count = cache.incr(DETAIL_VIEWS_KEY.format(pk))
+    except ValueError:
+        return None, None
+    return {**entry['data'], 'view_count': view_count}, entry['validators']
+
+
+def set_cached_detail(pk, data, validators):
+    if _replica_may_lag(DETAIL_RECENT_WRITE_KEY.format(pk)):
+        return
+    timeout = settings.POST_DETAIL_CACHE_TIMEOUT
+    cache.set_many({
+        DETAIL_KEY.format(pk): {'data': data, 'validators': validators},
+        DETAIL_VIEWS_KEY.format(pk): data['view_count'],
+    }, timeout=timeout)
+
+
+def evict_detail(*pks):
+    """
+    게시글 상세 캐시를 지우는 함수.
+    """
+    keys = []
+    for pk in pks:
+        keys += [DETAIL_KEY.format(pk), DETAIL_VIEWS_KEY.format(pk)]
+    cache.delete_many(keys)
+    _mark_recent_write(*[DETAIL_RECENT_WRITE_KEY.format(pk) for pk in pks])
+
+
+def evict_posts_of_user(user):
+    """
+    작성자 이름이나 탈퇴 여부가 바뀌었을 때, 그 유저가 쓴 게시글의 상세 캐시와 목록 캐시를 지우는 함수.
+    """
+    from core.models import Post
+
+    evict_detail(*Post.objects.filter(user=user).values_list('pk', flat=True))
+    bump_list_generation()
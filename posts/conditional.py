@@ -0,0 +1,60 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def _timestamp(*datetimes):
+    return max(dt.timestamp() for dt in datetimes)
+
+
+def post_validators(pk, updated_at, user_updated_at):
+    """
+    게시글 상세의 (ETag, Last-Modified)를 게시글/작성자의 updated_at으로 만드는 함수.
+
+    응답의 view_count는 조회할 때마다 바뀌지만 게시글 내용이 바뀐 것은 아니므로 검증자에 포함하지 않는다.
+    그래서 바이트 단위로 같다는 보장이 없는 약한(W/) ETag를 쓴다.
+    """
+    timestamp = _timestamp(updated_at, user_updated_at)
+    return f'W/"post-{pk}-{int(timestamp * 1_000_000)}"', timestamp
+
+
+def list_validators(rows, count):
+    """
+    게시글 목록 한 페이지의 (ETag, Last-Modified)를 페이지에 담긴 게시글 id와 가장 최근 updated_at으로 만드는 함수.
+    rows는 posts.serializers.list_columns()로 읽은 values_list(named=True) 행이다. (작성자 컬럼은 없을 수 있음)
+    """
+    if not rows:
+        return f'W/"posts-empty-{count}"', None
+
+    user_updated_at = [row.user__updated_at for row in rows if hasattr(row, 'user__updated_at')]
+    timestamp = _timestamp(*[row.updated_at for row in rows], *user_updated_at)
+    raw = ','.join(str(row.id) for row in rows) + f':{count}:{int(timestamp * 1_000_000)}'
+    return f'W/"posts-{hashlib.md5(raw.encode()).hexdigest()}"', timestamp
+
+
+def get_not_modified_response(request, validators):
+    """
+    If-None-Match / If-Modified-Since 가 현재 검증자와 맞으면 304 응답을, 아니면 None을 돌려주는 함수.
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified) if last_modified is not None else None,
+    )
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response, validators):
+    etag, last_modified = validators
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def has_conditional_headers(request):
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
@@ -0,0 +1,45 @@
+from django.db import connections, router
+
+from core.models import Post, Counter
+
+
+def get_live_post_count():
+    """
+    게시글 생성/삭제/복구시 갱신되는 카운터에서 살아있는 게시글 수를 가져오는 함수. (O(1))
+    """
+    return Counter.objects.get_value(Counter.LIVE_POSTS)
+
+
+async def aget_live_post_count():
+    return await Counter.objects.aget_value(Counter.LIVE_POSTS)
+
+
+def estimate_post_count():
+    """
+    MySQL 테이블 통계(information_schema.TABLES.TABLE_ROWS)로 게시글 수를 추정하는 함수.
+    삭제된 게시글도 포함된 근사값이며, MySQL이 아니면 카운터 값을 돌려준다.
+    """
+    connection = connections[router.db_for_read(Post)]
+    if connection.vendor != 'mysql':
+        return get_live_post_count()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT TABLE_ROWS FROM information_schema.TABLES '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+            [Post._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    if not row or row[0] is None:
+        return get_live_post_count()
+    return int(row[0])
+
+
+def sync_live_post_count():
+    """
+    대량 작업 이후 등 카운터가 어긋났을 때, 실제 COUNT(*)로 카운터를 다시 맞추는 함수.
+    """
+    count = Post.objects.filter(is_deleted=False).count()
+    Counter.objects.update_or_create(name=Counter.LIVE_POSTS, defaults={'value': count})
+    return count
@@ -4,4 +4,40 @@ from rest_framework.exceptions import APIException
 class PostNotFoundException(APIException):
     status_code = 404
     default_code = 'PostNotFound'
-    default_detail = '해당 포스트가 존재하지 않습니다.'
\ No newline at end of file
+    default_detail = '해당 포스트가 존재하지 않습니다.'
+
+
+class InvalidCursorException(APIException):
+    status_code = 400
+    default_code = 'InvalidCursor'
+    default_detail = '유효한 커서가 아닙니다.'
+
+
+class InvalidPageParameterException(APIException):
+    status_code = 400
+    default_code = 'InvalidPageParameter'
+    default_detail = 'limit은 1 이상 MAX_PAGE_SIZE 이하, offset은 0 이상의 정수여야 합니다.'
+
+
+class InvalidOrderingException(APIException):
+    status_code = 400
+    default_code = 'InvalidOrdering'
+    default_detail = 'ordering은 created_at, -created_at, view_count, -view_count 중 하나여야 합니다.'
+
+
+class InvalidBulkFilterException(APIException):
+    status_code = 400
+    default_code = 'InvalidBulkFilter'
+    default_detail = '게시글 조건(ids, author, created_after, created_before)을 하나 이상 올바르게 입력해주세요.'
+
+
+class InvalidExportParameterException(APIException):
+    status_code = 400
+    default_code = 'InvalidExportParameter'
+    default_detail = 'type은 ndjson, csv 중 하나, since는 ISO 8601 형식이어야 합니다.'
+
+
+class InvalidFieldsException(APIException):
+    status_code = 400
+    default_code = 'InvalidFields'
+    default_detail = 'fields는 응답에 있는 필드 이름을 쉼표로 구분해서 입력해주세요.'
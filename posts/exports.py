@@ -0,0 +1,102 @@
+import csv
+import json
+
+from core.models import Post
+
+
+EXPORT_FIELDS = [
+    'id',
+    'title',
+    'content',
+    'user_id',
+    'creator',
+    'created_at',
+    'updated_at',
+    'view_count',
+    'is_deleted',
+]
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+_COLUMNS = [
+    'id',
+    'title',
+    'content',
+    'user_id',
+    'user__name',
+    'user__is_deleted',
+    'created_at',
+    'updated_at',
+    'view_count',
+    'is_deleted',
+]
+
+
+def iter_posts(since=None, chunk_size=1000, using=None):
+    """
+    전체 게시글을 pk 키셋으로 chunk_size 만큼씩 끊어 읽으면서 하나씩 돌려주는 제너레이터.
+    OFFSET을 쓰지 않아 뒤로 갈수록 느려지지 않고, 모델 인스턴스 없이 튜플로 읽어서 메모리 사용량이 테이블 크기와 상관없이 일정하다.
+
+    :param since: datetime. 있으면 그 이후에 생성/수정/삭제된 게시글만 (증분 내보내기)
+    :param using: 읽을 DB alias. 응답을 흘려보내는 동안에는 요청의 라우팅 상태가 남아있지 않으므로 미리 정해서 넘긴다.
+    """
+    queryset = Post.objects.using(using).order_by('pk')
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
+
+    last_pk = 0
+    while True:
+        rows = queryset.filter(pk__gt=last_pk).values_list(*_COLUMNS)[:chunk_size]
+        count = 0
+        for row in rows.iterator(chunk_size=chunk_size):
+            row = dict(zip(_COLUMNS, row))
+            count += 1
+            last_pk = row['id']
+            yield {
+                'id': row['id'],
+                'title': row['title'],
+                'content': row['content'],
+                'user_id': row['user_id'],
+                'creator': '탈퇴한 유저' if row['user__is_deleted'] else row['user__name'],
+                'created_at': row['created_at'].isoformat(),
+                'updated_at': row['updated_at'].isoformat(),
+                'view_count': row['view_count'],
+                'is_deleted': row['is_deleted'],
+            }
+        if count < chunk_size:
+            return
+
+
+def ndjson_lines(posts):
+    """
+    게시글을 한 줄에 하나씩 JSON으로 인코딩하는 제너레이터.
+    """
+    for post in posts:
+        yield json.dumps(post, ensure_ascii=False) + '\n'
+
+
+class _Echo:
+    """
+    csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼.
+    """
+    def write(self, value):
+        return value
+
+
+def csv_lines(posts):
+    """
+    게시글을 헤더가 있는 CSV로 한 줄씩 인코딩하는 제너레이터.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for post in posts:
+        yield writer.writerow([post[field] for field in EXPORT_FIELDS])
+
+
+def export_lines(export_format, since=None, chunk_size=1000, using=None):
+    posts = iter_posts(since=since, chunk_size=chunk_size, using=using)
+    if export_format == 'csv':
+        return csv_lines(posts)
+    return ndjson_lines(posts)
@@ -0,0 +1,194 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from posts.exceptions import InvalidCursorException, InvalidOrderingException, InvalidPageParameterException
+
+
+# ordering 파라미터 화이트리스트. 각 정렬은 (is_deleted, <field>, id) 복합 인덱스를 탄다.
+ORDERINGS = {
+    'created_at': ('created_at', False),
+    '-created_at': ('created_at', True),
+    'view_count': ('view_count', False),
+    '-view_count': ('view_count', True),
+}
+DEFAULT_ORDERING = '-created_at'
+DEFAULT_PAGE_SIZE = 10
+
+
+def parse_page_params(limit, offset):
+    """
+    limit/offset 파라미터를 검증하는 함수. limit은 1 ~ MAX_PAGE_SIZE, offset은 0 이상이어야 한다.
+
+    :return: (limit, offset)
+    """
+    try:
+        limit = int(limit) if limit is not None else DEFAULT_PAGE_SIZE
+        offset = int(offset) if offset is not None else 0
+    except ValueError:
+        raise InvalidPageParameterException
+    if not 1 <= limit <= settings.MAX_PAGE_SIZE or offset < 0:
+        raise InvalidPageParameterException
+    return limit, offset
+
+
+def get_ordering(ordering):
+    """
+    ordering 파라미터를 검증하는 함수. 없으면 최신순.
+    """
+    if not ordering:
+        ordering = DEFAULT_ORDERING
+    if ordering not in ORDERINGS:
+        raise InvalidOrderingException
+    return ordering
+
+
+def order_queryset(queryset, ordering, reverse=False):
+    """
+    정렬 필드와 id를 함께 정렬해서, 값이 같은 행도 순서가 고정되도록 하는 함수.
+    """
+    field, descending = ORDERINGS[ordering]
+    if reverse:
+        descending = not descending
+    prefix = '-' if descending else ''
+    return queryset.order_by(f'{prefix}{field}', f'{prefix}pk')
+
+
+def encode_cursor(post, ordering, direction='next'):
+    """
+    (정렬 필드 값, id)를 불투명한 커서 문자열로 인코딩하는 함수.
+    post는 모델 인스턴스나 values_list(named=True)의 행 모두 가능하다.
+    """
+    field, _ = ORDERINGS[ordering]
+    value = getattr(post, field)
+    payload = {
+        'o': ordering,
+        'v': value.isoformat() if field == 'created_at' else value,
+        'i': post.id,
+        'd': direction,
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, ordering):
+    """
+    커서 문자열을 (정렬 필드 값, id, direction)으로 디코딩하는 함수.
+    다른 ordering으로 만들어진 커서는 허용하지 않는다.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        field, _ = ORDERINGS[payload['o']]
+        if field == 'created_at':
+            value = parse_datetime(payload['v'])
+        else:
+            value = int(payload['v'])
+        pk = int(payload['i'])
+        direction = payload['d']
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorException
+
+    if payload['o'] != ordering or value is None or direction not in ('next', 'previous'):
+        raise InvalidCursorException
+    return value, pk, direction
+
+
+def _after(ordering, value, pk, reverse=False):
+    """
+    정렬 순서상 (value, pk) 다음에 오는 행을 찾는 키셋 조건.
+    """
+    field, descending = ORDERINGS[ordering]
+    if reverse:
+        descending = not descending
+    lookup = 'lt' if descending else 'gt'
+    return Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'pk__{lookup}': pk})
+
+
+def _cursor_page(queryset, cursor, ordering):
+    """
+    커서 위치부터 정렬된 쿼리셋과 방향을 만드는 함수. (아직 DB에 접근하지 않는다)
+
+    :return: (page queryset, direction). 커서가 없으면 direction은 None
+    """
+    if not cursor:
+        return order_queryset(queryset, ordering), None
+
+    value, pk, direction = decode_cursor(cursor, ordering)
+    if direction == 'next':
+        return order_queryset(queryset, ordering).filter(_after(ordering, value, pk)), direction
+    return order_queryset(queryset, ordering, reverse=True).filter(_after(ordering, value, pk, reverse=True)), direction
+
+
+def _cursor_result(posts, limit, ordering, direction):
+    """
+    limit + 1 개까지 읽은 행으로 (posts, next_cursor, previous_cursor)를 만드는 함수.
+    """
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+    if not posts:
+        return posts, None, None
+
+    if direction is None:
+        next_cursor = encode_cursor(posts[-1], ordering) if has_more else None
+        return posts, next_cursor, None
+
+    if direction == 'next':
+        next_cursor = encode_cursor(posts[-1], ordering) if has_more else None
+        previous_cursor = encode_cursor(posts[0], ordering, 'previous')
+        return posts, next_cursor, previous_cursor
+
+    posts = posts[::-1]
+    next_cursor = encode_cursor(posts[-1], ordering)
+    previous_cursor = encode_cursor(posts[0], ordering, 'previous') if has_more else None
+    return posts, next_cursor, previous_cursor
+
+
+def _offset_result(posts, offset, limit, ordering):
+    has_next = len(posts) > limit
+    posts = posts[:limit]
+    if not posts:
+        return posts, None, None
+    next_cursor = encode_cursor(posts[-1], ordering) if has_next else None
+    previous_cursor = encode_cursor(posts[0], ordering, 'previous') if offset > 0 else None
+    return posts, next_cursor, previous_cursor
+
+
+def paginate_by_cursor(queryset, cursor, limit, ordering=DEFAULT_ORDERING):
+    """
+    (정렬 필드, id) 복합 인덱스를 타는 키셋 페이지네이션.
+    OFFSET 없이 WHERE 조건으로 시작 위치를 찾기 때문에 페이지 깊이와 상관없이 비용이 같다.
+
+    :return: (posts, next_cursor, previous_cursor)
+    """
+    page, direction = _cursor_page(queryset, cursor, ordering)
+    return _cursor_result(list(page[:limit + 1]), limit, ordering, direction)
+
+
+async def apaginate_by_cursor(queryset, cursor, limit, ordering=DEFAULT_ORDERING):
+    """
+    paginate_by_cursor의 비동기 버전.
+    """
+    page, direction = _cursor_page(queryset, cursor, ordering)
+    return _cursor_result([post async for post in page[:limit + 1]], limit, ordering, direction)
+
+
+def paginate_by_offset(queryset, offset, limit, ordering=DEFAULT_ORDERING):
+    """
+    기존 limit/offset 방식. 하위 호환을 위해 유지하고, 다음 페이지부터는 커서로 넘어갈 수 있도록 커서를 함께 돌려준다.
+
+    :return: (posts, next_cursor, previous_cursor)
+    """
+    posts = list(order_queryset(queryset, ordering)[offset : offset + limit + 1])
+    return _offset_result(posts, offset, limit, ordering)
+
+
+async def apaginate_by_offset(queryset, offset, limit, ordering=DEFAULT_ORDERING):
+    """
+    paginate_by_offset의 비동기 버전.
+    """
+    posts = [post async for post in order_queryset(queryset, ordering)[offset : offset + limit + 1]]
+    return _offset_result(posts, offset, limit, ordering)
@@ -0,0 +1,185 @@
+"""
+게시글 목록/상세 조회 요청 처리 중 동기 뷰(posts.views)와 async 뷰(posts.async_views)가 같이 쓰는 부분.
+DB를 읽는 부분(페이지네이션, 게시글 조회)만 뷰마다 동기/비동기로 다르게 하고, 나머지는 여기서 한다.
+"""
+from rest_framework.response import Response
+
+from core.models import Post
+from posts.cache import list_cache_key, get_cached_list, set_cached_list, get_cached_detail, set_cached_detail
+from posts.conditional import post_validators, list_validators, get_not_modified_response, set_validators
+from posts.exceptions import PostNotFoundException
+from posts.pagination import get_ordering, parse_page_params
+from posts.search import search_posts
+from posts.serializers import PostSerializer, LIST_FIELDS, list_columns, parse_fields, serialize_post_list
+from posts.view_counts import record_view, get_pending_views, merge_pending_views
+
+
+class ListRequest:
+    """
+    게시글 목록 조회 요청의 파라미터.
+
+    :param limit: int
+    :param offset: int
+    :param cursor: str
+    :param ordering: str (created_at, -created_at, view_count, -view_count)
+    :param count: str (estimated면 MySQL 테이블 통계로 추정한 값)
+    :param q: str (검색어. 있으면 제목/내용 검색 결과를 관련도 순으로 limit/offset 페이지네이션)
+    :param fields: str (id,title,creator,view_count 중 응답에 포함할 필드. id는 항상 포함)
+    """
+
+    def __init__(self, params):
+        self.limit, self.offset = parse_page_params(params.get("limit"), params.get("offset"))
+        self.fields = parse_fields(params.get("fields"), LIST_FIELDS)
+        self.query = params.get("q")
+        self.cursor = params.get("cursor")
+        self.ordering = None if self.query else get_ordering(params.get("ordering"))
+        self.count_mode = params.get("count")
+
+    @property
+    def uses_cursor(self):
+        """
+        cursor가 있거나 첫 페이지면 키셋 페이지네이션, 아니면 하위 호환용 offset 페이지네이션.
+        """
+        return bool(self.cursor or not self.offset)
+
+    @property
+    def estimated_count(self):
+        return self.count_mode == 'estimated'
+
+    def get_queryset(self):
+        """
+        목록은 모델 인스턴스 없이 필요한 컬럼만 튜플로 읽는다. (serialize_post_list)
+        """
+        return Post.objects.filter(is_deleted=False) \
+                           .values_list(*list_columns(self.fields), named=True)
+
+    def cache_key(self):
+        return list_cache_key(
+            ordering=self.ordering, limit=self.limit, offset=self.offset, cursor=self.cursor or '',
+            count=self.count_mode or '', fields=','.join(self.fields or ()),
+        )
+
+
+def search_response(params):
+    """
+    역색인(PostTerm)으로 게시글을 검색한 목록 응답.
+    """
+    posts, count = search_posts(params.query, params.limit, params.offset, list_columns(params.fields))
+    data = {
+        'count': count,
+        'results': merge_pending_views(serialize_post_list(posts, params.fields))
+    }
+    return Response(data)
+
+
+def cached_list_response(request, params):
+    """
+    캐시된 목록 응답 (또는 304). 캐시에 없으면 None.
+    """
+    data, validators = get_cached_list(params.cache_key())
+    if data is None:
+        return None
+    return list_response(request, data, validators)
+
+
+def page_response(request, params, page, count):
+    """
+    DB에서 읽은 페이지로 목록 응답 (또는 304)을 만들고, 응답을 캐시하는 함수.
+
+    :param page: (posts, next_cursor, previous_cursor)
+    """
+    posts, next_cursor, previous_cursor = page
+    validators = list_validators(posts, count)
+    not_modified = get_not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+
+    data = {
+        'count': count,
+        'next': next_cursor,
+        'previous': previous_cursor,
+        'results': serialize_post_list(posts, params.fields)
+    }
+    set_cached_list(params.cache_key(), data, validators)
+    data['results'] = merge_pending_views(data['results'])
+    return set_validators(Response(data), validators)
+
+
+def list_response(request, data, validators):
+    """
+    조회수는 DB 값에 아직 반영되지 않은 증가분을 더해서 보여준다. (정렬은 DB 값 기준)
+    """
+    not_modified = get_not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+    data = {**data, 'results': merge_pending_views(data['results'])}
+    return set_validators(Response(data), validators)
+
+
+def parse_detail_fields(request):
+    return parse_fields(request.query_params.get("fields"), PostSerializer.Meta.fields)
+
+
+def detail_queryset(fields):
+    """
+    ?fields=에 content가 없으면 content 컬럼은 읽지 않는다.
+    """
+    queryset = Post.objects.select_related('user')
+    if fields is not None and 'content' not in fields:
+        queryset = queryset.defer('content')
+    return queryset
+
+
+def cached_detail_response(request, pk, fields):
+    """
+    캐시된 상세 응답 (또는 304). 캐시에 없으면 None.
+    fields가 있으면 캐시된 전체 응답에서 잘라서 준다.
+    """
+    data, validators = get_cached_detail(pk)
+    if data is None:
+        return None
+    record_view(pk)
+    not_modified = get_not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+    if fields is not None:
+        data = {field: data[field] for field in fields}
+    return set_validators(Response(data), validators)
+
+
+def detail_validators_queryset(pk):
+    """
+    게시글 행 전체를 읽지 않고 ETag/Last-Modified만 계산하기 위한 쿼리셋. (.first()/.afirst()로 읽는다)
+    """
+    return Post.objects.filter(pk=pk, is_deleted=False).values_list('updated_at', 'user__updated_at')
+
+
+def not_modified_detail_response(request, pk, row):
+    """
+    게시글 행을 읽기 전에 (updated_at, user__updated_at)만으로 304를 돌려줄 수 있으면 304, 아니면 None.
+    304 응답도 조회 1회로 센다.
+    """
+    if row is None:
+        raise PostNotFoundException
+    not_modified = get_not_modified_response(request, post_validators(pk, *row))
+    if not_modified is not None:
+        record_view(pk)
+    return not_modified
+
+
+def detail_response(post, fields):
+    """
+    DB에서 읽은 게시글로 상세 응답을 만드는 함수. 전체 필드 응답이면 캐시한다.
+    """
+    if post.is_deleted:
+        raise PostNotFoundException
+
+    record_view(post.pk)
+    post.view_count += get_pending_views(post.pk).get(post.pk, 0)
+
+    data = PostSerializer(post, fields=fields).data
+    validators = post_validators(post.pk, post.updated_at, post.user.updated_at)
+    if fields is None:
+        set_cached_detail(post.pk, dict(data), validators)
+
+    return set_validators(Response(data), validators)
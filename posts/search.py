@@ -0,0 +1,121 @@
+import math
+import re
+import unicodedata
+from collections import Counter as TermCounter
+
+from django.db.models import Case, Count, F, FloatField, Sum, When
+
+from core.models import Post, PostTerm
+from posts.counters import get_live_post_count
+
+
+WORD_RE = re.compile(r'\w+')
+HANGUL_RE = re.compile(r'([가-힣]+)')
+MAX_TERM_LENGTH = 50
+TITLE_WEIGHT = 3
+
+
+def normalize(text):
+    """
+    대소문자와 악센트를 없애는 함수. ex) 'Café' -> 'cafe'
+    MySQL의 _ai_ci 콜레이션에서 같은 값으로 보는 토큰('cafe'/'café')이 post_term_unique에 걸리지 않도록 색인 전에 맞춘다.
+    (NFKD로 분해한 한글은 NFC로 다시 합친다)
+    """
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return unicodedata.normalize('NFC', stripped)
+
+
+def tokenize(text):
+    """
+    검색어/본문을 색인 토큰으로 나누는 함수.
+
+    한글은 형태소 분석 없이 찾을 수 있도록 2글자씩 끊은 바이그램으로, 그 외 단어는 normalize한 단어 그대로 색인한다.
+    ex) '게시판 Django Café' -> ['게시', '시판', 'django', 'cafe']
+    """
+    tokens = []
+    for word in WORD_RE.findall(normalize(text)):
+        for part in HANGUL_RE.split(word):
+            if not part:
+                continue
+            if HANGUL_RE.fullmatch(part):
+                if len(part) == 1:
+                    tokens.append(part)
+                else:
+                    tokens += [part[i:i + 2] for i in range(len(part) - 1)]
+            else:
+                tokens.append(part.strip('_')[:MAX_TERM_LENGTH])
+    return [token for token in tokens if token]
+
+
+def build_terms(post):
+    """
+    게시글 하나의 PostTerm 목록을 만드는 함수. 제목에 나온 토큰은 가중치를 더 준다.
+    """
+    weights = TermCounter(tokenize(post.content))
+    for term in tokenize(post.title):
+        weights[term] += TITLE_WEIGHT
+    return [PostTerm(term=term, post_id=post.pk, weight=weight) for term, weight in weights.items()]
+
+
+def index_post(post):
+    """
+    게시글을 역색인에 다시 반영하는 함수. 삭제된 게시글은 색인에서 빠진다.
+    """
+    PostTerm.objects.filter(post_id=post.pk).delete()
+    if not post.is_deleted:
+        # normalize로도 못 맞춘 콜레이션 충돌이 게시글 저장을 실패시키지 않도록 중복은 무시한다.
+        PostTerm.objects.bulk_create(build_terms(post), ignore_conflicts=True)
+
+
+def index_posts(posts, batch_size=1000):
+    """
+    여러 게시글을 한 번에 색인하는 함수. (대량 생성/색인 재구성용)
+
+    :return: 만든 PostTerm 수
+    """
+    terms = []
+    for post in posts:
+        if not post.is_deleted:
+            terms += build_terms(post)
+    PostTerm.objects.bulk_create(terms, batch_size=batch_size, ignore_conflicts=True)
+    return len(terms)
+
+
+def search_posts(query, limit, offset, columns=None):
+    """
+    검색어의 모든 토큰을 포함한 게시글을 tf-idf 점수 순으로 찾는 함수.
+
+    :param columns: 읽을 컬럼. 없으면 LIST_COLUMNS
+    :return: (columns 행 목록, count)
+    """
+    from posts.serializers import LIST_COLUMNS
+
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return [], 0
+
+    postings = PostTerm.objects.filter(term__in=terms)
+
+    document_count = max(get_live_post_count(), 1)
+    frequencies = dict(postings.values_list('term').annotate(Count('post')).order_by())
+    if len(frequencies) < len(terms):
+        return [], 0
+
+    idf = {term: math.log(1 + document_count / frequencies[term]) for term in terms}
+    score = Sum(
+        Case(
+            *[When(term=term, then=F('weight') * idf[term]) for term in terms],
+            output_field=FloatField(),
+        )
+    )
+    ranked = postings.values('post_id') \
+                     .annotate(matched=Count('term'), score=score) \
+                     .filter(matched=len(terms)) \
+                     .order_by('-score', '-post_id')
+
+    count = ranked.count()
+    ids = [row['post_id'] for row in ranked[offset : offset + limit]]
+    rows = Post.objects.filter(pk__in=ids, is_deleted=False).values_list(*(columns or LIST_COLUMNS), named=True)
+    rows = {row.id: row for row in rows}
+    return [rows[pk] for pk in ids if pk in rows], count
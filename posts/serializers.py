@@ -1,6 +1,27 @@
+from django.db import DatabaseError, connections, router
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 
-from core.models import Post
+from core.metrics import record_timing
+from core.models import Post, Counter
+from posts.exceptions import InvalidFieldsException
+from posts.search import index_posts
+
+
+def parse_fields(value, allowed):
+    """
+    ?fields=id,title 파라미터를 검증해서 allowed 순서대로 돌려주는 함수. 없으면 None(전체 필드).
+    id는 항상 포함한다.
+    """
+    if not value:
+        return None
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown or not requested:
+        raise InvalidFieldsException(f'fields는 {", ".join(allowed)} 중에서 쉼표로 구분해서 입력해주세요.')
+    requested.add('id')
+    return [field for field in allowed if field in requested]
 
 
 class PostListSerializer(serializers.ModelSerializer):
@@ -20,6 +41,144 @@ class PostListSerializer(serializers.ModelSerializer):
         return obj.user.name
 
 
+LIST_FIELDS = PostListSerializer.Meta.fields
+
+# 목록 조회시 모델 인스턴스 없이 읽는 컬럼. (커서/ETag 계산용 컬럼 포함)
+LIST_COLUMNS = [
+    'id',
+    'title',
+    'user__name',
+    'user__is_deleted',
+    'view_count',
+    'created_at',
+    'updated_at',
+    'user__updated_at',
+]
+
+# 응답 필드별로 읽어야 하는 컬럼. 여기 없는 id, view_count, created_at, updated_at은 커서/ETag 계산에 항상 필요하다.
+_LIST_FIELD_COLUMNS = {
+    'title': ['title'],
+    'creator': ['user__name', 'user__is_deleted', 'user__updated_at'],
+}
+
+
+def list_columns(fields=None):
+    """
+    요청한 필드만 응답하는 데 필요한 컬럼 목록. creator가 없으면 users 테이블과 JOIN 하지 않는다.
+    """
+    if fields is None:
+        return LIST_COLUMNS
+    skipped = {column for field, columns in _LIST_FIELD_COLUMNS.items() if field not in fields for column in columns}
+    return [column for column in LIST_COLUMNS if column not in skipped]
+
+
+def _creator(row):
+    return '탈퇴한 유저' if row.user__is_deleted else row.user__name
+
+
+_LIST_FIELD_VALUES = {
+    'id': lambda row: row.id,
+    'title': lambda row: row.title,
+    'creator': _creator,
+    'view_count': lambda row: row.view_count,
+}
+
+
+def serialize_post_list(rows, fields=None):
+    """
+    PostListSerializer(many=True).data와 같은 결과를 모델 인스턴스/시리얼라이저 없이 만드는 함수.
+    rows는 list_columns(fields)로 읽은 values_list(named=True) 행이다.
+    """
+    with record_timing('serialize'):
+        if fields is not None:
+            getters = [(field, _LIST_FIELD_VALUES[field]) for field in fields]
+            return [{field: getter(row) for field, getter in getters} for row in rows]
+        return [
+            {
+                'id': row.id,
+                'title': row.title,
+                'creator': _creator(row),
+                'view_count': row.view_count,
+            }
+            for row in rows
+        ]
+
+
+def first_inserted_pk(connection, count):
+    """
+    이 커넥션에서 방금 실행한 multi-row INSERT의 첫 번째 auto-increment 값을 가져오는 함수.
+    MySQL의 LAST_INSERT_ID()는 첫 행, SQLite의 last_insert_rowid()는 마지막 행의 값이다.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute('SELECT LAST_INSERT_ID()')
+            return cursor.fetchone()[0]
+        cursor.execute('SELECT last_insert_rowid()')
+        return cursor.fetchone()[0] - count + 1
+
+
+class PostBulkCreateSerializer(serializers.ListSerializer):
+    """
+    게시글 일괄 생성 시리얼라이저. (PostSerializer(many=True)로 사용)
+    일부 항목만 유효하면 유효한 항목만 생성하고, 나머지 항목의 에러는 item_errors에 인덱스별로 남긴다.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            message = self.error_messages['not_a_list'].format(input_type=type(data).__name__)
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [message]}, code='not_a_list')
+
+        if not data:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [self.error_messages['empty']]}, code='empty')
+
+        if self.max_length is not None and len(data) > self.max_length:
+            message = self.error_messages['max_length'].format(max_length=self.max_length)
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [message]}, code='max_length')
+
+        ret = []
+        self.item_errors = {}
+        self.valid_indexes = []
+        for index, item in enumerate(data):
+            try:
+                validated = self.run_child_validation(item)
+            except ValidationError as exc:
+                self.item_errors[index] = exc.detail
+            else:
+                ret.append(validated)
+                self.valid_indexes.append(index)
+
+        if not ret:
+            raise ValidationError([self.item_errors[index] for index in range(len(data))])
+        return ret
+
+    def create(self, validated_data):
+        """
+        bulk_create로 한 번에 INSERT 하는 메서드. bulk_create는 시그널을 보내지 않으므로 카운터와 검색 색인을 직접 갱신한다.
+        """
+        posts = [Post(**attrs) for attrs in validated_data]
+        connection = connections[router.db_for_write(Post)]
+
+        if connection.features.can_return_rows_from_bulk_insert:
+            Post.objects.bulk_create(posts)
+        else:
+            # MySQL은 bulk_create 후 pk를 돌려주지 않는다. 한 번의 multi-row INSERT(simple insert)로 넣으면
+            # auto-increment 값이 연속으로 잡히므로, 첫 pk부터 넣은 개수만큼만 다시 읽는다.
+            # (같은 유저의 동시 요청이 넣은 행은 이 범위에 들어오지 않는다)
+            Post.objects.bulk_create(posts, batch_size=len(posts))
+            first_pk = first_inserted_pk(connection, len(posts))
+            posts = list(
+                Post.objects.filter(pk__gte=first_pk, pk__lt=first_pk + len(posts))
+                            .select_related('user')
+                            .order_by('pk')
+            )
+            if len(posts) != len(validated_data):
+                raise DatabaseError(f'일괄 생성한 게시글 {len(validated_data)}개 중 {len(posts)}개만 찾았습니다.')
+
+        Counter.objects.increment(Counter.LIVE_POSTS, len(validated_data))
+        index_posts(posts)
+        return posts
+
+
 class PostSerializer(serializers.ModelSerializer):
     """
     게시글 생성/조회/수정/삭제시, 제목, 내용, 사용자 이름, 작성시간, 수정시간(수정되지 않았다면 빈값..) 보여주는 시리얼라이저.
@@ -39,6 +198,21 @@ class PostSerializer(serializers.ModelSerializer):
             'view_count',
             'is_deleted',
         ]
+        list_serializer_class = PostBulkCreateSerializer
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """
+        :param fields: 응답에 남길 필드 목록. (sparse fieldsets)
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @property
+    def data(self):
+        with record_timing('serialize'):
+            return super().data
 
     def get_creator(self, obj):
         if obj.user.is_deleted:
@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Post, PostTerm, Counter
+from posts.cache import bump_list_generation, evict_detail
+from posts.search import index_posts
+
+
+def soft_delete_post(post):
+    """
+    게시글 하나를 UPDATE ... WHERE is_deleted = false 로 삭제하는 함수.
+    같은 게시글을 동시에 삭제해도 실제로 바뀐 요청만 카운터를 줄이고 색인을 지운다. (bulk_set_deleted와 같은 방식)
+
+    :return: 이 호출로 삭제됐으면 True
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        deleted = Post.objects.filter(pk=post.pk, is_deleted=False).update(is_deleted=True, updated_at=now)
+        if deleted:
+            Counter.objects.increment(Counter.LIVE_POSTS, -1)
+            PostTerm.objects.filter(post_id=post.pk).delete()
+            post.updated_at = now
+        transaction.on_commit(bump_list_generation)
+        transaction.on_commit(lambda: evict_detail(post.pk))
+    post.is_deleted = post._loaded_is_deleted = True
+    return bool(deleted)
+
+
+def bulk_set_deleted(queryset, is_deleted, chunk_size=1000):
+    """
+    조건에 맞는 게시글을 pk 순서로 chunk_size 만큼씩 잘라서 UPDATE ... SET is_deleted 하는 함수.
+    chunk마다 트랜잭션을 나눠서 행 잠금 시간을 짧게 유지한다.
+    QuerySet.update()는 시그널을 보내지 않으므로 카운터/검색 색인/캐시를 직접 갱신한다.
+
+    :return: 실제로 바뀐 게시글 수
+    """
+    queryset = queryset.filter(is_deleted=not is_deleted).order_by('pk')
+    affected = 0
+    last_pk = 0
+
+    while True:
+        with transaction.atomic():
+            ids = list(
+                queryset.filter(pk__gt=last_pk)
+                        .select_for_update(of=('self',))
+                        .values_list('pk', flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+
+            updated = Post.objects.filter(pk__in=ids).update(is_deleted=is_deleted, updated_at=timezone.now())
+            Counter.objects.increment(Counter.LIVE_POSTS, -updated if is_deleted else updated)
+            if is_deleted:
+                PostTerm.objects.filter(post_id__in=ids).delete()
+            else:
+                index_posts(Post.objects.filter(pk__in=ids).only('title', 'content', 'is_deleted'))
+            transaction.on_commit(lambda ids=ids: evict_detail(*ids))
+
+        affected += updated
+        last_pk = ids[-1]
+
+    if affected:
+        bump_list_generation()
+    return affected
@@ -0,0 +1,44 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.models import Post, Counter
+from posts.search import index_post
+
+
+SEARCH_FIELDS = {'title', 'content', 'is_deleted'}
+
+
+@receiver(post_save, sender=Post)
+def update_live_post_count_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    게시글 생성/삭제/복구시 살아있는 게시글 카운터를 증감하는 시그널.
+    """
+    if created:
+        delta = 0 if instance.is_deleted else 1
+    else:
+        loaded = getattr(instance, '_loaded_is_deleted', None)
+        if loaded is None or (update_fields is not None and 'is_deleted' not in update_fields):
+            return
+        delta = int(loaded) - int(instance.is_deleted)
+
+    Counter.objects.increment(Counter.LIVE_POSTS, delta)
+    instance._loaded_is_deleted = instance.is_deleted
+
+
+@receiver(post_save, sender=Post)
+def update_search_index_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    게시글 생성/수정/삭제/복구시 검색 색인을 갱신하는 시그널.
+    """
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def update_live_post_count_on_delete(sender, instance, **kwargs):
+    """
+    게시글이 실제로 삭제될 때, 살아있는 게시글이었다면 카운터를 감소하는 시그널.
+    """
+    if instance.__dict__.get('is_deleted') is False:
+        Counter.objects.increment(Counter.LIVE_POSTS, -1)
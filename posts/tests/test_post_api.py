@@ -1,26 +1,57 @@
 """
 1. 게시글 목록 - 인증되지 않은 상태에서 요청할 수 있음
     - GET /api/v1/posts
-    - GET /api/v1/posts?page=1&ordering=view_count
-    - GET /api/v1/posts?page=1&ordering=created_at
+    - GET /api/v1/posts?limit=10&offset=0&ordering=-view_count
+    - GET /api/v1/posts?limit=10&offset=0&ordering=created_at
     - return 제목, 사용자 이름, 조회수
     - 토큰이 없어도 목록이 조회되는 성공 케이스
     - limit, offset의 디폴트는 10, 0 으로 갯수가 10개인지 보여주는 케이스, 데이터가 10개 미만일 수 있음.
     - 탈퇴한 유저의 글인 포함된 경우, 사용자 이름이 '탈퇴한 유저'라고 보여지는 케이스
     - 삭제된 게시글은 조회되지 않음
+    - 모델 인스턴스 없이 만든 목록 응답이 PostListSerializer와 바이트 단위로 같은 케이스
+    - GET /api/v1/posts?cursor=...&limit=10
+    - next/previous 커서로 중복이나 누락 없이 전체 목록을 순회하는 케이스
+    - 유효하지 않은 커서면 InvalidCursorException
+    - limit이 1 ~ MAX_PAGE_SIZE 밖이거나 offset이 음수/정수가 아니면 InvalidPageParameterException
+    - ordering 파라미터로 조회수/작성일 정렬이 되는 케이스 (커서 방식 포함)
+    - 허용되지 않은 ordering이면 InvalidOrderingException
+    - count는 페이지 크기가 아니라 삭제되지 않은 전체 게시글 수
+    - GET /api/v1/posts?q=검색어
+    - 제목/내용(한글 포함)으로 검색하고, 제목에 나온 게시글이 먼저 보여지는 케이스
+    - 수정/삭제된 게시글은 검색 색인에 바로 반영되는 케이스
+    - 대소문자/악센트만 다른 단어('Café'/'cafe')는 같은 토큰으로 색인되고 검색되는 케이스
+    - GET /api/v1/posts?fields=id,title
+    - 요청한 필드만 보여주고, 작성자가 필요 없으면 users 테이블과 JOIN 하지 않는 케이스
+    - 없는 필드를 요청하면 InvalidFieldsException
 
 2. 게시글 생성 - 인증된 상태에서 요청할 수 있음
     - POST /api/v1/posts
     - jwt토큰으로 게시글 생성 성공 케이스
     - 토큰이 없으면 401 에러
     - 제목과 내용이 없으면 EmptyInputException
+    - 요청 본문이 객체가 아니면 400 에러 (생성/수정)
     - 제목이 100자 이상이면 Over100ContentException
 
+2-1. 게시글 일괄 생성 - 인증된 상태에서 요청할 수 있음
+    - POST /api/v1/posts/batch
+    - jwt토큰과 게시글 배열로 한 번에 생성 성공 케이스
+    - bulk_create가 pk를 돌려주지 않는 DB(MySQL)에서도 넣은 행만 다시 읽는 케이스
+    - 일부 항목이 유효하지 않으면 유효한 항목만 생성하고 207로 항목별 결과를 보여주는 케이스
+    - 모든 항목이 유효하지 않거나 배열이 아니면 400 에러
+
 3. 게시글 조회 - 인증되지 않은 상태에서 요청할 수 있음
     - GET /api/v1/posts/{post_id}
     - return 제목, 내용, 사용자 이름, 작성시간, 수정시간(수정되지 않았다면 빈값..)
     - 토큰 없어도 게시글 조회하는 성공 케이스
     - 요청이 들어올떄마다 view_count가 1 증가하는지 확인하는 케이스
+    - 상세 응답이 캐시되어 게시글 행을 읽지 않고, 조회수는 최신값으로 합쳐지는 케이스
+    - GET /api/v1/posts/<id>?fields=title,creator
+    - content를 요청하지 않으면 content 컬럼을 읽지 않고, 캐시된 전체 응답도 잘라서 보여주는 케이스
+    - 목록의 조회수는 아직 DB에 반영되지 않은 증가분까지 더해서 보여지는 케이스
+    - 조회수 증가분은 flush시 게시글별로 모아서 반영되는 케이스
+    - flush 후에도 캐시된 목록의 조회수가 줄어들지 않는 케이스
+    - 응답 캐시가 가득 차서 항목을 밀어내도 쌓인 조회수를 잃지 않는 케이스
+    - ETag/Last-Modified가 같으면 304 Not Modified를 돌려주는 케이스 (목록/상세)
     - 탈퇴한 유저의 글인 경우, 사용자 이름이 '탈퇴한 유저'라고 보여지는 케이스
     - 삭제된 게시글을 조회할 때 PostNotFoundException
     - post_pk가 존재하지 않는 경우 PostNotFoundException - self.get_object()에서 처리됨
@@ -28,18 +59,55 @@
 4. 게시글 수정 - 인증된 상태에서 요청할 수 있음
     - PUT /api/v1/posts/{post_id}
     - jwt토큰으로 게시글 제목이나 내용 수정 케이스
+    - 게시글 수정/작성자 탈퇴시 상세 캐시가 지워지는 케이스
     - jwt토큰의 유저와 게시글 작성 유저가 다를 경우 에러 케이스 IsNotMe
     - post_pk가 존재하지 않는 경우 PostNotFoundException - self.get_object()에서 처리됨
 
 5. 게시글 삭제 - 인증된 상태에서 요청할 수 있음
     - DELETE /api/v1/posts/{post_id}
     - jwt토큰으로 게시글 삭제 케이스
+    - 게시글 생성/삭제시 목록의 count가 함께 바뀌는 케이스
+    - 같은 게시글을 동시에 삭제해도 count는 한 번만 줄어드는 케이스
+    - 목록 응답은 캐시되고, 게시글 생성시 캐시가 무효화되는 케이스
+    - 세대 번호 키가 캐시에서 사라져도, 예전 세대로 캐시된 목록을 다시 쓰지 않는 케이스
     - jwt토큰의 유저와 게시글 작성 유저가 다를 경우 에러 케이스 IsNotMe
     - post_pk가 존재하지 않는 경우 PostNotFoundException - self.get_object()에서 처리됨
+
+6. 게시글 일괄 삭제/복구 - 인증된 상태에서 요청할 수 있음
+    - POST /api/v1/posts/bulk-delete, POST /api/v1/posts/bulk-restore
+    - ids/작성자/작성일 조건으로 본인 게시글만 일괄 삭제되고, 복구되는 케이스
+    - 운영자는 다른 유저의 게시글도 일괄 삭제할 수 있는 케이스
+    - 조건이 없거나 본문이 JSON 객체가 아니면 InvalidBulkFilterException
+    - ids가 정수 배열이 아니면 InvalidBulkFilterException
+
+7. 게시글 내보내기 - 운영자만 요청할 수 있음
+    - GET /api/v1/posts/export?type=ndjson|csv&since=...
+    - 전체 게시글(삭제 포함)을 NDJSON/CSV로 스트리밍하는 케이스
+    - since 이후에 수정된 게시글만 내보내는 케이스
+    - 운영자가 아니면 403 에러
+
+8. 게시글 async 조회 - 인증되지 않은 상태에서 요청할 수 있음
+    - GET /api/v1/posts/async, GET /api/v1/posts/async/{post_id}
+    - 동기 뷰와 같은 목록/상세 응답을 돌려주는 케이스
+    - 삭제된 게시글이나 잘못된 파라미터는 동기 뷰와 같은 에러 응답
+    - DRF 콘텐츠 협상/렌더러를 거쳐서, 지원하지 않는 Accept면 406
+    - OPTIONS는 동기 뷰처럼 200, 허용하지 않는 메서드는 405
 """
 
+import csv
+import io
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 from rest_framework import status
 from rest_framework.test import (
@@ -48,10 +116,23 @@ from rest_framework.test import (
 )
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from core.models import Post
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Post, PostTerm
+from posts.async_views import AsyncPostListView
+from posts.cache import LIST_GENERATION_KEY
+from posts.counters import get_live_post_count
+from posts.exceptions import PostNotFoundException
+from posts.services import soft_delete_post
+from posts.serializers import PostListSerializer, LIST_COLUMNS, serialize_post_list
+from posts.view_counts import DIRTY_SEQ_KEY, flush_view_counts, view_count_cache
 
 
 POST_URL = reverse('posts:list_and_create')
+POST_BATCH_URL = reverse('posts:batch_create')
+POST_BULK_DELETE_URL = reverse('posts:bulk_delete')
+POST_BULK_RESTORE_URL = reverse('posts:bulk_restore')
+POST_EXPORT_URL = reverse('posts:export')
 
 
 class PublicPostApiTests(APITestCase):
@@ -60,6 +141,8 @@ class PublicPostApiTests(APITestCase):
     """
 
     def setUp(self):
+        cache.clear()
+        view_count_cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             name="Test",
@@ -81,6 +164,220 @@ class PublicPostApiTests(APITestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+    def test_fast_list_serialization_matches_serializer_success(self):
+        """
+        모델 인스턴스 없이 만든 목록 응답이 PostListSerializer와 바이트 단위로 같은 케이스
+        """
+        deleted_user = get_user_model().objects.create_user(
+            name="Test2",
+            email="test2@example.com",
+            password="Test1234!",
+            is_deleted=True
+        )
+        Post.objects.create(title='탈퇴한 유저의 글 😀', content='content', user=deleted_user, view_count=7)
+        queryset = Post.objects.order_by('pk')
+
+        expected = PostListSerializer(queryset.select_related('user'), many=True).data
+        fast = serialize_post_list(queryset.values_list(*LIST_COLUMNS, named=True))
+
+        self.assertEqual(JSONRenderer().render(fast), JSONRenderer().render(expected))
+        self.assertEqual(fast[1]['creator'], '탈퇴한 유저')
+
+    def test_get_post_list_with_cursor_success(self):
+        """
+        next/previous 커서로 중복이나 누락 없이 전체 목록을 순회하는 케이스
+        """
+        for i in range(6):
+            Post.objects.create(title=f'title {i}', content='content', user=self.user)
+        expected = list(Post.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+        seen = []
+        res = self.client.get(POST_URL, {'limit': 3})
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            seen += [post['id'] for post in res.data['results']]
+            if res.data['next'] is None:
+                break
+            res = self.client.get(POST_URL, {'limit': 3, 'cursor': res.data['next']})
+
+        self.assertEqual(seen, expected)
+
+        res = self.client.get(POST_URL, {'limit': 3, 'cursor': res.data['previous']})
+
+        self.assertEqual([post['id'] for post in res.data['results']], expected[3:6])
+
+    def test_get_post_list_with_offset_returns_cursor(self):
+        """
+        limit/offset 방식도 그대로 동작하고, 다음 페이지 커서를 함께 주는 케이스
+        """
+        for i in range(4):
+            Post.objects.create(title=f'title {i}', content='content', user=self.user)
+        expected = list(Post.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+        res = self.client.get(POST_URL, {'limit': 2, 'offset': 1})
+
+        self.assertEqual([post['id'] for post in res.data['results']], expected[1:3])
+        res = self.client.get(POST_URL, {'limit': 2, 'cursor': res.data['next']})
+        self.assertEqual([post['id'] for post in res.data['results']], expected[3:5])
+
+    def test_get_post_list_with_invalid_cursor_error(self):
+        """
+        유효하지 않은 커서면 InvalidCursorException
+        """
+        res = self.client.get(POST_URL, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_post_list_with_invalid_page_params_error(self):
+        """
+        limit이 1 ~ MAX_PAGE_SIZE 밖이거나 offset이 음수/정수가 아니면 InvalidPageParameterException
+        """
+        params = [
+            {'limit': 0},
+            {'limit': -1},
+            {'limit': 'x'},
+            {'limit': settings.MAX_PAGE_SIZE + 1},
+            {'offset': -1},
+            {'offset': 'x'},
+            {'q': 'title', 'limit': 0},
+        ]
+        for param in params:
+            with self.subTest(param):
+                res = self.client.get(POST_URL, param)
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.get(POST_URL, {'limit': settings.MAX_PAGE_SIZE})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_get_post_list_with_ordering_success(self):
+        """
+        ordering 파라미터로 조회수/작성일 정렬이 되는 케이스 (커서 방식 포함)
+        """
+        for view_count in [5, 3, 5, 0, 9]:
+            Post.objects.create(title='title', content='content', user=self.user, view_count=view_count)
+        by_views = list(Post.objects.order_by('-view_count', '-pk').values_list('pk', flat=True))
+        by_created = list(Post.objects.order_by('created_at', 'pk').values_list('pk', flat=True))
+
+        res = self.client.get(POST_URL, {'ordering': '-view_count', 'limit': 2, 'offset': 1})
+        self.assertEqual([post['id'] for post in res.data['results']], by_views[1:3])
+
+        res = self.client.get(POST_URL, {'ordering': '-view_count', 'limit': 2, 'cursor': res.data['next']})
+        self.assertEqual([post['id'] for post in res.data['results']], by_views[3:5])
+
+        res = self.client.get(POST_URL, {'ordering': 'created_at', 'limit': 4})
+        self.assertEqual([post['id'] for post in res.data['results']], by_created[:4])
+
+        res = self.client.get(POST_URL, {'ordering': '-created_at', 'cursor': res.data['next']})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_post_list_with_invalid_ordering_error(self):
+        """
+        허용되지 않은 ordering이면 InvalidOrderingException
+        """
+        res = self.client.get(POST_URL, {'ordering': 'content'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_post_list_count_is_total_success(self):
+        """
+        count는 페이지 크기가 아니라 삭제되지 않은 전체 게시글 수
+        """
+        for i in range(4):
+            Post.objects.create(title=f'title {i}', content='content', user=self.user)
+        Post.objects.create(title='deleted', content='content', user=self.user, is_deleted=True)
+
+        res = self.client.get(POST_URL, {'limit': 2})
+
+        self.assertEqual(len(res.data['results']), 2)
+        self.assertEqual(res.data['count'], 5)
+
+    def test_search_posts_success(self):
+        """
+        제목/내용(한글 포함)으로 검색하고, 제목에 나온 게시글이 먼저 보여지는 케이스
+        """
+        in_content = Post.objects.create(title='공지', content='자유게시판 Django 이용 안내', user=self.user)
+        in_title = Post.objects.create(title='자유게시판 규칙', content='서로 존중해주세요', user=self.user)
+        Post.objects.create(title='질문', content='게시글 작성 방법', user=self.user)
+
+        res = self.client.get(POST_URL, {'q': '게시판'})
+
+        self.assertEqual(res.data['count'], 2)
+        self.assertEqual([post['id'] for post in res.data['results']], [in_title.pk, in_content.pk])
+
+        res = self.client.get(POST_URL, {'q': 'DJANGO 안내'})
+        self.assertEqual([post['id'] for post in res.data['results']], [in_content.pk])
+
+        res = self.client.get(POST_URL, {'q': '없는단어'})
+        self.assertEqual(res.data['count'], 0)
+
+    def test_search_accent_insensitive_success(self):
+        """
+        대소문자/악센트만 다른 단어('Café'/'cafe')는 같은 토큰으로 색인되고 검색되는 케이스
+        """
+        post = Post.objects.create(title='Café 추천', content='cafe CAFÉ café', user=self.user)
+
+        self.assertEqual(PostTerm.objects.filter(post=post, term='cafe').count(), 1)
+        res = self.client.get(POST_URL, {'q': 'CAFE'})
+        self.assertEqual([item['id'] for item in res.data['results']], [post.pk])
+
+    def test_search_index_follows_update_and_delete_success(self):
+        """
+        수정/삭제된 게시글은 검색 색인에 바로 반영되는 케이스
+        """
+        post = Post.objects.create(title='title', content='사과', user=self.user)
+
+        post.content = '바나나'
+        post.save(update_fields=['content'])
+        self.assertEqual(self.client.get(POST_URL, {'q': '사과'}).data['count'], 0)
+        self.assertEqual(self.client.get(POST_URL, {'q': '바나나'}).data['count'], 1)
+
+        post.is_deleted = True
+        post.save(update_fields=['is_deleted'])
+        self.assertEqual(self.client.get(POST_URL, {'q': '바나나'}).data['count'], 0)
+
+    def test_get_post_list_with_fields_success(self):
+        """
+        요청한 필드만 보여주고, 작성자가 필요 없으면 users 테이블과 JOIN 하지 않는 케이스
+        """
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(POST_URL, {'fields': 'title'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['results'], [{'id': self.post.pk, 'title': self.post.title}])
+        page_sql = [query['sql'] for query in queries.captured_queries if 'core_post' in query['sql']]
+        self.assertTrue(page_sql)
+        self.assertFalse(any('JOIN' in sql for sql in page_sql))
+
+        res = self.client.get(POST_URL)
+        self.assertEqual(set(res.data['results'][0]), {'id', 'title', 'creator', 'view_count'})
+
+    def test_get_post_list_with_invalid_fields_error(self):
+        """
+        없는 필드를 요청하면 InvalidFieldsException
+        """
+        res = self.client.get(POST_URL, {'fields': 'title,content'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_post_detail_with_fields_defers_content_success(self):
+        """
+        content를 요청하지 않으면 content 컬럼을 읽지 않고, 캐시된 전체 응답도 잘라서 보여주는 케이스
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(POST_DETAIL_URL, {'fields': 'title,creator'})
+
+        self.assertEqual(res.data, {'id': self.post.pk, 'title': self.post.title, 'creator': self.user.name})
+        self.assertFalse(any('"content"' in query['sql'] for query in queries.captured_queries))
+
+        self.client.get(POST_DETAIL_URL)
+        res = self.client.get(POST_DETAIL_URL, {'fields': 'content'})
+        self.assertEqual(res.data, {'id': self.post.pk, 'content': self.post.content})
+
+        res = self.client.get(POST_DETAIL_URL, {'fields': 'password'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_get_post_detail_without_jwt_success(self):
         """
         return 제목, 내용, 사용자 이름, 작성시간, 수정시간(수정되지 않았다면 빈값..)
@@ -103,15 +400,143 @@ class PublicPostApiTests(APITestCase):
         res = self.client.get(POST_DETAIL_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['view_count'], 1)
+        flush_view_counts()
         self.post.refresh_from_db()
         self.assertEqual(self.post.view_count, 1)
 
         res = self.client.get(POST_DETAIL_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['view_count'], 2)
+        flush_view_counts()
         self.post.refresh_from_db()
         self.assertEqual(self.post.view_count, 2)
 
+    def test_post_detail_cached_with_live_view_count_success(self):
+        """
+        상세 응답이 캐시되어 게시글 행을 읽지 않고, 조회수는 최신값으로 합쳐지는 케이스
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+
+        self.client.get(POST_DETAIL_URL)
+        with self.assertNumQueries(0):
+            res = self.client.get(POST_DETAIL_URL)
+
+        self.assertEqual(res.data['view_count'], 2)
+        self.assertEqual(res.data['title'], self.post.title)
+
+    def test_post_list_includes_pending_views_success(self):
+        """
+        목록의 조회수는 아직 DB에 반영되지 않은 증가분까지 더해서 보여지는 케이스
+        """
+        self.client.get(POST_URL)
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+        self.client.get(POST_DETAIL_URL)
+        self.client.get(POST_DETAIL_URL)
+
+        res = self.client.get(POST_URL)
+
+        self.assertEqual(res.data['results'][0]['view_count'], 2)
+
+    def test_flush_view_counts_batches_pending_views_success(self):
+        """
+        조회수 증가분은 flush시 게시글별로 모아서 반영되는 케이스
+        """
+        other = Post.objects.create(title='title', content='content', user=self.user)
+        for pk in [self.post.pk, other.pk, self.post.pk]:
+            self.client.get(reverse('posts:detail', kwargs={'pk': pk}))
+
+        self.assertEqual(flush_view_counts(), 3)
+        self.assertEqual(flush_view_counts(), 0)
+
+        self.post.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.post.view_count, other.view_count), (2, 1))
+
+    def test_list_view_count_never_decreases_after_flush_success(self):
+        """
+        flush 후에도 캐시된 목록의 조회수가 줄어들지 않는 케이스
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+        for _ in range(2):
+            self.client.get(POST_DETAIL_URL)
+        self.assertEqual(self.client.get(POST_URL).data['results'][0]['view_count'], 2)
+
+        for _ in range(3):
+            self.client.get(POST_DETAIL_URL)
+        self.assertEqual(self.client.get(POST_URL).data['results'][0]['view_count'], 5)
+
+        self.assertEqual(flush_view_counts(), 5)
+        self.assertEqual(self.client.get(POST_URL).data['results'][0]['view_count'], 5)
+
+        self.client.get(POST_DETAIL_URL)
+        self.assertEqual(self.client.get(POST_URL).data['results'][0]['view_count'], 6)
+
+    def test_view_counts_survive_cache_eviction_success(self):
+        """
+        응답 캐시가 가득 차서 항목을 밀어내도, 조회수 버퍼의 증가분은 잃지 않고 모두 반영되는 케이스
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+        for _ in range(3):
+            self.client.get(POST_DETAIL_URL)
+
+        max_entries = settings.CACHES['default']['OPTIONS']['MAX_ENTRIES']
+        cache.set_many({f'filler:{i}': i for i in range(max_entries * 2)})
+
+        self.assertEqual(flush_view_counts(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 3)
+
+        # 버퍼가 비워져 순번이 다시 시작해도 flush가 멈추지 않는다.
+        view_count_cache.delete(DIRTY_SEQ_KEY)
+        self.client.get(POST_DETAIL_URL)
+        self.assertEqual(flush_view_counts(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 4)
+
+    def test_post_detail_not_modified_success(self):
+        """
+        ETag/Last-Modified가 같으면 304 Not Modified를 돌려주는 케이스 (상세)
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+        res = self.client.get(POST_DETAIL_URL)
+        etag = res['ETag']
+
+        self.assertTrue(etag.startswith('W/'))
+        self.assertIn('Last-Modified', res)
+
+        res = self.client.get(POST_DETAIL_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        cache.clear()
+        with self.assertNumQueries(1):
+            res = self.client.get(POST_DETAIL_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Post.objects.filter(pk=self.post.pk).update(title='New title', updated_at=timezone.now())
+        res = self.client.get(POST_DETAIL_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+
+    def test_post_list_not_modified_success(self):
+        """
+        ETag/Last-Modified가 같으면 304 Not Modified를 돌려주는 케이스 (목록)
+        """
+        res = self.client.get(POST_URL)
+        etag = res['ETag']
+
+        res = self.client.get(POST_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        res = self.client.get(POST_URL, HTTP_IF_MODIFIED_SINCE=res['Last-Modified'])
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        cache.clear()
+        Post.objects.create(title='title', content='content', user=self.user)
+        res = self.client.get(POST_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
     def test_inactive_user_name_check(self):
         """
         탈퇴한 유저의 글인 경우, 사용자 이름이 '탈퇴한 유저'라고 보여지는 케이스
@@ -140,6 +565,8 @@ class PrivatePostApiTests(APITestCase):
     인증이 필요한 APIs 테스트.
     """
     def setUp(self):
+        cache.clear()
+        view_count_cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             name="Test",
@@ -193,6 +620,19 @@ class PrivatePostApiTests(APITestCase):
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_non_object_body_error(self):
+        """
+        요청 본문이 객체가 아니면 400 에러. (생성/수정)
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        for body in [[{'title': 'title', 'content': 'content'}], 1, 'title']:
+            res = self.client.post(POST_URL, body, format='json')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.patch(reverse('posts:detail', kwargs={'pk': self.post.pk}), ['title'], format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_new_post_not_create_with_over_100_title_error(self):
         """
         제목이 100자 이상이면 Over100ContentException.
@@ -206,3 +646,377 @@ class PrivatePostApiTests(APITestCase):
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_post_count_follows_create_and_delete_success(self):
+        """
+        게시글 생성/삭제시 목록의 count가 함께 바뀌는 케이스
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        payload = {
+            'title': 'This is title',
+            'content': 'This is content',
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(POST_URL, payload)
+        self.assertEqual(self.client.get(POST_URL).data['count'], 2)
+
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': res.data['id']})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(POST_DETAIL_URL)
+            self.client.delete(POST_DETAIL_URL)
+
+        self.assertEqual(self.client.get(POST_URL).data['count'], 1)
+
+    def test_concurrent_delete_decrements_count_once_success(self):
+        """
+        같은 게시글을 동시에 삭제해도(두 요청이 모두 삭제 전 상태를 읽은 경우) count는 한 번만 줄어드는 케이스
+        """
+        first, second = Post.objects.get(pk=self.post.pk), Post.objects.get(pk=self.post.pk)
+        before = get_live_post_count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(soft_delete_post(first))
+            self.assertFalse(soft_delete_post(second))
+
+        self.assertEqual(get_live_post_count(), before - 1)
+        self.assertTrue(Post.objects.get(pk=self.post.pk).is_deleted)
+
+    def test_post_list_cache_invalidated_on_create_success(self):
+        """
+        목록 응답은 캐시되고, 게시글 생성시 캐시가 무효화되는 케이스
+        """
+        self.client.get(POST_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(POST_URL)
+        self.assertEqual(len(res.data['results']), 1)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        payload = {
+            'title': 'This is title',
+            'content': 'This is content',
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(POST_URL, payload)
+
+        res = self.client.get(POST_URL)
+        self.assertEqual(len(res.data['results']), 2)
+
+    def test_post_list_cache_not_reused_after_generation_lost_success(self):
+        """
+        세대 번호 키가 캐시에서 사라져도, 예전 세대로 캐시된 목록을 다시 쓰지 않는 케이스
+        """
+        self.client.get(POST_URL)
+        Post.objects.create(title='title', content='content', user=self.user)
+
+        cache.delete(LIST_GENERATION_KEY)
+
+        res = self.client.get(POST_URL)
+        self.assertEqual(len(res.data['results']), 2)
+
+    def test_post_detail_cache_evicted_on_update_success(self):
+        """
+        게시글 수정/작성자 탈퇴시 상세 캐시가 지워지는 케이스
+        """
+        POST_DETAIL_URL = reverse('posts:detail', kwargs={'pk': self.post.pk})
+        self.client.get(POST_DETAIL_URL)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(POST_DETAIL_URL, {'title': 'New title'})
+        res = self.client.get(POST_DETAIL_URL)
+        self.assertEqual(res.data['title'], 'New title')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('users:me'))
+        res = self.client.get(POST_DETAIL_URL)
+        self.assertEqual(res.data['creator'], '탈퇴한 유저')
+        self.assertEqual(res.data['view_count'], 3)
+
+    def test_batch_create_posts_success(self):
+        """
+        jwt토큰과 게시글 배열로 한 번에 생성 성공 케이스
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        payload = [{'title': f'title {i}', 'content': '일괄 생성'} for i in range(3)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(POST_BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['created'], 3)
+        self.assertEqual([item['data']['title'] for item in res.data['results']], ['title 0', 'title 1', 'title 2'])
+        self.assertEqual(self.client.get(POST_URL).data['count'], 4)
+        self.assertEqual(self.client.get(POST_URL, {'q': '일괄'}).data['count'], 3)
+
+    def test_batch_create_posts_without_returning_success(self):
+        """
+        bulk_create가 pk를 돌려주지 않는 DB(MySQL)에서도 넣은 행만 다시 읽어서 요청 순서대로 보여주는 케이스
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        payload = [{'title': f'title {i}', 'content': '일괄 생성'} for i in range(3)]
+
+        features = type(connection.features)
+        with patch.object(features, 'can_return_rows_from_bulk_insert', False), \
+                self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(POST_BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        created = [item['data'] for item in res.data['results']]
+        self.assertEqual([post['title'] for post in created], ['title 0', 'title 1', 'title 2'])
+        self.assertEqual(
+            [post['id'] for post in created],
+            list(Post.objects.filter(title__startswith='title ').order_by('pk').values_list('pk', flat=True)),
+        )
+        self.assertEqual(self.client.get(POST_URL).data['count'], 4)
+
+    def test_batch_create_posts_partial_failure(self):
+        """
+        일부 항목이 유효하지 않으면 유효한 항목만 생성하고 207로 항목별 결과를 보여주는 케이스
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        payload = [
+            {'title': 'ok', 'content': 'content'},
+            {'title': '', 'content': 'content'},
+            {'title': 'post' * 26, 'content': 'content'},
+        ]
+
+        res = self.client.post(POST_BATCH_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual((res.data['created'], res.data['failed']), (1, 2))
+        self.assertEqual([item['status'] for item in res.data['results']], [201, 400, 400])
+        self.assertIn('title', res.data['results'][1]['errors'])
+        self.assertEqual(Post.objects.count(), 2)
+
+    def test_batch_create_posts_invalid_error(self):
+        """
+        모든 항목이 유효하지 않거나 배열이 아니면 400 에러
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        res = self.client.post(POST_BATCH_URL, [{'title': ''}], format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.post(POST_BATCH_URL, {'title': 'title', 'content': 'content'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Post.objects.count(), 1)
+
+    def test_bulk_delete_and_restore_own_posts_success(self):
+        """
+        ids/작성자/작성일 조건으로 본인 게시글만 일괄 삭제되고, 복구되는 케이스
+        """
+        other_user = get_user_model().objects.create_user(
+            name="Other",
+            email="other@example.com",
+            password="Test1234!",
+        )
+        mine = [Post.objects.create(title='스팸', content='spam', user=self.user) for _ in range(3)]
+        others = Post.objects.create(title='스팸', content='spam', user=other_user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        with self.settings(POST_BULK_UPDATE_CHUNK_SIZE=2):
+            res = self.client.post(
+                POST_BULK_DELETE_URL,
+                {'ids': [post.pk for post in mine] + [others.pk]},
+                format='json',
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['affected'], 3)
+        self.assertEqual(Post.objects.filter(is_deleted=True).count(), 3)
+        self.assertEqual(self.client.get(POST_URL).data['count'], 2)
+        self.assertEqual(self.client.get(POST_URL, {'q': '스팸'}).data['count'], 1)
+
+        res = self.client.post(POST_BULK_RESTORE_URL, {'author': self.user.email}, format='json')
+
+        self.assertEqual(res.data['affected'], 3)
+        self.assertEqual(self.client.get(POST_URL).data['count'], 5)
+        self.assertEqual(self.client.get(POST_URL, {'q': '스팸'}).data['count'], 4)
+
+    def test_bulk_delete_by_staff_success(self):
+        """
+        운영자는 다른 유저의 게시글도 일괄 삭제할 수 있는 케이스
+        """
+        staff = get_user_model().objects.create_user(
+            name="Staff",
+            email="staff@example.com",
+            password="Test1234!",
+            is_staff=True,
+        )
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + str(RefreshToken.for_user(staff).access_token))
+
+        res = self.client.post(
+            POST_BULK_DELETE_URL,
+            {'created_after': (self.post.created_at - timedelta(minutes=1)).isoformat()},
+            format='json',
+        )
+
+        self.assertEqual(res.data['affected'], 1)
+        self.post.refresh_from_db()
+        self.assertTrue(self.post.is_deleted)
+
+    def test_bulk_delete_without_filter_error(self):
+        """
+        조건이 없거나 본문이 JSON 객체가 아니면 InvalidBulkFilterException
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        res = self.client.post(POST_BULK_DELETE_URL, {}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.post(POST_BULK_DELETE_URL, {'created_before': 'yesterday'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.post(POST_BULK_DELETE_URL, [self.post.pk], format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_delete_with_invalid_ids_error(self):
+        """
+        ids가 정수 배열이 아니면 InvalidBulkFilterException
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        for ids in ['123', [str(self.post.pk)], ['abc'], [self.post.pk, None], [True], {'id': self.post.pk}]:
+            res = self.client.post(POST_BULK_DELETE_URL, {'ids': ids}, format='json')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, ids)
+
+        self.post.refresh_from_db()
+        self.assertFalse(self.post.is_deleted)
+
+    def test_export_posts_success(self):
+        """
+        전체 게시글(삭제 포함)을 NDJSON/CSV로 스트리밍하는 케이스
+        """
+        staff = get_user_model().objects.create_user(
+            name="Staff",
+            email="staff@example.com",
+            password="Test1234!",
+            is_staff=True,
+        )
+        Post.objects.create(title='삭제된 글', content='content', user=self.user, is_deleted=True)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + str(RefreshToken.for_user(staff).access_token))
+
+        with self.settings(POST_EXPORT_CHUNK_SIZE=1):
+            res = self.client.get(POST_EXPORT_URL)
+            body = b''.join(res.streaming_content).decode()
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['title'] for row in rows], ['This is title', '삭제된 글'])
+        self.assertEqual(rows[1]['is_deleted'], True)
+
+        res = self.client.get(POST_EXPORT_URL, {'type': 'csv'})
+        rows = list(csv.DictReader(io.StringIO(b''.join(res.streaming_content).decode())))
+        self.assertEqual(res['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual([row['creator'] for row in rows], ['Test', 'Test'])
+
+    def test_export_posts_since_success(self):
+        """
+        since 이후에 수정된 게시글만 내보내는 케이스
+        """
+        staff = get_user_model().objects.create_user(
+            name="Staff",
+            email="staff@example.com",
+            password="Test1234!",
+            is_staff=True,
+        )
+        Post.objects.filter(pk=self.post.pk).update(updated_at=timezone.now() - timedelta(days=2))
+        Post.objects.create(title='new', content='content', user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + str(RefreshToken.for_user(staff).access_token))
+
+        res = self.client.get(POST_EXPORT_URL, {'since': (timezone.now() - timedelta(days=1)).isoformat()})
+
+        rows = [json.loads(line) for line in b''.join(res.streaming_content).decode().splitlines()]
+        self.assertEqual([row['title'] for row in rows], ['new'])
+
+    def test_export_posts_without_staff_error(self):
+        """
+        운영자가 아니면 403 에러
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        res = self.client.get(POST_EXPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AsyncPostApiTests(APITestCase):
+    """
+    게시글 async 조회 테스트
+    """
+
+    def setUp(self):
+        cache.clear()
+        view_count_cache.clear()
+        self.async_client = AsyncClient()
+        self.user = get_user_model().objects.create_user(
+            name="Test",
+            email="test@example.com",
+            password="Test1234!",
+        )
+        for i in range(3):
+            Post.objects.create(title=f'title {i}', content='content', user=self.user)
+        self.post = Post.objects.create(title='title', content='content', user=self.user)
+
+    async def test_async_views_match_sync_views_success(self):
+        """
+        동기 뷰와 같은 목록/상세 응답을 돌려주는 케이스
+        """
+        params = {'limit': 2, 'fields': 'title,creator'}
+        res = await self.async_client.get(reverse('posts:async_list'), params)
+        cache.clear()
+        expected = (await self.async_client.get(POST_URL, params)).json()
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json(), expected)
+
+        res = await self.async_client.get(reverse('posts:async_list'), {'cursor': expected['next'], 'limit': 2})
+        self.assertEqual(len(res.json()['results']), 2)
+        self.assertIsNone(res.json()['next'])
+
+        url = reverse('posts:async_detail', kwargs={'pk': self.post.pk})
+        first = (await self.async_client.get(url)).json()
+        second = (await self.async_client.get(url)).json()
+
+        self.assertEqual(first['content'], 'content')
+        self.assertEqual(second['view_count'], first['view_count'] + 1)
+
+    async def test_async_views_error(self):
+        """
+        삭제된 게시글이나 잘못된 파라미터는 동기 뷰와 같은 에러 응답
+        """
+        await Post.objects.filter(pk=self.post.pk).aupdate(is_deleted=True)
+
+        res = await self.async_client.get(reverse('posts:async_detail', kwargs={'pk': self.post.pk}))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(res.json(), {'detail': PostNotFoundException.default_detail})
+
+        res = await self.async_client.get(reverse('posts:async_list'), {'ordering': 'content'})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = await self.async_client.get(reverse('posts:async_list'), {'limit': 0})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_async_views_use_drf_content_negotiation_success(self):
+        """
+        async 뷰도 DRF 콘텐츠 협상/렌더러를 거쳐서, 지원하지 않는 Accept면 동기 뷰처럼 406을 돌려주는 케이스
+        """
+        self.assertTrue(AsyncPostListView.view_is_async)
+
+        res = await self.async_client.get(reverse('posts:async_list'), headers={'accept': 'application/xml'})
+        self.assertEqual(res.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+        res = await self.async_client.get(reverse('posts:async_list'), headers={'accept': 'application/json'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res['Content-Type'], 'application/json')
+
+    async def test_async_views_options_success(self):
+        """
+        async 뷰도 동기 뷰처럼 OPTIONS 요청에 200을 돌려주는 케이스
+        """
+        for url in [reverse('posts:async_list'), reverse('posts:async_detail', kwargs={'pk': self.post.pk})]:
+            res = await self.async_client.options(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertIn('GET', res['Allow'])
+
+        res = await self.async_client.post(reverse('posts:async_list'))
+        self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -0,0 +1,228 @@
+"""
+엔드포인트별 쿼리 수 예산 (성능 회귀 테스트)
+
+QUERY_BUDGETS보다 쿼리가 많아지면 실행된 SQL을 모두 보여주면서 실패한다.
+N+1(목록의 작성자 이름 등)이나 뷰의 중복 조회가 새로 생기면 여기서 걸린다.
+쿼리를 줄였다면 예산도 같이 줄인다.
+
+테스트 케이스:
+1. 게시글 목록 - 캐시가 비어 있을 때 (offset, 커서, 조회수 정렬, 검색, 필드 선택)
+2. 게시글 목록 - 페이지 크기가 10개에서 1,000개로 늘어도 쿼리 수가 같은 케이스
+3. 게시글 조회 - 캐시가 비어 있을 때 / 캐시된 상세
+4. 게시글 생성 / 일괄 생성 (일괄 생성은 게시글 수와 상관없이 일정, bulk_create가 pk를 돌려주지 않는 DB 포함)
+5. 게시글 수정 / 삭제 / 일괄 삭제
+6. 로그인 / 내 정보 수정
+"""
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import Post
+from users.authentication import CachedJWTAuthentication
+
+
+POST_URL = reverse('posts:list_and_create')
+POST_BATCH_URL = reverse('posts:batch_create')
+POST_BULK_DELETE_URL = reverse('posts:bulk_delete')
+SIGNIN_URL = reverse('users:signin')
+ME_URL = reverse('users:me')
+
+# 엔드포인트별 최대 쿼리 수 (인증 유저는 캐시된 상태, SAVEPOINT 등 트랜잭션 제어문 제외, on_commit 작업 포함)
+QUERY_BUDGETS = {
+    'list': 2,            # 게시글 페이지 + 게시글 카운터
+    'list_offset': 2,
+    'list_by_views': 2,
+    'list_search': 2,     # 검색 결과 페이지 + 전체 건수
+    'list_fields': 2,
+    'detail': 1,          # 게시글 + 작성자 (JOIN)
+    'detail_cached': 0,
+    'create': 4,          # INSERT + 카운터 + 색인(DELETE/INSERT)
+    'batch_create': 3,    # INSERT + 카운터 + 색인 (게시글 수와 상관없음)
+    'patch': 4,           # 게시글 + UPDATE + 색인(DELETE/INSERT)
+    'delete': 4,          # 게시글 + UPDATE + 카운터 + 색인 DELETE
+    'bulk_delete': 5,     # 청크 pk 조회 + UPDATE + 카운터 + 색인 DELETE + 마지막 청크 확인
+    'signin': 2,
+    'me_patch': 2,        # UPDATE + 작성자 게시글 pk 조회 (커밋 후 상세 캐시 무효화)
+}
+
+# bulk_create가 pk를 돌려주지 않는 DB(MySQL)에서 더 쓰는 쿼리 (LAST_INSERT_ID + 넣은 행 다시 읽기)
+NO_BULK_RETURNING_EXTRA = {
+    'batch_create': 2,
+}
+
+TRANSACTION_CONTROL = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+def detail_url(pk):
+    return reverse('posts:detail', kwargs={'pk': pk})
+
+
+class QueryBudgetTests(APITestCase):
+    """
+    캐시가 비어 있는 상태(DB 경로)의 엔드포인트별 쿼리 수를 QUERY_BUDGETS 안으로 유지하는지 확인하는 테스트.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            name="Test",
+            email="test@example.com",
+            password="Test1234!",
+        )
+        self.other = get_user_model().objects.create_user(
+            name="Other",
+            email="other@example.com",
+            password="Test1234!",
+            is_deleted=True,
+        )
+        Post.objects.bulk_create([
+            Post(title=f'검색 title {i}', content='content', user=self.user if i % 2 else self.other, view_count=i)
+            for i in range(30)
+        ])
+        self.post = Post.objects.filter(user=self.user).first()
+
+    def authenticate(self):
+        access_token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + str(access_token))
+        # 일반적인 경우처럼 인증 유저가 캐시된 상태에서 잰다.
+        CachedJWTAuthentication().get_user(access_token)
+
+    @contextmanager
+    def assertQueryBudget(self, name):
+        """
+        with 블록의 쿼리 수가 QUERY_BUDGETS[name] 이하인지 확인하는 컨텍스트 매니저. 넘으면 실행된 SQL을 보여준다.
+        커밋 후에 실행되는 작업(transaction.on_commit의 캐시 무효화 등)의 쿼리도 센다.
+        """
+        budget = QUERY_BUDGETS[name]
+        if not connection.features.can_return_rows_from_bulk_insert:
+            budget += NO_BULK_RETURNING_EXTRA.get(name, 0)
+        queries = []
+        with CaptureQueriesContext(connection) as captured:
+            with self.captureOnCommitCallbacks(execute=True):
+                yield queries
+        queries += [query['sql'] for query in captured.captured_queries
+                    if not query['sql'].startswith(TRANSACTION_CONTROL)]
+        if len(queries) > budget:
+            executed = '\n'.join(f'{i}. {sql}' for i, sql in enumerate(queries, start=1))
+            self.fail(f'{name}: 쿼리 {len(queries)}개로 예산 {budget}개를 넘었습니다.\n{executed}')
+
+    def test_list_budget(self):
+        """
+        게시글 목록 - 캐시가 비어 있을 때 (offset, 커서, 조회수 정렬, 검색, 필드 선택)
+        """
+        requests = [
+            ('list', {}),
+            ('list_offset', {'offset': 10}),
+            ('list_by_views', {'ordering': '-view_count'}),
+            ('list_search', {'q': '검색'}),
+            ('list_fields', {'fields': 'title'}),
+        ]
+        for name, params in requests:
+            with self.subTest(name):
+                cache.clear()
+                with self.assertQueryBudget(name):
+                    response = self.client.get(POST_URL, params)
+                self.assertEqual(response.status_code, 200)
+
+        first_page = self.client.get(POST_URL).json()
+        cache.clear()
+        with self.assertQueryBudget('list'):
+            response = self.client.get(POST_URL, {'cursor': first_page['next']})
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_cost_is_flat(self):
+        """
+        게시글 목록 - 페이지 크기가 10개에서 1,000개로 늘어도 쿼리 수가 같은 케이스
+        """
+        Post.objects.bulk_create([
+            Post(title=f'title {i}', content='content', user=self.user if i % 2 else self.other)
+            for i in range(1000)
+        ])
+
+        counts = {}
+        for limit in (10, 1000):
+            cache.clear()
+            with self.assertQueryBudget('list') as queries:
+                response = self.client.get(POST_URL, {'limit': limit})
+            self.assertEqual(len(response.json()['results']), limit)
+            counts[limit] = len(queries)
+
+        self.assertEqual(counts[10], counts[1000])
+
+    def test_detail_budget(self):
+        """
+        게시글 조회 - 캐시가 비어 있을 때 / 캐시된 상세
+        """
+        with self.assertQueryBudget('detail'):
+            response = self.client.get(detail_url(self.post.pk))
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget('detail_cached'):
+            response = self.client.get(detail_url(self.post.pk))
+        self.assertEqual(response.status_code, 200)
+
+    def test_create_budget(self):
+        """
+        게시글 생성 / 일괄 생성 (일괄 생성은 게시글 수와 상관없이 일정)
+        """
+        self.authenticate()
+
+        with self.assertQueryBudget('create'):
+            response = self.client.post(POST_URL, {'title': 'title', 'content': 'content'}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        self.assertBatchCreateBudget()
+
+        # MySQL처럼 bulk_create가 pk를 돌려주지 않는 DB
+        with patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            self.assertBatchCreateBudget()
+
+    def assertBatchCreateBudget(self):
+        counts = []
+        for size in (1, 50):
+            posts = [{'title': f'title {i}', 'content': 'content'} for i in range(size)]
+            with self.assertQueryBudget('batch_create') as queries:
+                response = self.client.post(POST_BATCH_URL, posts, format='json')
+            self.assertEqual(response.status_code, 201)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_write_budget(self):
+        """
+        게시글 수정 / 삭제 / 일괄 삭제
+        """
+        self.authenticate()
+
+        with self.assertQueryBudget('patch'):
+            response = self.client.patch(detail_url(self.post.pk), {'title': 'new title'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget('delete'):
+            response = self.client.delete(detail_url(self.post.pk))
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget('bulk_delete'):
+            response = self.client.post(POST_BULK_DELETE_URL, {'author': 'test@example.com'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_user_budget(self):
+        """
+        로그인 / 내 정보 수정
+        """
+        with self.assertQueryBudget('signin'):
+            response = self.client.post(SIGNIN_URL, {'email': 'test@example.com', 'password': 'Test1234!'},
+                                        format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.authenticate()
+        with self.assertQueryBudget('me_patch'):
+            response = self.client.patch(ME_URL, {'name': 'New name'}, format='json')
+        self.assertEqual(response.status_code, 200)
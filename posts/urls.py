@@ -1,11 +1,18 @@
 from django.urls import path
 
-from posts import views
+from posts import views, async_views
 
 
 app_name = 'posts'
 
 urlpatterns = [
     path('', views.PostListCreateView.as_view(), name='list_and_create'),
+    path('/batch', views.PostBatchCreateView.as_view(), name='batch_create'),
+    path('/export', views.PostExportView.as_view(), name='export'),
+    path('/bulk-delete', views.PostBulkSoftDeleteView.as_view(is_deleted=True), name='bulk_delete'),
+    path('/bulk-restore', views.PostBulkSoftDeleteView.as_view(is_deleted=False), name='bulk_restore'),
     path('/<int:pk>', views.PostRetrieveUpdateDestroyView.as_view(), name='detail'),
+    # ASGI로 띄웠을 때 DB를 기다리는 동안 워커를 막지 않는 조회 전용 async 뷰
+    path('/async', async_views.AsyncPostListView.as_view(), name='async_list'),
+    path('/async/<int:pk>', async_views.AsyncPostDetailView.as_view(), name='async_detail'),
 ]
\ No newline at end of file
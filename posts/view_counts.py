@@ -0,0 +1,194 @@
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections, transaction
+from django.db.models import F
+from django.utils.connection import ConnectionProxy
+
+from core.models import Post
+from posts.cache import bump_list_generation
+
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시와 따로 둔, 항목을 밀어내지 않는 조회수 버퍼. (settings.CACHES['view_counts'])
+view_count_cache = ConnectionProxy(caches, 'view_counts')
+
+PENDING_KEY = 'posts:views:pending:{}'
+DIRTY_KEY = 'posts:views:dirty:{}'
+DIRTY_SEQ_KEY = 'posts:views:dirty_seq'
+FLUSHED_SEQ_KEY = 'posts:views:flushed_seq'
+FLUSH_LOCK_KEY = 'posts:views:flush_lock'
+
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def _incr(key, delta=1):
+    try:
+        return view_count_cache.incr(key, delta)
+    except ValueError:
+        view_count_cache.add(key, 0, timeout=None)
+        return view_count_cache.incr(key, delta)
+
+
+def _mark_dirty(pk):
+    """
+    flush 대상 게시글 id를 순번이 붙은 키로 등록하는 함수. (키 스캔 없이 flush 대상을 찾기 위함)
+    """
+    seq = _incr(DIRTY_SEQ_KEY)
+    if seq == 1:
+        # 버퍼가 비워져서(재시작 등) 순번이 처음부터 다시 시작하면 flush 위치도 처음으로 되돌린다.
+        view_count_cache.delete(FLUSHED_SEQ_KEY)
+    view_count_cache.set(DIRTY_KEY.format(seq), pk, timeout=None)
+
+
+def record_view(pk):
+    """
+    조회수 1 증가를 DB 대신 조회수 버퍼에 쌓아두는 함수. 행 잠금이 없고, 동시 요청에서도 증가분을 잃지 않는다.
+    """
+    key = PENDING_KEY.format(pk)
+    if _incr(key) == 1:
+        # flush가 0이 된 키에 걸어둔 만료를 푼다.
+        view_count_cache.touch(key, None)
+        _mark_dirty(pk)
+
+
+def get_pending_views(*pks):
+    """
+    아직 DB에 반영되지 않은 조회수 증가분을 {pk: delta}로 가져오는 함수.
+    """
+    keys = {PENDING_KEY.format(pk): pk for pk in pks}
+    pending = view_count_cache.get_many(keys)
+    return {keys[key]: delta for key, delta in pending.items() if delta}
+
+
+def merge_pending_views(posts):
+    """
+    목록 응답의 각 게시글 조회수에 아직 반영되지 않은 증가분을 더하는 함수.
+    ?fields=로 조회수를 빼고 요청한 응답이면 그대로 돌려준다.
+    """
+    if not posts or 'view_count' not in posts[0]:
+        return posts
+    pending = get_pending_views(*[post['id'] for post in posts])
+    if not pending:
+        return posts
+    return [
+        {**post, 'view_count': post['view_count'] + pending[post['id']]} if post['id'] in pending else post
+        for post in posts
+    ]
+
+
+def flush_view_counts():
+    """
+    쌓인 조회수 증가분을 UPDATE ... SET view_count = view_count + n 으로 모아서 DB에 반영하는 함수.
+    증가분이 같은 게시글끼리 묶어서 한 번에 UPDATE 한다.
+
+    0이 된 증가분 키는 바로 지우지 않고 VIEW_COUNT_SETTLED_TIMEOUT 뒤에 만료시킨다.
+    (지우는 사이에 들어온 조회수를 같이 지우지 않도록. 그 사이 다시 쌓이면 record_view가 만료를 푼다)
+    캐시된 목록 페이지는 반영 전 DB 조회수에 증가분을 더해서 보여주므로, 반영한 뒤에는 목록 캐시를 무효화한다.
+    (그대로 두면 줄어든 증가분이 예전 DB 값에 더해져서 조회수가 뒤로 간다)
+
+    :return: 반영한 조회수 합계
+    """
+    if not view_count_cache.add(FLUSH_LOCK_KEY, 1, timeout=60):
+        return 0
+
+    try:
+        start = (view_count_cache.get(FLUSHED_SEQ_KEY) or 0) + 1
+        end = view_count_cache.get(DIRTY_SEQ_KEY) or 0
+        if end < start - 1:
+            # 순번이 다시 시작된 뒤에 예전 flush 위치가 저장된 경우
+            start = 1
+        if end < start:
+            return 0
+
+        dirty_keys = [DIRTY_KEY.format(seq) for seq in range(start, end + 1)]
+        pks = set(view_count_cache.get_many(dirty_keys).values())
+        pending = get_pending_views(*pks)
+
+        by_delta = defaultdict(list)
+        for pk, delta in pending.items():
+            by_delta[delta].append(pk)
+
+        with transaction.atomic():
+            for delta, ids in by_delta.items():
+                Post.objects.filter(pk__in=ids).update(view_count=F('view_count') + delta)
+
+        for pk, delta in pending.items():
+            key = PENDING_KEY.format(pk)
+            if view_count_cache.decr(key, delta) > 0:
+                # flush 도중 들어온 조회수는 남겨두고, 다음 flush 대상으로 다시 등록한다.
+                view_count_cache.touch(key, None)
+                _mark_dirty(pk)
+            else:
+                view_count_cache.touch(key, settings.VIEW_COUNT_SETTLED_TIMEOUT)
+
+        view_count_cache.set(FLUSHED_SEQ_KEY, end, timeout=None)
+        view_count_cache.delete_many(dirty_keys)
+        if pending:
+            bump_list_generation()
+        return sum(pending.values())
+    finally:
+        view_count_cache.delete(FLUSH_LOCK_KEY)
+
+
+def _flush_safely():
+    try:
+        flush_view_counts()
+    except DatabaseError:
+        logger.exception('조회수 flush에 실패했습니다.')
+    finally:
+        connections.close_all()
+
+
+class ViewCountFlusher(threading.Thread):
+    """
+    일정 주기로 조회수 증가분을 DB에 반영하는 백그라운드 스레드.
+    """
+    def __init__(self, interval):
+        super().__init__(name='view-count-flusher', daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            _flush_safely()
+
+    def stop(self):
+        self.stopped.set()
+
+
+def start_flusher():
+    """
+    서버 프로세스에서 주기적 flush 스레드를 시작하고, 종료시 남은 조회수를 반영하도록 등록하는 함수.
+    """
+    global _flusher
+
+    interval = settings.VIEW_COUNT_FLUSH_INTERVAL
+    if not interval:
+        return
+
+    with _flusher_lock:
+        if _flusher is not None:
+            return
+        _flusher = ViewCountFlusher(interval)
+        _flusher.start()
+        atexit.register(stop_flusher)
+
+
+def stop_flusher():
+    """
+    flush 스레드를 멈추고 남은 조회수를 반영하는 종료 훅.
+    """
+    global _flusher
+
+    with _flusher_lock:
+        if _flusher is not None:
+            _flusher.stop()
+            _flusher = None
+    _flush_safely()
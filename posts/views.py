@@ -1,15 +1,37 @@
-from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.db import router, transaction
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
 
 from rest_framework import generics, status, mixins
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 
 
 from core.models import Post
-from users.exceptions import EmptyInputException, UserNotFoundException, IsNotMeException
+from core.parsers import object_data
+from users.authentication import CachedJWTAuthentication
+from users.exceptions import EmptyInputException, IsNotMeException
 from posts.serializers import PostListSerializer, PostSerializer
-from posts.exceptions import PostNotFoundException
+from posts.exceptions import PostNotFoundException, InvalidBulkFilterException, InvalidExportParameterException
+from posts.exports import EXPORT_FORMATS, export_lines
+from posts.services import bulk_set_deleted, soft_delete_post
+from posts.cache import bump_list_generation, evict_detail
+from posts.conditional import has_conditional_headers
+from posts.reads import (
+    ListRequest,
+    search_response,
+    cached_list_response,
+    page_response,
+    parse_detail_fields,
+    detail_queryset,
+    cached_detail_response,
+    detail_validators_queryset,
+    not_modified_detail_response,
+    detail_response,
+)
+from posts.counters import get_live_post_count, estimate_post_count
+from posts.pagination import paginate_by_cursor, paginate_by_offset
 
 
 class PostListCreateView(generics.GenericAPIView):
@@ -20,34 +42,32 @@ class PostListCreateView(generics.GenericAPIView):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
-
-    def get_queryset(self):
-        return Post.objects.filter(is_deleted=False) \
-                            .select_related('user') \
-                            .only('title', 'user__name', 'view_count') \
-                            .order_by("-created_at")
+    authentication_classes = [CachedJWTAuthentication]
 
     def get(self, request, *args, **kwargs):
         """
-        토큰 없이 게시글 목록 가져오는 API
-
-        :param limit: int
-        :param offset: int
-        :param ordering: str
+        토큰 없이 게시글 목록 가져오는 API (파라미터는 posts.reads.ListRequest)
 
+        cursor가 있으면 키셋 페이지네이션으로 조회한다. (페이지 깊이와 상관없이 일정한 비용)
+        offset 방식은 하위 호환을 위해 유지하고, 응답의 next/previous 커서로 언제든 커서 방식으로 넘어갈 수 있다.
+        응답은 세대 번호가 붙은 키로 캐시되고, 게시글 생성/수정/삭제시 세대 번호를 올려서 무효화한다.
+        조회수는 DB 값에 아직 반영되지 않은 증가분을 더해서 보여준다. (정렬은 DB 값 기준)
+        ETag/Last-Modified는 페이지에 담긴 게시글 id와 가장 최근 updated_at으로 만들고, 조회수는 포함하지 않는다.
         """
-        limit = int(request.query_params.get("limit", 10))
-        offset = int(request.query_params.get("offset", 0))
+        params = ListRequest(request.query_params)
+        if params.query:
+            return search_response(params)
 
-        queryset = self.get_queryset()[offset : offset + limit]
-        serializer = self.get_serializer()
-        serializer = serializer(queryset, many=True)
-        data = {
-            'count': queryset.count(),
-            'results': serializer.data
-        }
-        return Response(data)
+        response = cached_list_response(request, params)
+        if response is not None:
+            return response
+
+        if params.uses_cursor:
+            page = paginate_by_cursor(params.get_queryset(), params.cursor, params.limit, params.ordering)
+        else:
+            page = paginate_by_offset(params.get_queryset(), params.offset, params.limit, params.ordering)
+        count = estimate_post_count() if params.estimated_count else get_live_post_count()
+        return page_response(request, params, page, count)
 
     def post(self, request, *args, **kwargs):
         """
@@ -57,15 +77,18 @@ class PostListCreateView(generics.GenericAPIView):
         :param content: str
 
         """
-        title = request.data.get('title')
-        content = request.data.get('content')
+        data = object_data(request)
+        title = data.get('title')
+        content = data.get('content')
         if not title or not content:
             raise EmptyInputException
 
         serializer = self.get_serializer()
-        serializer = serializer(data=request.data)
+        serializer = serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(user=request.user)
+        with transaction.atomic():
+            serializer.save(user=request.user)
+            transaction.on_commit(bump_list_generation)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def get_permissions(self):
@@ -84,6 +107,162 @@ class PostListCreateView(generics.GenericAPIView):
         return PostListSerializer
 
 
+class PostBatchCreateView(generics.GenericAPIView):
+    """
+    게시글 일괄 생성 컨트롤러.
+    """
+
+    serializer_class = PostSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def post(self, request, *args, **kwargs):
+        """
+        토큰과 게시글 배열로 게시글을 한 번에 생성하는 API
+
+        :param [{title: str, content: str}, ...]
+
+        유효한 게시글만 한 트랜잭션에서 bulk_create로 생성하고, 항목별 결과를 요청 순서대로 돌려준다.
+        모두 생성되면 201, 일부만 생성되면 207, 모두 실패하면 400.
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, max_length=settings.POST_BATCH_CREATE_MAX_SIZE
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            posts = serializer.save(user=request.user)
+            transaction.on_commit(bump_list_generation)
+
+        created = dict(zip(serializer.valid_indexes, self.get_serializer(posts, many=True).data))
+        results = []
+        for index in range(len(request.data)):
+            if index in created:
+                results.append({'index': index, 'status': status.HTTP_201_CREATED, 'data': created[index]})
+            else:
+                results.append({
+                    'index': index,
+                    'status': status.HTTP_400_BAD_REQUEST,
+                    'errors': serializer.item_errors[index],
+                })
+
+        data = {
+            'created': len(created),
+            'failed': len(serializer.item_errors),
+            'results': results,
+        }
+        if serializer.item_errors:
+            return Response(data, status=status.HTTP_207_MULTI_STATUS)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class PostBulkSoftDeleteView(generics.GenericAPIView):
+    """
+    게시글 일괄 삭제/복구 컨트롤러.
+    """
+
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication]
+    is_deleted = True
+
+    def post(self, request, *args, **kwargs):
+        """
+        토큰과 조건으로 게시글을 한 번에 삭제(bulk-delete)하거나 복구(bulk-restore)하는 API
+
+        :param ids: list[int]
+        :param author: str (작성자 이메일)
+        :param created_after: str (ISO 8601)
+        :param created_before: str (ISO 8601)
+
+        조건은 AND로 묶인다. 운영자(is_staff)가 아니면 본인 게시글만 대상이 되도록 SQL 조건에 포함한다.
+        """
+        queryset = self.get_queryset()
+        if not request.user.is_staff:
+            queryset = queryset.filter(user=request.user)
+
+        queryset = self.filter_queryset_by_request(queryset, request.data)
+        affected = bulk_set_deleted(queryset, self.is_deleted, chunk_size=settings.POST_BULK_UPDATE_CHUNK_SIZE)
+
+        return Response({'affected': affected}, status=status.HTTP_200_OK)
+
+    def get_queryset(self):
+        return Post.objects.all()
+
+    def filter_queryset_by_request(self, queryset, data):
+        if not isinstance(data, dict):
+            raise InvalidBulkFilterException
+
+        ids = data.get('ids')
+        author = data.get('author')
+        created_after = data.get('created_after')
+        created_before = data.get('created_before')
+
+        if not any([ids, author, created_after, created_before]):
+            raise InvalidBulkFilterException
+
+        try:
+            if ids:
+                queryset = queryset.filter(pk__in=self.parse_ids(ids))
+            if author:
+                queryset = queryset.filter(user__email=author)
+            if created_after:
+                queryset = queryset.filter(created_at__gte=self.parse_datetime(created_after))
+            if created_before:
+                queryset = queryset.filter(created_at__lt=self.parse_datetime(created_before))
+        except (TypeError, ValueError):
+            raise InvalidBulkFilterException
+        return queryset
+
+    def parse_ids(self, value):
+        """
+        ids는 정수 배열만 받는다. ('123' 같은 문자열이나 true/false는 허용하지 않는다)
+        """
+        if not isinstance(value, list) or not all(type(pk) is int for pk in value):
+            raise InvalidBulkFilterException
+        return value
+
+    def parse_datetime(self, value):
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise InvalidBulkFilterException
+        return parsed
+
+
+class PostExportView(generics.GenericAPIView):
+    """
+    게시글 전체 내보내기 컨트롤러.
+    """
+
+    permission_classes = [IsAdminUser]
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get(self, request, *args, **kwargs):
+        """
+        운영자 토큰으로 전체 게시글(삭제된 게시글 포함)을 스트리밍으로 내려받는 API
+
+        :param type: str (ndjson, csv)
+        :param since: str (ISO 8601. 있으면 그 이후에 생성/수정/삭제된 게시글만)
+
+        pk 키셋으로 끊어 읽으면서 바로 응답으로 흘려보내기 때문에 테이블 크기와 상관없이 메모리 사용량이 일정하다.
+        """
+        export_format = request.query_params.get('type', 'ndjson')
+        since = request.query_params.get('since')
+        if export_format not in EXPORT_FORMATS:
+            raise InvalidExportParameterException
+        if since:
+            since = parse_datetime(since)
+            if since is None:
+                raise InvalidExportParameterException
+
+        response = StreamingHttpResponse(
+            export_lines(
+                export_format, since=since, chunk_size=settings.POST_EXPORT_CHUNK_SIZE, using=router.db_for_read(Post)
+            ),
+            content_type=f'{EXPORT_FORMATS[export_format]}; charset=utf-8',
+        )
+        response['Content-Disposition'] = f'attachment; filename="posts.{export_format}"'
+        return response
+
+
 class PostRetrieveUpdateDestroyView(generics.GenericAPIView):
     """
     게시글 조회/수정/삭제 컨트롤러.
@@ -92,26 +271,42 @@ class PostRetrieveUpdateDestroyView(generics.GenericAPIView):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    fields = None
+
+    def get_queryset(self):
+        return detail_queryset(self.fields)
 
     def get(self, request, *args, **kwargs):
         """
         토큰 없이 게시글 디테일 가져오는 API
+
+        직렬화된 응답은 게시글 id별로 캐시되고, 캐시에 있으면 DB에 접근하지 않는다.
+        조회수 증가는 조회수 버퍼에 쌓아두었다가 주기적으로 모아서 DB에 반영한다. (posts.view_counts)
+
+        ETag/Last-Modified는 게시글과 작성자의 updated_at으로 만든다. 조회수는 검증자에 포함하지 않으므로,
+        304 응답을 받은 클라이언트는 이전 조회수를 보게 된다. 304 응답도 조회 1회로 센다.
+
+        :param fields: str (응답에 포함할 필드. id는 항상 포함)
+        fields가 있으면 캐시된 전체 응답에서 잘라서 주고, 캐시에 없으면 필요한 컬럼만 읽고 캐시에는 넣지 않는다.
         """
+        pk = kwargs['pk']
+        self.fields = parse_detail_fields(request)
+        response = cached_detail_response(request, pk, self.fields)
+        if response is not None:
+            return response
+
+        if has_conditional_headers(request):
+            response = not_modified_detail_response(request, pk, detail_validators_queryset(pk).first())
+            if response is not None:
+                return response
+
         try:
             post = self.get_object()
         except Post.DoesNotExist:
             raise PostNotFoundException
 
-        if post.is_deleted:
-            raise PostNotFoundException
-
-        post.view_count += 1
-        post.save(update_fields=['view_count'])
-
-        serializer = self.get_serializer(post)
-
-        return Response(serializer.data)
+        return detail_response(post, self.fields)
 
     def patch(self, request, *args, **kwargs):
         """
@@ -121,27 +316,26 @@ class PostRetrieveUpdateDestroyView(generics.GenericAPIView):
         :param content: str
 
         """
-        title = request.data.get('title')
-        content = request.data.get('content')
+        data = object_data(request)
+        title = data.get('title')
+        content = data.get('content')
 
         try:
             post = self.get_object()
         except Post.DoesNotExist:
             raise PostNotFoundException
 
-        try:
-            user = get_user_model().objects.get(email=request.user.email)
-        except get_user_model().DoesNotExist:
-            raise UserNotFoundException
-
-        if post.user.pk != request.user.pk:
+        if post.user_id != request.user.pk:
             raise IsNotMeException
 
         if title:
             post.title = title
         if content:
             post.content = content
-        post.save(update_fields=['title', 'content'])
+        with transaction.atomic():
+            post.save(update_fields=['title', 'content', 'updated_at'])
+            transaction.on_commit(bump_list_generation)
+            transaction.on_commit(lambda: evict_detail(post.pk))
 
         serializer = self.get_serializer(post)
 
@@ -156,16 +350,10 @@ class PostRetrieveUpdateDestroyView(generics.GenericAPIView):
         except Post.DoesNotExist:
             raise PostNotFoundException
 
-        try:
-            user = get_user_model().objects.get(email=request.user.email)
-        except get_user_model().DoesNotExist:
-            raise UserNotFoundException
-
-        if post.user.pk != request.user.pk:
+        if post.user_id != request.user.pk:
             raise IsNotMeException
 
-        post.is_deleted = True
-        post.save(update_fields=['is_deleted'])
+        soft_delete_post(post)
 
         serializer = self.get_serializer(post)
 
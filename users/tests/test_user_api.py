@@ -11,6 +11,7 @@
     - 이메일, 비밀번호 받아 인증되면 jwt 토큰과 유저정보 반환
     - 이메일이 존재하지 않으면 에러 케이스 UserNotFound
     - 인증에 실패할 경우 에러 케이스 PasswordNotMatched
+    - 요청 본문이 객체가 아니면 400 에러 (로그인/비밀번호 인증/정보 수정)
 
 3. jwt 토큰 발급 - 인증되지 않은 상태에서 요청할 수 있음
     - 이메일, 비밀번호 받아 인증되면 jwt 토큰 발급
@@ -30,11 +31,17 @@
     - DELETE /api/v1/users/me
     - jwt토큰으로 탈퇴 성공 케이스
     - jwt토큰의 유저와 수정하려는 유저가 다를 경우 에러 케이스 IsNotMe
+
+7. jwt 인증 유저 캐시
+    - 두 번째 인증부터는 유저를 조회하지 않는 케이스
+    - 이름/비밀번호 수정, 탈퇴시 캐시된 유저가 지워지는 케이스
 """
 
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory
 from django.urls import reverse
 
 from rest_framework import status
@@ -44,6 +51,8 @@ from rest_framework.test import (
 )
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from users.authentication import CachedJWTAuthentication, user_cache_key
+
 
 SIGNUP_URL = reverse('users:signup')
 SIGNIN_URL = reverse('users:signin')
@@ -166,11 +175,21 @@ class PublicUserApiTests(APITestCase):
         self.assertIn('인증에 실패하였습니다.', res.data['detail'])
 
 
+    def test_non_object_body_error(self):
+        """
+        요청 본문이 객체가 아니면 400 에러.
+        """
+        for body in [['test@example.com', 'Test1234!'], 1]:
+            res = self.client.post(SIGNIN_URL, body, format='json')
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class PrivateUserApiTests(APITestCase):
     """
     인증이 필요한 APIs 테스트.
     """
     def setUp(self):
+        cache.clear()
         self.user = get_user_model().objects.create_user(
             name='Test',
             email='test@example.com',
@@ -235,6 +254,15 @@ class PrivateUserApiTests(APITestCase):
         self.assertNotIn('password', res.data)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+    def test_non_object_body_error(self):
+        """
+        요청 본문이 객체가 아니면 400 에러.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+        self.assertEqual(self.client.post(ME_URL, ['Test1234!'], format='json').status_code, 400)
+        self.assertEqual(self.client.patch(ME_URL, ['New name'], format='json').status_code, 400)
+
     def test_user_info_not_updated_with_invalid_jwt_error(self):
         """
         토큰이 만료된 경우 401 에러
@@ -250,4 +278,70 @@ class PrivateUserApiTests(APITestCase):
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_user_withdraw_success(self):
+        """
+        jwt토큰으로 탈퇴 성공 케이스
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        res = self.client.delete(ME_URL)
+
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.is_deleted)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+
+class CachedJWTAuthenticationTests(APITestCase):
+    """
+    jwt 인증 유저 캐시 테스트.
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            name='Test',
+            email='test@example.com',
+            password='Test1234!',
+        )
+        self.client = APIClient()
+        self.access_token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+        self.request = RequestFactory().get('/', HTTP_AUTHORIZATION='Bearer ' + self.access_token)
+
+    def test_cached_user_success(self):
+        """
+        두 번째 인증부터는 유저를 조회하지 않는 케이스.
+        """
+        with self.assertNumQueries(1):
+            CachedJWTAuthentication().authenticate(self.request)
+
+        with self.assertNumQueries(0):
+            user, _ = CachedJWTAuthentication().authenticate(self.request)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_invalidate_on_update_success(self):
+        """
+        이름/비밀번호 수정시 캐시된 유저가 지워지는 케이스.
+        """
+        CachedJWTAuthentication().authenticate(self.request)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.patch(ME_URL, {'name': 'New name'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        user, _ = CachedJWTAuthentication().authenticate(self.request)
+        self.assertEqual(user.name, 'New name')
+        self.assertTrue(user.check_password('Test1234!'))
+
+    def test_invalidate_on_withdraw_success(self):
+        """
+        탈퇴시 캐시된 유저가 지워지는 케이스.
+        """
+        CachedJWTAuthentication().authenticate(self.request)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.delete(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        user, _ = CachedJWTAuthentication().authenticate(self.request)
+        self.assertTrue(user.is_deleted)
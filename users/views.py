@@ -1,10 +1,12 @@
 from django.contrib.auth import get_user_model, authenticate
+from django.db import transaction
 
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from core.parsers import object_data
+from users.authentication import CachedJWTAuthentication, invalidate_cached_user
 from users.serializers import (
     UserSerializer,
     UserTokenObtainPairSerializer,
@@ -15,9 +17,9 @@ from users.exceptions import (
     TemporaryRedirectException,
     UserNotFoundException,
     PasswordNotMatchedException,
-    IsNotMeException
 )
 from users.validators import validate_password
+from posts.cache import evict_posts_of_user
 
 
 class UserSignUpView(generics.CreateAPIView):
@@ -53,8 +55,9 @@ class UserSignInView(generics.GenericAPIView):
         :param password: str
 
         """
-        email = request.data.get('email')
-        password = request.data.get('password')
+        data = object_data(request)
+        email = data.get('email')
+        password = data.get('password')
 
         if not email or not password:
             raise EmptyInputException
@@ -67,7 +70,7 @@ class UserSignInView(generics.GenericAPIView):
         if user.is_deleted:
             raise TemporaryRedirectException
 
-        token_serializer = self.get_serializer(data=request.data)
+        token_serializer = self.get_serializer(data=data)
         token_serializer.is_valid(raise_exception=True)
 
         user_serializer = UserSignInSerializer(user, context={'tokens': token_serializer.validated_data})
@@ -80,7 +83,7 @@ class UserUpdateView(generics.GenericAPIView):
     """
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def post(self, request, *args, **kwargs):
         """
@@ -89,7 +92,7 @@ class UserUpdateView(generics.GenericAPIView):
         :param password: str
 
         """
-        password = request.data.get('password')
+        password = object_data(request).get('password')
         if not password:
             raise EmptyInputException
 
@@ -107,26 +110,43 @@ class UserUpdateView(generics.GenericAPIView):
         :param password: str
 
         """
-        name = request.data.get('name')
-        password = request.data.get('password')
+        data = object_data(request)
+        name = data.get('name')
+        password = data.get('password')
 
-        try:
-            user = get_user_model().objects.get(email=request.user.email)
-        except get_user_model().DoesNotExist:
-            raise UserNotFoundException
-
-        if user.id != request.user.id:
-            raise IsNotMeException
+        # 인증에서 이미 토큰의 유저를 가져왔으므로 다시 조회하지 않는다.
+        user = request.user
+        update_fields = ['updated_at']
 
+        name_changed = bool(name) and name != user.name
         if name:
             user.name = name
+            update_fields.append('name')
         if password:
             valid_pw = validate_password(password)
             user.set_password(valid_pw)
+            update_fields.append('password')
 
-        user.save(update_fields=['name', 'password'])
+        with transaction.atomic():
+            user.save(update_fields=update_fields)
+            transaction.on_commit(lambda: invalidate_cached_user(user.pk))
+            if name_changed:
+                transaction.on_commit(lambda: evict_posts_of_user(user))
 
         return Response(self.get_serializer(user).data)
 
     def delete(self, request, *args, **kwargs):
-        pass
\ No newline at end of file
+        """
+        jwt 토큰으로 회원 탈퇴하는 API
+
+        작성한 게시글은 남기고, 작성자 이름이 '탈퇴한 유저'로 보이도록 캐시를 지운다.
+        """
+        user = request.user
+        user.is_deleted = True
+
+        with transaction.atomic():
+            user.save(update_fields=['is_deleted', 'updated_at'])
+            transaction.on_commit(lambda: invalidate_cached_user(user.pk))
+            transaction.on_commit(lambda: evict_posts_of_user(user))
+
+        return Response({"detail": "회원 탈퇴 성공."})
\ No newline at end of file